@@ -0,0 +1,44 @@
+"""
+Measures the CPU Cost of the Input Front-End (Trajectories, Timelines, Chains) against the in-memory RecordingBase, without a Display or Browser.
+Usage: python benchmarks/frontend_overhead.py [--moves 1000] [--chains 100] [--seed 0]
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict
+
+import numpy as np
+
+from cdp_patches.input import SyncInput
+from cdp_patches.input.os_base.recording import RecordingBase
+
+
+def benchmark_operation(operation: Callable[[int], Any], count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        operation(i)
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--moves", type=int, default=1000, help="Amount of humanized Moves.")
+    parser.add_argument("--chains", type=int, default=100, help="Amount of Action Chains (Move, Click & Type) to compile & dispatch.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for Trajectories, Timings & Points.")
+    args = parser.parse_args()
+
+    base = RecordingBase(realtime=False)
+    sync_input = SyncInput(base=base, seed=args.seed)
+    sync_input.sleep_timeout = 0
+    points = np.random.default_rng(args.seed).integers((0, 0), (1280, 720), size=(max(args.moves, args.chains), 2)).tolist()
+    results: Dict[str, float] = {}
+
+    results["move"] = benchmark_operation(lambda i: sync_input.move(*points[i]), args.moves)
+    results["chain"] = benchmark_operation(lambda i: sync_input.chain().move(*points[i]).click("left", *points[i]).type("hello").perform(), args.chains)
+
+    print(json.dumps({"moves": args.moves, "chains": args.chains, "events_recorded": base.count, "operations_per_second": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
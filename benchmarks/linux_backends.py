@@ -0,0 +1,51 @@
+"""
+Compares the XTest Event Throughput (events/sec) of the python-xlib and XCB Linux Backends.
+Usage: DISPLAY=:100 python benchmarks/linux_backends.py [--events 10000] [--sync-every 1]
+"""
+
+import argparse
+import json
+import os
+import time
+from typing import Dict, Union
+
+from Xlib import X, display
+
+from cdp_patches.input.os_base.linux import XlibConnection
+from cdp_patches.input.os_base.xcb import XCBConnection
+
+
+def benchmark_connection(connection: Union[XlibConnection, XCBConnection], events: int, sync_every: int) -> float:
+    start = time.perf_counter()
+    for i in range(events):
+        connection.fake_input(X.MotionNotify, x=100 + i % 500, y=100 + i % 300)
+        if not (i + 1) % sync_every:
+            connection.sync()
+    connection.sync()
+
+    return events / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=10000, help="Amount of MotionNotify Events to send per Backend.")
+    parser.add_argument("--sync-every", type=int, default=1, help="Round-Trip to the X Server after every n Events (1 = like LinuxBase.move).")
+    args = parser.parse_args()
+
+    display_name = os.getenv("DISPLAY")
+    xlib_display = display.Display(display_name)
+    results: Dict[str, float] = {}
+
+    results["xlib"] = benchmark_connection(XlibConnection(xlib_display), args.events, args.sync_every)
+    xcb_connection = XCBConnection(display_name)
+    try:
+        results["xcb"] = benchmark_connection(xcb_connection, args.events, args.sync_every)
+    finally:
+        xcb_connection.close()
+        xlib_display.close()
+
+    print(json.dumps({"events": args.events, "sync_every": args.sync_every, "events_per_second": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
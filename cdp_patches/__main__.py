@@ -0,0 +1,185 @@
+"""
+Diagnostics & Throughput Benchmarks for the Input of a running Browser.
+Usage: python -m cdp_patches diagnose --pid 1234
+       python -m cdp_patches benchmark --url localhost:9222 [--moves 100] [--clicks 20] [--json]
+"""
+
+import argparse
+import json
+import platform
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from cdp_patches import VERSION, is_windows
+
+
+class StepTimer:
+    """Times every Step of a Diagnosis, in Milliseconds"""
+
+    def __init__(self) -> None:
+        self.steps: Dict[str, float] = {}
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps[name] = (time.perf_counter() - start) * 1000
+
+
+def resolve_pid(pid: Optional[int], url: Optional[str]) -> int:
+    if pid:
+        return pid
+
+    from cdp_patches.input.browsers import CDPProcessInfo, process_info_from_url
+
+    assert url
+    return CDPProcessInfo(process_info_from_url(url)).get_main_browser()["id"]
+
+
+def create_input(args: argparse.Namespace, timer: StepTimer) -> Any:
+    from cdp_patches.input import SyncInput
+
+    with timer.step("resolve_pid"):
+        pid = resolve_pid(args.pid, args.url)
+    # Connecting to the Display & the first Window Discovery
+    with timer.step("create_input"):
+        return SyncInput(pid=pid, scale_factor=args.scale_factor, window_timeout=args.window_timeout, x_backend=args.x_backend, seed=args.seed)
+
+
+def diagnose(args: argparse.Namespace) -> Dict[str, Any]:
+    timer = StepTimer()
+    sync_input = create_input(args, timer)
+    base = sync_input.base
+
+    try:
+        with timer.step("get_window"):
+            window = base.get_window()
+        result: Dict[str, Any] = {
+            "version": VERSION,
+            "platform": platform.system(),
+            "pid": sync_input.pid,
+            "x_backend": None if is_windows else args.x_backend,
+            "scale_factor": base.scale_factor,
+            "window": getattr(window, "id", getattr(window, "handle", None)),
+        }
+
+        if not is_windows:
+            with timer.step("offsets"):
+                offset_x, offset_y = base._offset_toolbar_height()
+            with timer.step("round_trip"):
+                base.sync()
+            geometry = base.browser_window.get_geometry()
+            result["offsets"] = {"x": offset_x, "y": offset_y}
+            result["window_size"] = {"width": geometry.width, "height": geometry.height}
+            result["toolbar_height"] = base.browser_window.get_wm_normal_hints().min_height - 1
+        if args.url:
+            from cdp_patches.input.cdp_pool import cdp_pool
+
+            # Over the Browser WebSocket already opened for the PID Resolution
+            with timer.step("cdp_window"):
+                result["cdp_window"] = cdp_pool.connection(args.url).window_for_target()
+    finally:
+        sync_input.close()
+
+    result["steps_ms"] = timer.steps
+    return result
+
+
+def measure(operation: Callable[..., None], calls: Sequence[Sequence[Any]]) -> Dict[str, float]:
+    durations: List[float] = []
+    for call_args in calls:
+        start = time.perf_counter()
+        operation(*call_args)
+        durations.append((time.perf_counter() - start) * 1000)
+
+    if not durations:
+        return {"count": 0}
+    values = np.asarray(durations)
+    p50, p95 = np.percentile(values, (50, 95)).tolist()
+    return {
+        "count": len(values),
+        "per_second": float(len(values) / values.sum() * 1000) if values.sum() else float("inf"),
+        "mean_ms": float(values.mean()),
+        "p50_ms": p50,
+        "p95_ms": p95,
+        "max_ms": float(values.max()),
+    }
+
+
+def benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    timer = StepTimer()
+    sync_input = create_input(args, timer)
+    rng = np.random.default_rng(args.seed)
+    left, top, right, bottom = args.area
+    points = rng.integers((left, top), (right, bottom), size=(max(args.moves, args.clicks), 2)).tolist()
+    humanize = args.humanize
+    # Typed Texts are sent as Keystrokes (with humanized Typing Timings if set), Fills paste them through the Clipboard
+    sync_input.emulate_behaviour = humanize
+
+    try:
+        results: Dict[str, Any] = {
+            "pid": sync_input.pid,
+            "humanize": humanize,
+            "move": measure(lambda x, y: sync_input.move(x, y, emulate_behaviour=humanize), points[: args.moves]),
+            "click": measure(lambda x, y: sync_input.click("left", x, y, emulate_behaviour=humanize), points[: args.clicks]),
+            "type": measure(lambda text: sync_input.type(text), [[args.text]] * args.types),
+            "fill": measure(lambda text: sync_input.type(text, fill=True), [[args.text]] * args.fills),
+        }
+        if not is_windows:
+            results["rate_control"] = sync_input.base.rate_controller.report()._asdict()
+    finally:
+        sync_input.close()
+
+    results["steps_ms"] = timer.steps
+    return results
+
+
+def print_result(result: Dict[str, Any], indent: int = 0) -> None:
+    for key, value in result.items():
+        if isinstance(value, dict):
+            print(f"{' ' * indent}{key}:")
+            print_result(value, indent + 2)
+        elif isinstance(value, float):
+            print(f"{' ' * indent}{key}: {value:.3f}")
+        else:
+            print(f"{' ' * indent}{key}: {value}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    browser_parser = argparse.ArgumentParser(add_help=False)
+    target = browser_parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--pid", type=int, help="PID of the Browser Process.")
+    target.add_argument("--url", help="Remote Debugging URL of the Browser, e.g. localhost:9222 (resolves the PID via CDP).")
+    browser_parser.add_argument("--scale-factor", type=float, default=1.0, help="Device Scale Factor of the Browser.")
+    browser_parser.add_argument("--x-backend", choices=("xlib", "xcb"), default="xlib", help="X Backend used to send Input Events (Linux).")
+    browser_parser.add_argument("--window-timeout", type=float, default=30.0, help="Seconds to wait for the Browser Window.")
+    browser_parser.add_argument("--seed", type=int, default=None, help="Seed for Trajectories, Timings & Benchmark Points.")
+    browser_parser.add_argument("--json", action="store_true", help="Print the Result as JSON.")
+
+    parser = argparse.ArgumentParser(prog="python -m cdp_patches", description="Diagnose & benchmark CDP-Patches Input against a running Browser.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("diagnose", parents=[browser_parser], help="Resolve the Window & print its Offsets, Scale Factor and the Timing of every Discovery Step.")
+    benchmark_parser = subparsers.add_parser("benchmark", parents=[browser_parser], help="Measure the Throughput of synthetic Moves, Clicks & Keystrokes.")
+    benchmark_parser.add_argument("--moves", type=int, default=100, help="Amount of Moves.")
+    benchmark_parser.add_argument("--clicks", type=int, default=20, help="Amount of Clicks.")
+    benchmark_parser.add_argument("--types", type=int, default=5, help="Amount of times the Text is typed.")
+    benchmark_parser.add_argument("--fills", type=int, default=5, help="Amount of times the Text is filled (pasted through the Clipboard).")
+    benchmark_parser.add_argument("--text", default="The quick brown fox jumps over the lazy dog", help="Text to type & fill.")
+    benchmark_parser.add_argument("--area", type=int, nargs=4, default=(100, 100, 500, 400), metavar=("LEFT", "TOP", "RIGHT", "BOTTOM"), help="Viewport Area to move & click in.")
+    benchmark_parser.add_argument("--humanize", action="store_true", help="Use humanized Trajectories & Typing Timings instead of direct Input.")
+    args = parser.parse_args(argv)
+
+    result = diagnose(args) if args.command == "diagnose" else benchmark(args)
+    if args.json:
+        print(json.dumps(result, indent=2), flush=True)
+    else:
+        print_result(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from cdp_patches import is_windows
 
+from .action_chain import ActionChain, AsyncActionChain
 from .async_input import AsyncInput
 from .sync_input import SyncInput
 
@@ -175,4 +176,4 @@ class LinuxKeyboardCodes:
 
 
 KeyboardCodes = WinKeyboardCodes if is_windows else LinuxKeyboardCodes
-__all__ = ["SyncInput", "AsyncInput", "KeyboardCodes", "WinKeyboardCodes", "LinuxKeyboardCodes", "is_windows"]
+__all__ = ["SyncInput", "AsyncInput", "ActionChain", "AsyncActionChain", "KeyboardCodes", "WinKeyboardCodes", "LinuxKeyboardCodes", "is_windows"]
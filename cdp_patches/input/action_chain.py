@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any, Callable, List, Literal, Optional, Sequence, Tuple, TypeVar, Union
+
+from .frame_rate import frame_align
+from .keystroke_timeline import KeystrokeTimeline
+from .timeline import TimelineEvent
+
+if TYPE_CHECKING:
+    from .async_input import AsyncInput
+    from .sync_input import SyncInput
+
+ChainType = TypeVar("ChainType", bound="BaseActionChain")
+# Seconds between the two Moves of a Drag Nudge, one Frame at 60 Hz
+nudge_interval = 1 / 60
+
+
+class BaseActionChain:
+    """Records Gestures & compiles them into one merged Timeline, which the Backend dispatches in a single scheduled Pass"""
+
+    def __init__(self, input_handle: Union[SyncInput, AsyncInput]) -> None:
+        self.input = input_handle
+        self.actions: List[Tuple[str, Tuple[Any, ...]]] = []
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def move(self: ChainType, x: Union[int, float], y: Union[int, float], emulate_behaviour: Optional[bool] = True, timeout: Optional[float] = None) -> ChainType:
+        self.actions.append(("move", (int(x), int(y), emulate_behaviour, timeout)))
+        return self
+
+    def down(
+        self: ChainType, button: Literal["left", "right", "middle"], x: Union[int, float], y: Union[int, float], emulate_behaviour: Optional[bool] = True, timeout: Optional[float] = None
+    ) -> ChainType:
+        self.actions.append(("down", (button, int(x), int(y), emulate_behaviour, timeout)))
+        return self
+
+    def up(self: ChainType, button: Literal["left", "right", "middle"], x: Union[int, float], y: Union[int, float]) -> ChainType:
+        self.actions.append(("up", (button, int(x), int(y))))
+        return self
+
+    def click(
+        self: ChainType, button: Literal["left", "right", "middle"], x: Union[int, float], y: Union[int, float], emulate_behaviour: Optional[bool] = True, timeout: Optional[float] = None
+    ) -> ChainType:
+        self.actions.append(("click", (button, int(x), int(y), emulate_behaviour, timeout)))
+        return self
+
+    def double_click(
+        self: ChainType, button: Literal["left", "right", "middle"], x: Union[int, float], y: Union[int, float], emulate_behaviour: Optional[bool] = True, timeout: Optional[float] = None
+    ) -> ChainType:
+        self.actions.append(("double_click", (button, int(x), int(y), emulate_behaviour, timeout)))
+        return self
+
+    def drag(
+        self: ChainType,
+        from_point: Tuple[Union[int, float], Union[int, float]],
+        to_point: Tuple[Union[int, float], Union[int, float]],
+        button: Literal["left", "right", "middle"] = "left",
+        dwell: float = 0.0,
+        via: Optional[Sequence[Tuple[Union[int, float], Union[int, float]]]] = None,
+        emulate_behaviour: Optional[bool] = True,
+        timeout: Optional[float] = None,
+    ) -> ChainType:
+        """Presses the Button at from_point & moves it (over every via Point) to to_point, hovering dwell Seconds over each Drop Target"""
+        points = [(int(x), int(y)) for x, y in [from_point, *(via or []), to_point]]
+        self.actions.append(("drag", (button, points, dwell, emulate_behaviour, timeout)))
+        return self
+
+    def scroll(self: ChainType, direction: Literal["up", "down", "left", "right"], amount: int) -> ChainType:
+        self.actions.append(("scroll", (direction, amount)))
+        return self
+
+    def type(self: ChainType, text: str, timeout: Optional[float] = None, typo_rate: float = 0.0) -> ChainType:
+        self.actions.append(("type", (text, timeout, typo_rate)))
+        return self
+
+    def wait(self: ChainType, seconds: float) -> ChainType:
+        self.actions.append(("wait", (seconds,)))
+        return self
+
+    def compile(self) -> Tuple[List[TimelineEvent], Tuple[int, int]]:
+        """Compiles all recorded Actions into one Timeline. Returns the Events and the final Mouse Position"""
+        handle = self.input
+        emulate = bool(handle.emulate_behaviour)
+        events: List[TimelineEvent] = []
+        position = (handle.last_x, handle.last_y)
+        now = 0.0
+        step = -1
+
+        def add(kind: str, x: int = 0, y: int = 0, key: str = "", amount: int = 0) -> None:
+            events.append(TimelineEvent(now, kind, x, y, key, amount, step))  # type: ignore[arg-type]
+
+        def add_move(x: int, y: int, emulate_behaviour: Optional[bool], timeout: Optional[float]) -> None:
+            nonlocal position
+            if emulate and emulate_behaviour:
+                points, interval_scale = handle.base.rate_controller.thin(handle.trajectory(position, (x, y)))
+                interval = (timeout or handle.sleep_timeout) * interval_scale
+                if handle.frame_rate:
+                    # At most one Point per Frame, Chrome coalesces the others into the same pointermove
+                    start = now
+                    for (human_x, human_y), offset in zip(*frame_align(points, interval, 1 / handle.frame_rate)):
+                        add_delay(start + offset - now)
+                        add("move", int(human_x), int(human_y))
+                    add_delay(start + len(points) * interval - now)
+                else:
+                    for human_x, human_y in points:
+                        add("move", int(human_x), int(human_y))
+                        add_delay(interval)
+            add("move", x, y)
+            position = (x, y)
+
+        def add_delay(seconds: float) -> None:
+            nonlocal now
+            now += seconds
+
+        def add_click(button: str, x: int, y: int, emulate_behaviour: Optional[bool], timeout: Optional[float]) -> None:
+            if emulate and emulate_behaviour:
+                add_move(x, y, emulate_behaviour, timeout)
+            add("down", x, y, button)
+            if emulate and emulate_behaviour:
+                add_delay(timeout or handle.sleep_timeout)
+            add("up", x, y, button)
+
+        for step, (kind, args) in enumerate(self.actions):
+            if kind == "move":
+                add_move(*args)
+            elif kind == "down":
+                button, x, y, emulate_behaviour, timeout = args
+                if emulate and emulate_behaviour:
+                    add_move(x, y, emulate_behaviour, timeout)
+                add("down", x, y, button)
+                position = (x, y)
+            elif kind == "up":
+                button, x, y = args
+                add("up", x, y, button)
+                position = (x, y)
+            elif kind == "click":
+                add_click(*args)
+                position = args[1], args[2]
+            elif kind == "double_click":
+                button, x, y, emulate_behaviour, timeout = args
+                add_click(button, x, y, emulate_behaviour, timeout)
+                if emulate and emulate_behaviour:
+                    add_delay(float(handle.rng.uniform(0.14, 0.21)))
+                add_click(button, x, y, False, timeout)
+                position = (x, y)
+            elif kind == "drag":
+                button, points, dwell, emulate_behaviour, timeout = args
+                (start_x, start_y), targets = points[0], points[1:]
+                if emulate and emulate_behaviour:
+                    add_move(start_x, start_y, emulate_behaviour, timeout)
+                add("down", start_x, start_y, button)
+                add_delay(timeout or handle.sleep_timeout)
+
+                # The pressed-Button Trajectory gets streamed like every other Move
+                for target_x, target_y in targets:
+                    add_move(target_x, target_y, emulate_behaviour, timeout)
+                    if dwell:
+                        add_delay(dwell)
+                        # Chrome only fires dragover while the Pointer moves & X drops Moves without a Delta, so nudge it by one Pixel & back (a Frame apart, so they arent coalesced)
+                        add("move", target_x + 1, target_y)
+                        add_delay(nudge_interval)
+                        add("move", target_x, target_y)
+                add("up", *position, button)
+            elif kind == "scroll":
+                direction, amount = args
+                add("scroll", key=direction, amount=amount)
+            elif kind == "type":
+                text, timeout, typo_rate = args
+                if emulate:
+                    keystrokes = KeystrokeTimeline(text, wpm=handle.typing_speed, rng=handle.rng, typo_rate=typo_rate, word_pause=timeout or handle.sleep_timeout, backspace_key=handle.backspace_key)
+                    type_start = now
+                    for key, timestamp in zip(keystrokes.keys, keystrokes.timestamps.tolist()):
+                        now = type_start + timestamp
+                        add("key", key=key)
+                else:
+                    for key in KeystrokeTimeline.selective_modifiers_regex.findall(text):
+                        add("key", key=key)
+            elif kind == "wait":
+                add_delay(args[0])
+
+            # Marker for Step Completion Callbacks
+            add("step")
+
+        return events, position
+
+
+class ActionChain(BaseActionChain):
+    input: SyncInput
+
+    def __init__(self, input_handle: SyncInput) -> None:
+        super().__init__(input_handle)
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def perform(self, on_step: Optional[Callable[[int], None]] = None) -> bool:
+        """Dispatches the compiled Timeline. Returns False if it got cancelled"""
+        self._cancel_event.clear()
+        with self.input._lock:
+            # Compiled under the Lock, the Trajectories start at the current Position
+            events, (last_x, last_y) = self.compile()
+            completed = self.input.base.dispatch_timeline(events, cancel_event=self._cancel_event, on_step=on_step)
+            if completed:
+                self.input.last_x, self.input.last_y = last_x, last_y
+        return completed
+
+
+class AsyncActionChain(BaseActionChain):
+    input: AsyncInput
+
+    def __init__(self, input_handle: AsyncInput) -> None:
+        super().__init__(input_handle)
+        # Created by perform() inside the running Loop (Python < 3.10 binds Events to the Loop at Creation)
+        self._cancel_event: Optional[asyncio.Event] = None
+
+    def cancel(self) -> None:
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+
+    async def perform(self, on_step: Optional[Callable[[int], None]] = None) -> bool:
+        self._cancel_event = asyncio.Event()
+        async with self.input._move_lock:
+            # Compiled under the Lock, the Trajectories start at the current Position
+            events, (last_x, last_y) = self.compile()
+            completed = await self.input.base.async_dispatch_timeline(events, cancel_event=self._cancel_event, on_step=on_step)
+            if completed:
+                self.input.last_x, self.input.last_y = last_x, last_y
+        return completed
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import platform
-import random
-import re
 import sys
 import time
-from typing import Any, Generator, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Generator, List, Literal, Optional, Sequence, Tuple, TypeVar, Union
+
+import numpy as np
 
 if sys.version_info.minor >= 10:
     from typing import TypeAlias
@@ -32,8 +33,25 @@ else:
     InputBase = LinuxBase  # type: ignore
     WindowErrors = (AssertionError, ValueError, WindowClosedException)  # type: ignore[assignment]
 
-from .browsers import DriverlessAsyncChrome, async_browsers, get_async_browser_pid, get_async_scale_factor
+from .action_chain import AsyncActionChain
+from .browsers import AsyncEvaluator, DriverlessAsyncChrome, SeleniumChrome, async_browsers, get_async_browser_pid, get_async_evaluator, get_async_scale_factor, get_async_window_for_target
+from .calibration import viewport_origin, window_metrics_script
+from .chords import normalize_modifiers, parse_chord
+from .frame_rate import frame_align, frame_probe_script, refresh_rate
+from .keystroke_timeline import KeystrokeTimeline, fill_segments
+from .latency import AsyncLatencyProbe
 from .mouse_trajectory import HumanizeMouseTrajectory
+from .os_base.backend import WindowInfo
+from .os_base.registry import backend_registry
+from .scrolling import default_notch_pixels, scroll_directions, scroll_notches, scroll_position_script, viewport_metrics_script
+
+ResultType = TypeVar("ResultType")
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page as AsyncPage
+
+    from .os_base.backend import InputBackend
+    from .trajectory_store import TrajectoryTemplates
 
 
 class AsyncInput:
@@ -46,39 +64,89 @@ class AsyncInput:
     typing_speed: int = 50
     last_x: int = 0
     last_y: int = 0
-    selective_modifiers_regex = re.compile(r"{[^{}]*}|.")
+    backspace_key: str = "{BACKSPACE}" if is_windows else "{BackSpace}"
+    # CSS Pixels per Scroll Notch, corrected by a second Pass if the Page scrolled differently
+    scroll_notch_pixels: float = default_notch_pixels
+    scroll_settle_timeout: float = 1.0
+    scroll_passes: int = 2
+    # Pre-generated Trajectories (see trajectory_store) used instead of generating every Curve on the fly
+    trajectory_templates: Optional["TrajectoryTemplates"] = None
+    # Refresh Rate of the Page in Hz (see detect_frame_rate), Trajectory Points get sent at most once per Frame if set
+    frame_rate: Optional[float] = None
+    frame_probe_timeout: float = 1.0
+    _evaluator: Optional[AsyncEvaluator] = None
 
     def __init__(
-        self, pid: Optional[int] = None, browser: Optional[async_browsers] = None, scale_factor: Optional[float] = 1.0, emulate_behaviour: Optional[bool] = True, window_timeout: Optional[float] = 30.0
+        self,
+        pid: Optional[int] = None,
+        browser: Optional[async_browsers] = None,
+        scale_factor: Optional[float] = 1.0,
+        emulate_behaviour: Optional[bool] = True,
+        window_timeout: Optional[float] = 30.0,
+        x_backend: Literal["xlib", "xcb"] = "xlib",
+        seed: Optional[Union[int, np.random.Generator]] = None,
+        multi_pointer: bool = False,
+        base: Optional["InputBackend"] = None,
     ) -> None:
         if platform.system() not in ("Windows", "Linux"):
             raise SystemError("Unknown system (You´re probably using MacOS, which is currently not supported).")
+        if multi_pointer and is_windows:
+            raise NotImplementedError("Multiple Pointers are only supported on Linux (XInput 2).")
 
         self.pid = pid
         self.browser = browser
+        self.x_backend = x_backend
         self.window_timeout = window_timeout or self.window_timeout
         self._scale_factor = scale_factor or self._scale_factor
         self.emulate_behaviour = emulate_behaviour or self.emulate_behaviour
+        # Per-Handle Generator for all Randomness (Trajectories, Timings), reproducible if seeded
+        self.rng = np.random.default_rng(seed)
+        # Own XI2 Master Pointer & Keyboard, so Handles on one Display can send Input concurrently
+        self.multi_pointer = multi_pointer
         self._move_lock = asyncio.Lock()
+        self._custom_base = base
 
     def __await__(self) -> Generator[None, Any, AsyncInput]:
         yield from self.__ainit__().__await__()
         return self
 
     async def __ainit__(self) -> None:
-        if self.browser:
+        if self._custom_base is not None:
+            # Custom Backend (e.g. RecordingBase), no Browser Process needed
+            self.pid = self.pid or getattr(self._custom_base, "pid", None)
+            self._scale_factor = self._custom_base.scale_factor
+        elif self.browser:
             self.pid = await get_async_browser_pid(self.browser)
             self._scale_factor = float(await get_async_scale_factor(self.browser))
         elif not self.pid:
             raise ValueError("You must provide a pid or a browser")
 
-        self._base = InputBase(self.pid, self._scale_factor)  # type: ignore
+        self._base = self._create_base(self.x_backend) if self._custom_base is None else self._custom_base  # type: ignore[assignment]
         await self._wait_for_window()
 
         # Include Windows Scale Factor for every browser except DriverlessSyncChrome
-        if is_windows and not isinstance(self.browser, DriverlessAsyncChrome):
+        if self._custom_base is None and is_windows and not isinstance(self.browser, (DriverlessAsyncChrome, SeleniumChrome)):
             self._base.include_windows_scale_factor()
 
+    def _create_base(self, x_backend: Literal["xlib", "xcb"]) -> Union[WindowsBase, LinuxBase]:
+        assert self.pid
+        if self.multi_pointer:
+            return InputBase(self.pid, self._scale_factor, x_backend=x_backend, multi_pointer=True)  # type: ignore
+        # Handles of the same Browser (e.g. one per Context or Page) share the Backend & its Window Discovery
+        return backend_registry.input_backend(self.pid, self._scale_factor, x_backend=x_backend)  # type: ignore[return-value]
+
+    def trajectory(self, from_point: Tuple[int, int], to_point: Tuple[int, int]) -> List[Tuple[float, float]]:
+        if self.trajectory_templates is not None:
+            return self.trajectory_templates.sample(from_point, to_point, rng=self.rng)
+        return HumanizeMouseTrajectory(from_point, to_point, rng=self.rng).points
+
+    async def close(self) -> None:
+        """Releases the Handles Reference to the shared Backend (closing its X Connections with the last Handle) or the Master Devices of multi_pointer Handles"""
+        if self._evaluator:
+            await self._evaluator.close()
+            self._evaluator = None
+        self._base.close()
+
     @property
     def base(self) -> Union[WindowsBase, LinuxBase]:
         return self._base
@@ -105,21 +173,47 @@ class AsyncInput:
 
         raise TimeoutError(f"Chrome Window (PID: {self.pid}) not found in {self.window_timeout} seconds.")
 
+    async def _dispatch(self, method: Callable[..., ResultType], *args: Any, **kwargs: Any) -> ResultType:
+        # The Base waits for the Display Lock, which other Handles hold for whole Timelines, so it mustnt be taken on the Event Loop
+        return await asyncio.get_running_loop().run_in_executor(None, functools.partial(method, *args, **kwargs))
+
     async def _sleep_timeout(self, timeout: Optional[float] = None) -> None:
         timeout = timeout or self.sleep_timeout
-        if not random.randint(0, 10):
+        if not self.rng.integers(0, 10, endpoint=True):
             timeout_random = self.sleep_timeout / 10
-            timeout = timeout or random.uniform(self.sleep_timeout, self.sleep_timeout + timeout_random)
+            timeout = timeout or self.rng.uniform(self.sleep_timeout, self.sleep_timeout + timeout_random)
 
         await asyncio.sleep(timeout)
 
-    async def click(self, button: Literal["left", "right", "middle"], x: Union[int, float], y: Union[int, float], emulate_behaviour: Optional[bool] = True, timeout: Optional[float] = None) -> None:
+    async def click(
+        self,
+        button: Literal["left", "right", "middle"],
+        x: Union[int, float],
+        y: Union[int, float],
+        emulate_behaviour: Optional[bool] = True,
+        timeout: Optional[float] = None,
+        modifiers: Optional[Sequence[str]] = None,
+        page_coords: bool = False,
+    ) -> None:
+        if page_coords:
+            x, y = await self.scroll_into_view(x, y)
         x, y = int(x), int(y)
 
-        await self.down(button=button, x=x, y=y, emulate_behaviour=emulate_behaviour, timeout=timeout)
-        if self.emulate_behaviour and emulate_behaviour:
-            await self._sleep_timeout(timeout=timeout)
-        await self.up(button=button, x=x, y=y)
+        held_modifiers = normalize_modifiers(modifiers or [])
+        if held_modifiers:
+            # Move first, then hold the Modifiers only around the Click
+            if self.emulate_behaviour and emulate_behaviour:
+                await self.move(x=x, y=y, emulate_behaviour=emulate_behaviour, timeout=timeout)
+            await self._dispatch(self._base.press_modifiers, held_modifiers)
+
+        try:
+            await self.down(button=button, x=x, y=y, emulate_behaviour=emulate_behaviour and not held_modifiers, timeout=timeout)
+            if self.emulate_behaviour and emulate_behaviour:
+                await self._sleep_timeout(timeout=timeout)
+            await self.up(button=button, x=x, y=y)
+        finally:
+            if held_modifiers:
+                await self._dispatch(self._base.release_modifiers, held_modifiers)
         self.last_x, self.last_y = x, y
 
     async def double_click(
@@ -129,7 +223,7 @@ class AsyncInput:
 
         await self.click(button=button, x=x, y=y, timeout=timeout, emulate_behaviour=emulate_behaviour)
         if self.emulate_behaviour and emulate_behaviour:
-            await self._sleep_timeout(random.uniform(0.14, 0.21))
+            await self._sleep_timeout(self.rng.uniform(0.14, 0.21))
             # await self._sleep_timeout(timeout=timeout)
         await self.click(button=button, x=x, y=y, emulate_behaviour=False, timeout=timeout)
 
@@ -140,42 +234,188 @@ class AsyncInput:
 
         if self.emulate_behaviour and emulate_behaviour:
             await self.move(x=x, y=y, timeout=timeout, emulate_behaviour=emulate_behaviour)
-        self._base.down(button=button, x=x, y=y)
+        await self._dispatch(self._base.down, button=button, x=x, y=y)
         self.last_x, self.last_y = x, y
 
     async def up(self, button: Literal["left", "right", "middle"], x: Union[int, float], y: Union[int, float]) -> None:
         x, y = int(x), int(y)
 
-        self._base.up(button=button, x=x, y=y)
+        await self._dispatch(self._base.up, button=button, x=x, y=y)
         self.last_x, self.last_y = x, y
 
-    async def move(self, x: Union[int, float], y: Union[int, float], emulate_behaviour: Optional[bool] = True, timeout: Optional[float] = None) -> None:
+    async def move(self, x: Union[int, float], y: Union[int, float], emulate_behaviour: Optional[bool] = True, timeout: Optional[float] = None, page_coords: bool = False) -> None:
+        if page_coords:
+            x, y = await self.scroll_into_view(x, y)
         async with self._move_lock:
             x, y = int(x), int(y)
 
             if self.emulate_behaviour and emulate_behaviour:
-                humanized_points = HumanizeMouseTrajectory((self.last_x, self.last_y), (x, y))
+                # Fewer Points with longer Delays if the Display Server is saturated
+                points, interval_scale = self._base.rate_controller.thin(self.trajectory((self.last_x, self.last_y), (x, y)))
+
+                interval = (timeout or self.sleep_timeout) * interval_scale
 
-                # Move Mouse to new random locations
-                for i, (human_x, human_y) in enumerate(humanized_points.points):
-                    self._base.move(x=int(human_x), y=int(human_y))
-                    await self._sleep_timeout(timeout=timeout)
+                if self.frame_rate:
+                    await self._move_per_frame(points, interval)
+                else:
+                    # Move Mouse to new random locations
+                    for i, (human_x, human_y) in enumerate(points):
+                        await self._dispatch(self._base.move, x=int(human_x), y=int(human_y))
+                        await self._sleep_timeout(timeout=interval)
 
             else:
-                self._base.move(x=x, y=y)
+                await self._dispatch(self._base.move, x=x, y=y)
             self.last_x, self.last_y = x, y
 
+    async def _move_per_frame(self, points: Sequence[Tuple[float, float]], interval: float) -> None:
+        assert self.frame_rate
+        aligned, offsets = frame_align(points, interval, 1 / self.frame_rate)
+        # Scheduled from the Start, so the Points dont drift out of their Frames
+        start = time.perf_counter()
+        for (human_x, human_y), offset in zip(aligned, offsets):
+            await asyncio.sleep(max(0.0, start + offset - time.perf_counter()))
+            await self._dispatch(self._base.move, x=int(human_x), y=int(human_y))
+        await asyncio.sleep(max(0.0, start + len(points) * interval - time.perf_counter()))
+
+    async def calibrate(self) -> Tuple[int, int]:
+        """
+        Measures the Screen Position of the Viewport over CDP once (Linux), so Moves only add the cached Offset instead of querying the Toolbar Height.
+        Windows sends Input relative to the Client Area (the Viewport), nothing is measured & its Screen Position is returned.
+        """
+        if is_windows:
+            async with self._move_lock:
+                client_origin: Tuple[int, int] = await self._dispatch(self._base.client_origin)  # type: ignore[attr-defined]
+            return client_origin
+        if not self.browser:
+            raise ValueError("Calibrating needs the browser the Input Handle was created with.")
+
+        async with await get_async_evaluator(self.browser) as evaluate:
+            content_x, content_y = viewport_origin(await evaluate(window_metrics_script), self.scale_factor)
+        async with self._move_lock:
+            await self._dispatch(self._base.calibrate, content_x, content_y)  # type: ignore[attr-defined]
+        return content_x, content_y
+
+    async def detect_frame_rate(self) -> float:
+        """Measures the Refresh Rate of the Page with a requestAnimationFrame Probe & sends Trajectory Points at most once per Frame from then on"""
+        if not self.browser:
+            raise ValueError("Detecting the Frame Rate needs the browser the Input Handle was created with.")
+
+        async with await get_async_evaluator(self.browser) as evaluate:
+            frames = await evaluate(frame_probe_script(self.frame_probe_timeout))
+
+        frame_rate = refresh_rate(frames)
+        if frame_rate is None:
+            # Hidden/Background Pages dont render Frames
+            raise TimeoutError(f"No Animation Frames rendered in {self.frame_probe_timeout} seconds.")
+        self.frame_rate = frame_rate
+        return frame_rate
+
+    async def drag(
+        self,
+        from_point: Tuple[Union[int, float], Union[int, float]],
+        to_point: Tuple[Union[int, float], Union[int, float]],
+        button: Literal["left", "right", "middle"] = "left",
+        dwell: float = 0.0,
+        via: Optional[Sequence[Tuple[Union[int, float], Union[int, float]]]] = None,
+        emulate_behaviour: Optional[bool] = True,
+        timeout: Optional[float] = None,
+    ) -> None:
+        await self.chain().drag(from_point, to_point, button=button, dwell=dwell, via=via, emulate_behaviour=emulate_behaviour, timeout=timeout).perform()
+
+    async def _page_evaluator(self) -> AsyncEvaluator:
+        # Created once per Handle & reused by every Scroll, closed with the Handle
+        if self._evaluator is None:
+            self._evaluator = await get_async_evaluator(self.browser)
+        return self._evaluator
+
+    async def scroll_into_view(self, x: Union[int, float], y: Union[int, float]) -> Tuple[int, int]:
+        """Scrolls the Page Coordinates into the Viewport with one Scroll Batch & returns them as Viewport Coordinates"""
+        if not self.browser:
+            raise ValueError("Page Coordinates need the browser the Input Handle was created with.")
+
+        evaluate = await self._page_evaluator()
+        scroll_x, scroll_y, width, height, scroll_width, scroll_height = await evaluate(viewport_metrics_script)
+        notch_x = notch_y = self.scroll_notch_pixels
+
+        for scroll_pass in range(self.scroll_passes + 1):
+            notches_x, notches_y = scroll_notches(x, scroll_x, width, notch_x, scroll_width), scroll_notches(y, scroll_y, height, notch_y, scroll_height)
+            if not notches_x and not notches_y:
+                return int(x - scroll_x), int(y - scroll_y)
+            if scroll_pass == self.scroll_passes:
+                break
+
+            direction_x, direction_y = scroll_directions(notches_x, notches_y)
+            if direction_y:
+                await self.scroll(direction_y, abs(notches_y))
+            if direction_x:
+                await self.scroll(direction_x, abs(notches_x))
+
+            # Re-read the Position once the Scroll settled, instead of once per Notch
+            new_x, new_y = await self._wait_for_scroll(evaluate, scroll_x, scroll_y)
+            if notches_x and new_x != scroll_x:
+                notch_x = abs(new_x - scroll_x) / abs(notches_x)
+            if notches_y and new_y != scroll_y:
+                notch_y = abs(new_y - scroll_y) / abs(notches_y)
+            scroll_x, scroll_y = new_x, new_y
+
+        raise ValueError(f"Couldn't scroll {(x, y)} into the Viewport.")
+
+    async def _wait_for_scroll(self, evaluate: Callable[[str], Awaitable[Any]], previous_x: float, previous_y: float) -> Tuple[float, float]:
+        # Smooth Scrolling animates the Scroll, wait until the Position stops changing
+        max_wait = time.perf_counter() + self.scroll_settle_timeout
+        position = await evaluate(scroll_position_script)
+        while time.perf_counter() < max_wait:
+            await self._sleep_timeout(0.05)
+            current = await evaluate(scroll_position_script)
+            if current == position and current != [previous_x, previous_y]:
+                break
+            position = current
+        return position[0], position[1]
+
     async def scroll(self, direction: Literal["up", "down", "left", "right"], amount: int) -> None:
-        self._base.scroll(direction=direction, amount=amount)
+        await self._dispatch(self._base.scroll, direction=direction, amount=amount)
 
-    async def type(self, text: str, fill: Optional[bool] = False, timeout: Optional[float] = None) -> None:
+    async def type(self, text: str, fill: Optional[bool] = False, timeout: Optional[float] = None, typo_rate: float = 0.0) -> None:
         if self.emulate_behaviour and not fill:
-            for i, char in enumerate(self.selective_modifiers_regex.findall(text)):
-                # If new word is started wait some more time
-                if i != 0 and text[i - 1] == " ":
-                    await self._sleep_timeout(timeout=timeout)
-
-                self._base.send_keystrokes(char)
-                await self._sleep_timeout((random.random() * 10) / self.typing_speed)
+            timeline = KeystrokeTimeline(text, wpm=self.typing_speed, rng=self.rng, typo_rate=typo_rate, word_pause=timeout or self.sleep_timeout, backspace_key=self.backspace_key)
+            await self._base.async_send_keystrokes_timeline(timeline.keys, timeline.timestamps)
+        elif fill:
+            # One Ctrl+V per Text Run through the Clipboard instead of a Key per Character
+            for is_key, segment in fill_segments(text):
+                if is_key:
+                    await self._dispatch(self._base.send_keystrokes, segment)
+                else:
+                    # Waits for the Browser to read the Clipboard, up to paste_timeout
+                    await self._dispatch(self._base.paste, segment)
         else:
-            self._base.send_keystrokes(text)
+            await self._dispatch(self._base.send_keystrokes, text)
+
+    async def press_chord(self, chord: str) -> None:
+        """Sends a Keyboard Shortcut like "ctrl+a" or "ctrl+shift+t" in one Batch"""
+        modifiers, key = parse_chord(chord)
+        await self._dispatch(self._base.send_chord, modifiers, key)
+
+    async def capture(self, x: Union[int, float] = 0, y: Union[int, float] = 0, width: Optional[Union[int, float]] = None, height: Optional[Union[int, float]] = None) -> np.ndarray:
+        return await self._dispatch(self._base.capture, x=int(x), y=int(y), width=None if width is None else int(width), height=None if height is None else int(height))
+
+    def chain(self) -> AsyncActionChain:
+        return AsyncActionChain(self)
+
+    async def windows(self) -> List[WindowInfo]:
+        """Indexes every Browser Window of the PID (Title, Geometry & CDP Window Id once bound)"""
+        return await self._dispatch(self._base.index_windows)
+
+    async def bind_window(self, window: Optional[Union[int, WindowInfo]]) -> Optional[WindowInfo]:
+        """Sends all Input of this Handle to one Window of windows(), switching without a Window Search. None follows the first Window again"""
+        return await self._dispatch(self._base.bind_window, window)
+
+    async def bind_target(self, target: Optional[Union[str, "AsyncPage"]] = None) -> WindowInfo:
+        """Binds the Handle to the Window showing a CDP Target (Target Id or Playwright Page, Default: the current/first Page)"""
+        if not self.browser:
+            raise ValueError("Binding a Target needs the browser the Input Handle was created with.")
+
+        window = await get_async_window_for_target(self.browser, target)
+        return await self._dispatch(self._base.bind_cdp_window, window["windowId"], window["bounds"])
+
+    def latency_probe(self) -> AsyncLatencyProbe:
+        return AsyncLatencyProbe(self)
@@ -1,23 +1,40 @@
+import asyncio
 import json
+import re
 import time
+import weakref
 from contextlib import suppress
-from typing import Dict, List, Type, TypedDict, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type, TypedDict, Union
 
 import requests
 from websockets.sync import client
 
+from .cdp_pool import async_cdp_pool, cdp_pool
+
 try:
     from playwright.async_api import Browser as AsyncBrowser
     from playwright.async_api import BrowserContext as AsyncContext
+    from playwright.async_api import CDPSession as AsyncCDPSession
     from playwright.async_api import Error as AsyncError
     from playwright.async_api import Error as SyncError
+    from playwright.async_api import Page as AsyncPage
+    from playwright.async_api import TimeoutError as AsyncTimeoutError
     from playwright.sync_api import Browser as SyncBrowser
     from playwright.sync_api import BrowserContext as SyncContext
+    from playwright.sync_api import CDPSession as SyncCDPSession
+    from playwright.sync_api import Page as SyncPage
+    from playwright.sync_api import TimeoutError as SyncTimeoutError
 except ImportError:
     AsyncBrowser: Type["AsyncBrowser"] = "AsyncBrowser"  # type: ignore[no-redef]
     AsyncContext: Type["AsyncContext"] = "AsyncContext"  # type: ignore[no-redef]
     SyncBrowser: Type["SyncBrowser"] = "SyncBrowser"  # type: ignore[no-redef]
     SyncContext: Type["SyncContext"] = "SyncContext"  # type: ignore[no-redef]
+    AsyncCDPSession: Type["AsyncCDPSession"] = "AsyncCDPSession"  # type: ignore[no-redef]
+    SyncCDPSession: Type["SyncCDPSession"] = "SyncCDPSession"  # type: ignore[no-redef]
+    AsyncPage: Type["AsyncPage"] = "AsyncPage"  # type: ignore[no-redef]
+    SyncPage: Type["SyncPage"] = "SyncPage"  # type: ignore[no-redef]
+    AsyncTimeoutError: Type["AsyncTimeoutError"] = "AsyncTimeoutError"  # type: ignore[no-redef]
+    SyncTimeoutError: Type["SyncTimeoutError"] = "SyncTimeoutError"  # type: ignore[no-redef]
 
 try:
     from botright.extended_typing import BrowserContext as BotrightContext
@@ -38,7 +55,7 @@ except ImportError:
 
 all_browsers = Union[AsyncContext, AsyncBrowser, SyncContext, SyncBrowser, BotrightContext, SeleniumChrome, DriverlessAsyncChrome, DriverlessSyncChrome]
 sync_browsers = Union[SeleniumChrome, SyncContext, SyncBrowser, DriverlessSyncChrome]
-async_browsers = Union[AsyncContext, AsyncBrowser, BotrightContext, DriverlessAsyncChrome]
+async_browsers = Union[AsyncContext, AsyncBrowser, BotrightContext, DriverlessAsyncChrome, SeleniumChrome]
 
 
 class InternalProcessInfo(TypedDict):
@@ -89,9 +106,39 @@ def ws_url_from_url(url: str, timeout: float = 30) -> str:
     return websocket_debugger_url
 
 
+async def async_ws_url_from_url(url: str, timeout: float = 30) -> str:
+    # Plain HTTP/1.1 Request on asyncio Streams, so Discovery doesnt block the Event Loop
+    url = url[7:] if url.startswith("http://") else url + "/json/version"
+    address, _, path = url.partition("/")
+    host, _, port = address.rpartition(":")
+
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, int(port)), timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"Couldn't connect to browser within {timeout} seconds")
+    try:
+        writer.write(f"GET /{path} HTTP/1.1\r\nHost: {address}\r\nConnection: close\r\n\r\n".encode())
+        await writer.drain()
+        headers = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout)
+        content_length = re.search(rb"content-length:\s*(\d+)", headers, re.IGNORECASE)
+        body = await asyncio.wait_for(reader.readexactly(int(content_length.group(1))) if content_length else reader.read(), timeout)
+    finally:
+        writer.close()
+
+    websocket_debugger_url: str = json.loads(body)["webSocketDebuggerUrl"]
+    return websocket_debugger_url
+
+
+async def async_process_info_from_url(url: str) -> Dict[str, List[InternalProcessInfo]]:
+    connection = await async_cdp_pool.connection(url)
+    process_info: Dict[str, List[InternalProcessInfo]] = await connection.send("SystemInfo.getProcessInfo")  # type: ignore[assignment]
+    return process_info
+
+
 def process_info_from_url(url: str) -> Dict[str, List[InternalProcessInfo]]:
-    ws_url = ws_url_from_url(url)
-    return process_info_from_ws(ws_url)
+    # Reuses the Browser WebSocket of earlier Queries against the same Debugger Address
+    process_info: Dict[str, List[InternalProcessInfo]] = cdp_pool.connection(url).send("SystemInfo.getProcessInfo")  # type: ignore[assignment]
+    return process_info
 
 
 # Browser PID
@@ -108,8 +155,13 @@ def get_sync_selenium_browser_pid(driver: Union[SeleniumChrome, DriverlessSyncCh
     return browser_info["id"]
 
 
-async def get_async_selenium_browser_pid(driver: DriverlessAsyncChrome) -> int:
-    cdp_system_info = await driver.base_target.execute_cdp_cmd(cmd="SystemInfo.getProcessInfo")
+async def get_async_selenium_browser_pid(driver: Union[SeleniumChrome, DriverlessAsyncChrome]) -> int:
+    if isinstance(driver, DriverlessAsyncChrome):
+        cdp_system_info = await driver.base_target.execute_cdp_cmd(cmd="SystemInfo.getProcessInfo")
+    elif isinstance(driver, SeleniumChrome):
+        cdp_system_info = await async_process_info_from_url(driver.capabilities["goog:chromeOptions"]["debuggerAddress"])
+    else:
+        raise ValueError("Invalid browser type.")
 
     process_info = CDPProcessInfo(cdp_system_info)
     browser_info = process_info.get_main_browser()
@@ -117,20 +169,28 @@ async def get_async_selenium_browser_pid(driver: DriverlessAsyncChrome) -> int:
 
 
 # Playwright
+# Browser PIDs by Playwright Browser, so Handles for further Contexts skip the CDP Lookup
+playwright_browser_pids: "weakref.WeakKeyDictionary[Any, int]" = weakref.WeakKeyDictionary()
+
+
 def get_sync_playwright_browser_pid(browser: Union[SyncContext, SyncBrowser]) -> int:
     if isinstance(browser, SyncContext):
         main_browser = browser.browser
         assert main_browser
-        cdp_session = main_browser.new_browser_cdp_session()
     elif isinstance(browser, SyncBrowser):
-        cdp_session = browser.new_browser_cdp_session()
+        main_browser = browser
     else:
         raise ValueError("Invalid browser type.")
 
+    if main_browser in playwright_browser_pids:
+        return playwright_browser_pids[main_browser]
+
+    cdp_session = main_browser.new_browser_cdp_session()
     cdp_system_info = cdp_session.send("SystemInfo.getProcessInfo")
 
     process_info = CDPProcessInfo(cdp_system_info)
     browser_info = process_info.get_main_browser()
+    playwright_browser_pids[main_browser] = browser_info["id"]
     return browser_info["id"]
 
 
@@ -138,15 +198,20 @@ async def get_async_playwright_browser_pid(browser: Union[AsyncContext, AsyncBro
     if isinstance(browser, AsyncContext) or isinstance(browser, BotrightContext):
         main_browser = browser.browser
         assert main_browser
-        cdp_session = await main_browser.new_browser_cdp_session()
     elif isinstance(browser, AsyncBrowser):
-        cdp_session = await browser.new_browser_cdp_session()
+        main_browser = browser
     else:
         raise ValueError("Invalid browser type.")
+
+    if main_browser in playwright_browser_pids:
+        return playwright_browser_pids[main_browser]
+
+    cdp_session = await main_browser.new_browser_cdp_session()
     cdp_system_info = await cdp_session.send("SystemInfo.getProcessInfo")
 
     process_info = CDPProcessInfo(cdp_system_info)
     browser_info = process_info.get_main_browser()
+    playwright_browser_pids[main_browser] = browser_info["id"]
     return browser_info["id"]
 
 
@@ -160,7 +225,7 @@ def get_sync_browser_pid(browser: sync_browsers) -> int:
 
 
 async def get_async_browser_pid(browser: async_browsers) -> int:
-    if isinstance(browser, DriverlessAsyncChrome):
+    if isinstance(browser, DriverlessAsyncChrome) or isinstance(browser, SeleniumChrome):
         return await get_async_selenium_browser_pid(browser)
     elif isinstance(browser, AsyncContext) or isinstance(browser, AsyncBrowser) or isinstance(browser, BotrightContext):
         return await get_async_playwright_browser_pid(browser)
@@ -168,6 +233,14 @@ async def get_async_browser_pid(browser: async_browsers) -> int:
     raise ValueError("Invalid browser type.")
 
 
+# Active Tab
+# Selenium
+async def selenium_target_id(driver: SeleniumChrome) -> str:
+    """CDP Target Id of the active Tab (the Chromedriver Window Handle), fetched in an Executor as Selenium Calls block"""
+    target_id: str = await asyncio.get_running_loop().run_in_executor(None, lambda: driver.current_window_handle)
+    return target_id
+
+
 # Scale Factor
 # Selenium & Selenium Driverless
 def get_sync_selenium_scale_factor(driver: Union[SeleniumChrome, DriverlessSyncChrome]) -> int:
@@ -175,15 +248,211 @@ def get_sync_selenium_scale_factor(driver: Union[SeleniumChrome, DriverlessSyncC
         _scale_factor: int = driver.execute_script("return window.devicePixelRatio", unique_context=True)
         return _scale_factor
 
-    scale_factor: int = driver.execute_script("return window.devicePixelRatio")
+    # Window Handles of Chromedriver are the CDP Target Ids, so the active Tab is evaluated in instead of the first Page
+    connection = cdp_pool.connection(driver.capabilities["goog:chromeOptions"]["debuggerAddress"])
+    scale_factor: int = connection.evaluate("window.devicePixelRatio", target_id=driver.current_window_handle)
     return scale_factor
 
 
-async def get_async_selenium_scale_factor(driver: DriverlessAsyncChrome) -> int:
-    scale_factor: int = await driver.execute_script("return window.devicePixelRatio", unique_context=True)
+async def get_async_selenium_scale_factor(driver: Union[SeleniumChrome, DriverlessAsyncChrome]) -> int:
+    if isinstance(driver, DriverlessAsyncChrome):
+        _scale_factor: int = await driver.execute_script("return window.devicePixelRatio", unique_context=True)
+        return _scale_factor
+
+    connection = await async_cdp_pool.connection(driver.capabilities["goog:chromeOptions"]["debuggerAddress"])
+    scale_factor: int = await connection.evaluate("window.devicePixelRatio", target_id=await selenium_target_id(driver))
     return scale_factor
 
 
+# Window for Target
+def first_page(browser: Union[SyncContext, SyncBrowser, AsyncContext, AsyncBrowser, BotrightContext]) -> Any:
+    context = browser if not isinstance(browser, (SyncBrowser, AsyncBrowser)) else next(iter(browser.contexts), None)
+    if not context or not context.pages:
+        raise ValueError("No page found to bind.")
+    return context.pages[0]
+
+
+def get_sync_window_for_target(browser: sync_browsers, target: Optional[Union[str, SyncPage]] = None) -> Dict[str, Any]:
+    """Window Id & Bounds (Browser.getWindowForTarget) of the Window showing the Target (a Target Id or Playwright Page, Default: the current/first Page)"""
+    window: Dict[str, Any]
+    if isinstance(browser, DriverlessSyncChrome):
+        target_id = target if isinstance(target, str) else browser.current_target.id
+        window = browser.base_target.execute_cdp_cmd(cmd="Browser.getWindowForTarget", cmd_args={"targetId": target_id})
+    elif isinstance(browser, SeleniumChrome):
+        window = cdp_pool.connection(browser.capabilities["goog:chromeOptions"]["debuggerAddress"]).window_for_target(target if isinstance(target, str) else browser.current_window_handle)
+    elif isinstance(browser, SyncContext) or isinstance(browser, SyncBrowser):
+        if isinstance(target, str):
+            main_browser = browser.browser if isinstance(browser, SyncContext) else browser
+            assert main_browser
+            cdp_session = main_browser.new_browser_cdp_session()
+            window = cdp_session.send("Browser.getWindowForTarget", {"targetId": target})
+        else:
+            # A Page Session resolves its own Target
+            page = target or first_page(browser)
+            cdp_session = page.context.new_cdp_session(page)
+            window = cdp_session.send("Browser.getWindowForTarget")
+        cdp_session.detach()
+    else:
+        raise ValueError("Invalid browser type.")
+    return window
+
+
+async def get_async_window_for_target(browser: async_browsers, target: Optional[Union[str, AsyncPage]] = None) -> Dict[str, Any]:
+    window: Dict[str, Any]
+    if isinstance(browser, DriverlessAsyncChrome):
+        target_id = target if isinstance(target, str) else browser.current_target.id
+        window = await browser.base_target.execute_cdp_cmd(cmd="Browser.getWindowForTarget", cmd_args={"targetId": target_id})
+    elif isinstance(browser, SeleniumChrome):
+        connection = await async_cdp_pool.connection(browser.capabilities["goog:chromeOptions"]["debuggerAddress"])
+        window = await connection.window_for_target(target if isinstance(target, str) else await selenium_target_id(browser))
+    elif isinstance(browser, AsyncContext) or isinstance(browser, AsyncBrowser) or isinstance(browser, BotrightContext):
+        if isinstance(target, str):
+            main_browser = browser if isinstance(browser, AsyncBrowser) else browser.browser
+            assert main_browser
+            cdp_session = await main_browser.new_browser_cdp_session()
+            window = await cdp_session.send("Browser.getWindowForTarget", {"targetId": target})
+        else:
+            page = target or first_page(browser)
+            cdp_session = await page.context.new_cdp_session(page)
+            window = await cdp_session.send("Browser.getWindowForTarget")
+        await cdp_session.detach()
+    else:
+        raise ValueError("Invalid browser type.")
+    return window
+
+
+# Playwright Isolated Worlds (to evaluate without Runtime.enable & without touching the Main World)
+class BasePlaywrightIsolatedWorld:
+    """
+    Isolated World in the Main Frame of a Page, recreated after Navigations.
+    Instead of retrying CDP Commands until they succeed, it waits for the Main Frame to navigate (Page.frameNavigated, which Playwright already receives),
+    as Runtime.executionContextCreated would need Runtime.enable.
+    """
+
+    world_name = "Shimmy shimmy yay, shimmy yay, shimmy ya"
+    frame_not_ready = "Protocol error (Page.createIsolatedWorld): Invalid parameters"
+    context_destroyed = "Protocol error (Runtime.evaluate): Cannot find context with specified id"
+    timeout: float = 10
+
+    def __init__(self, page: Any, cdp_session: Any) -> None:
+        self.page = page
+        self.cdp_session = cdp_session
+        self.exec_id: Optional[int] = None
+        # Set by every Main Frame Navigation, so Navigations between a failed Command & waiting for the next one arent missed
+        self._navigated = False
+        page.on("framenavigated", self._on_frame_navigated)
+
+    def _on_frame_navigated(self, frame: Any) -> None:
+        if frame.parent_frame is None:
+            # The new Document has no Isolated World yet
+            self.exec_id = None
+            self._navigated = True
+
+    def _remaining(self, deadline: float, action: str) -> float:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            raise TimeoutError(f"{action} did not succeed within {self.timeout} seconds.")
+        return remaining
+
+    def _remove_listener(self) -> None:
+        self.page.remove_listener("framenavigated", self._on_frame_navigated)
+
+
+class SyncPlaywrightIsolatedWorld(BasePlaywrightIsolatedWorld):
+    page: SyncPage
+    cdp_session: SyncCDPSession
+
+    def close(self) -> None:
+        self._remove_listener()
+        # Already detached if the Page was closed
+        with suppress(SyncError):
+            self.cdp_session.detach()
+
+    def _wait_for_navigation(self, deadline: float, action: str) -> None:
+        if self._navigated:
+            return
+        remaining = self._remaining(deadline, action)
+        with suppress(SyncTimeoutError):
+            self.page.wait_for_event("framenavigated", predicate=lambda frame: frame.parent_frame is None, timeout=remaining * 1000)
+
+    def create(self, deadline: float) -> int:
+        while True:
+            self._navigated = False
+            try:
+                page_frame_tree = self.cdp_session.send("Page.getFrameTree")
+                page_id = page_frame_tree["frameTree"]["frame"]["id"]
+
+                isolated_world = self.cdp_session.send("Page.createIsolatedWorld", {"frameId": page_id, "grantUniveralAccess": True, "worldName": self.world_name})
+                isolated_exec_id: int = isolated_world["executionContextId"]
+                self.exec_id = isolated_exec_id
+                return isolated_exec_id
+            except SyncError as e:
+                if e.message != self.frame_not_ready:
+                    raise e
+            # The Main Frame hasnt committed its first Navigation yet
+            self._wait_for_navigation(deadline, "Page.createIsolatedWorld")
+
+    def evaluate(self, expression: str) -> Any:
+        deadline = time.perf_counter() + self.timeout
+        while True:
+            isolated_exec_id = self.exec_id if self.exec_id is not None else self.create(deadline)
+            try:
+                evaluation = self.cdp_session.send("Runtime.evaluate", {"expression": expression, "contextId": isolated_exec_id, "returnByValue": True, "awaitPromise": True})
+                return evaluation["result"].get("value")
+            except SyncError as e:
+                if e.message != self.context_destroyed:
+                    raise e
+            # Destroyed by a Navigation, recreate it in the new Document
+            self.exec_id = None
+            self._wait_for_navigation(deadline, "Runtime.evaluate")
+
+
+class AsyncPlaywrightIsolatedWorld(BasePlaywrightIsolatedWorld):
+    page: AsyncPage
+    cdp_session: AsyncCDPSession
+
+    async def close(self) -> None:
+        self._remove_listener()
+        with suppress(AsyncError):
+            await self.cdp_session.detach()
+
+    async def _wait_for_navigation(self, deadline: float, action: str) -> None:
+        if self._navigated:
+            return
+        remaining = self._remaining(deadline, action)
+        with suppress(AsyncTimeoutError):
+            await self.page.wait_for_event("framenavigated", predicate=lambda frame: frame.parent_frame is None, timeout=remaining * 1000)
+
+    async def create(self, deadline: float) -> int:
+        while True:
+            self._navigated = False
+            try:
+                page_frame_tree = await self.cdp_session.send("Page.getFrameTree")
+                page_id = page_frame_tree["frameTree"]["frame"]["id"]
+
+                isolated_world = await self.cdp_session.send("Page.createIsolatedWorld", {"frameId": page_id, "grantUniveralAccess": True, "worldName": self.world_name})
+                isolated_exec_id: int = isolated_world["executionContextId"]
+                self.exec_id = isolated_exec_id
+                return isolated_exec_id
+            except AsyncError as e:
+                if e.message != self.frame_not_ready:
+                    raise e
+            await self._wait_for_navigation(deadline, "Page.createIsolatedWorld")
+
+    async def evaluate(self, expression: str) -> Any:
+        deadline = time.perf_counter() + self.timeout
+        while True:
+            isolated_exec_id = self.exec_id if self.exec_id is not None else await self.create(deadline)
+            try:
+                evaluation = await self.cdp_session.send("Runtime.evaluate", {"expression": expression, "contextId": isolated_exec_id, "returnByValue": True, "awaitPromise": True})
+                return evaluation["result"].get("value")
+            except AsyncError as e:
+                if e.message != self.context_destroyed:
+                    raise e
+            self.exec_id = None
+            await self._wait_for_navigation(deadline, "Runtime.evaluate")
+
+
 # Playwright with Runtime Patching
 def get_sync_playwright_scale_factor(browser: Union[SyncContext, SyncBrowser]) -> int:
     close_context, close_page = False, False
@@ -203,38 +472,9 @@ def get_sync_playwright_scale_factor(browser: Union[SyncContext, SyncBrowser]) -
     else:
         page = context.new_page()
         close_page = True
-    cdp_session = context.new_cdp_session(page)
-
-    time1 = time.perf_counter()
-    while (time.perf_counter() - time1) <= 10:
-        try:
-            page_frame_tree = cdp_session.send("Page.getFrameTree")
-            page_id = page_frame_tree["frameTree"]["frame"]["id"]
-
-            isolated_world = cdp_session.send("Page.createIsolatedWorld", {"frameId": page_id, "grantUniveralAccess": True, "worldName": "Shimmy shimmy yay, shimmy yay, shimmy ya"})
-            isolated_exec_id = isolated_world["executionContextId"]
-            break
-        except SyncError as e:
-            if e.message == "Protocol error (Page.createIsolatedWorld): Invalid parameters":
-                pass
-            else:
-                raise e
-    else:
-        raise TimeoutError("Page.createIsolatedWorld did not initialize properly within 30 seconds.")
-
-    time2 = time.perf_counter()
-    while (time.perf_counter() - time2) <= 10:
-        try:
-            scale_factor_eval = cdp_session.send("Runtime.evaluate", {"expression": "window.devicePixelRatio", "contextId": isolated_exec_id})
-            scale_factor: int = scale_factor_eval["result"]["value"]
-            break
-        except SyncError as e:
-            if e.message == "Protocol error (Runtime.evaluate): Cannot find context with specified id":
-                pass
-            else:
-                raise e
-    else:
-        raise TimeoutError("Runtime.evaluate did not run properly within 30 seconds.")
+    isolated_world = SyncPlaywrightIsolatedWorld(page, context.new_cdp_session(page))
+    scale_factor: int = isolated_world.evaluate("window.devicePixelRatio")
+    isolated_world.close()
 
     with suppress(SyncError):
         if close_page:
@@ -265,38 +505,9 @@ async def get_async_playwright_scale_factor(browser: Union[AsyncContext, AsyncBr
     else:
         page = await context.new_page()
         close_page = True
-    cdp_session = await context.new_cdp_session(page)
-
-    time1 = time.perf_counter()
-    while (time.perf_counter() - time1) <= 10:
-        try:
-            page_frame_tree = await cdp_session.send("Page.getFrameTree")
-            page_id = page_frame_tree["frameTree"]["frame"]["id"]
-
-            isolated_world = await cdp_session.send("Page.createIsolatedWorld", {"frameId": page_id, "grantUniveralAccess": True, "worldName": "Shimmy shimmy yay, shimmy yay, shimmy ya"})
-            isolated_exec_id = isolated_world["executionContextId"]
-            break
-        except AsyncError as e:
-            if e.message == "Protocol error (Page.createIsolatedWorld): Invalid parameters":
-                pass
-            else:
-                raise e
-    else:
-        raise TimeoutError("Page.createIsolatedWorld did not initialize properly within 30 seconds.")
-
-    time2 = time.perf_counter()
-    while (time.perf_counter() - time2) <= 10:
-        try:
-            scale_factor_eval = await cdp_session.send("Runtime.evaluate", {"expression": "window.devicePixelRatio", "contextId": isolated_exec_id})
-            scale_factor: int = scale_factor_eval["result"]["value"]
-            break
-        except AsyncError as e:
-            if e.message == "Protocol error (Runtime.evaluate): Cannot find context with specified id":
-                pass
-            else:
-                raise e
-    else:
-        raise TimeoutError("Runtime.evaluate did not run properly within 30 seconds.")
+    isolated_world = AsyncPlaywrightIsolatedWorld(page, await context.new_cdp_session(page))
+    scale_factor: int = await isolated_world.evaluate("window.devicePixelRatio")
+    await isolated_world.close()
 
     with suppress(SyncError):
         if close_page:
@@ -309,20 +520,129 @@ async def get_async_playwright_scale_factor(browser: Union[AsyncContext, AsyncBr
     return scale_factor
 
 
+# Scale Factors by Browser/Context/Driver, so further Handles dont evaluate again (or open & close a Page for Page-less Contexts)
+scale_factors: "weakref.WeakKeyDictionary[Any, int]" = weakref.WeakKeyDictionary()
+
+
 def get_sync_scale_factor(browser: sync_browsers) -> int:
+    if browser in scale_factors:
+        return scale_factors[browser]
+
     if isinstance(browser, SeleniumChrome) or isinstance(browser, DriverlessSyncChrome):
-        return get_sync_selenium_scale_factor(browser)
+        scale_factor = get_sync_selenium_scale_factor(browser)
     elif isinstance(browser, SyncContext) or isinstance(browser, SyncBrowser):
-        return get_sync_playwright_scale_factor(browser)
+        scale_factor = get_sync_playwright_scale_factor(browser)
+    else:
+        raise ValueError("Invalid browser type.")
 
-    raise ValueError("Invalid browser type.")
+    scale_factors[browser] = scale_factor
+    return scale_factor
 
 
 async def get_async_scale_factor(browser: async_browsers) -> int:
+    if browser in scale_factors:
+        return scale_factors[browser]
+
+    if isinstance(browser, DriverlessAsyncChrome) or isinstance(browser, SeleniumChrome):
+        scale_factor = await get_async_selenium_scale_factor(browser)
+    elif isinstance(browser, AsyncContext) or isinstance(browser, AsyncBrowser) or isinstance(browser, BotrightContext):
+        scale_factor = await get_async_playwright_scale_factor(browser)
+    else:
+        raise ValueError("Invalid browser type.")
+
+    scale_factors[browser] = scale_factor
+    return scale_factor
+
+
+# Evaluators, bound to one (isolated) Execution Context of the active Page, for repeated Evaluations
+class SyncEvaluator:
+    """Evaluates Expressions (awaiting returned Promises) when called. close() (or leaving the with Block) releases the CDP Session & Navigation Listener of a Playwright Isolated World"""
+
+    def __init__(self, evaluate: Callable[[str], Any], close: Optional[Callable[[], None]] = None) -> None:
+        self._evaluate = evaluate
+        self._close = close
+
+    def __call__(self, expression: str) -> Any:
+        return self._evaluate(expression)
+
+    def close(self) -> None:
+        if self._close:
+            self._close()
+            self._close = None
+
+    def __enter__(self) -> "SyncEvaluator":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AsyncEvaluator:
+    """Evaluates Expressions (awaiting returned Promises) when awaited. close() (or leaving the async with Block) releases the CDP Session & Navigation Listener of a Playwright Isolated World"""
+
+    def __init__(self, evaluate: Callable[[str], Awaitable[Any]], close: Optional[Callable[[], Awaitable[None]]] = None) -> None:
+        self._evaluate = evaluate
+        self._close = close
+
+    async def __call__(self, expression: str) -> Any:
+        return await self._evaluate(expression)
+
+    async def close(self) -> None:
+        if self._close:
+            close, self._close = self._close, None
+            await close()
+
+    async def __aenter__(self) -> "AsyncEvaluator":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+
+def get_sync_evaluator(browser: sync_browsers) -> SyncEvaluator:
+    if isinstance(browser, DriverlessSyncChrome):
+        return SyncEvaluator(lambda expression: browser.eval_async(f"return await ({expression})", unique_context=True))
+    elif isinstance(browser, SeleniumChrome):
+        # Chromedriver awaits returned Promises
+        return SyncEvaluator(lambda expression: browser.execute_script(f"return {expression}"))
+    elif isinstance(browser, SyncContext) or isinstance(browser, SyncBrowser):
+        context = browser if isinstance(browser, SyncContext) else next(iter(browser.contexts), None)
+        if not context or not context.pages:
+            raise ValueError("No page found to evaluate in.")
+
+        page = context.pages[0]
+        isolated_world = SyncPlaywrightIsolatedWorld(page, context.new_cdp_session(page))
+        try:
+            isolated_world.create(time.perf_counter() + isolated_world.timeout)
+        except BaseException:
+            isolated_world.close()
+            raise
+        return SyncEvaluator(isolated_world.evaluate, isolated_world.close)
+
+    raise ValueError("Invalid browser type.")
+
+
+async def get_async_evaluator(browser: async_browsers) -> AsyncEvaluator:
     if isinstance(browser, DriverlessAsyncChrome):
-        return await get_async_selenium_scale_factor(browser)
+        return AsyncEvaluator(lambda expression: browser.eval_async(f"return await ({expression})", unique_context=True))
+    elif isinstance(browser, SeleniumChrome):
+        # execute_script would block the Event Loop, evaluate over the pooled CDP Connection instead
+        connection = await async_cdp_pool.connection(browser.capabilities["goog:chromeOptions"]["debuggerAddress"])
+        target_id = await selenium_target_id(browser)
+        return AsyncEvaluator(lambda expression: connection.evaluate(expression, target_id=target_id, await_promise=True))
     elif isinstance(browser, AsyncContext) or isinstance(browser, AsyncBrowser) or isinstance(browser, BotrightContext):
-        return await get_async_playwright_scale_factor(browser)
+        context = browser if not isinstance(browser, AsyncBrowser) else next(iter(browser.contexts), None)
+        if not context or not context.pages:
+            raise ValueError("No page found to evaluate in.")
+
+        page = context.pages[0]
+        async_isolated_world = AsyncPlaywrightIsolatedWorld(page, await context.new_cdp_session(page))
+        try:
+            await async_isolated_world.create(time.perf_counter() + async_isolated_world.timeout)
+        except BaseException:
+            await async_isolated_world.close()
+            raise
+        return AsyncEvaluator(async_isolated_world.evaluate, async_isolated_world.close)
 
     raise ValueError("Invalid browser type.")
 
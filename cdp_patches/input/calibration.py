@@ -0,0 +1,12 @@
+from typing import Sequence, Tuple
+
+# Read in one Evaluation: [screenX, screenY, outerWidth, outerHeight, innerWidth, innerHeight] (Screen Values in DIPs, inner ones in CSS Pixels)
+window_metrics_script = "[window.screenX, window.screenY, window.outerWidth, window.outerHeight, window.innerWidth, window.innerHeight]"
+
+
+def viewport_origin(metrics: Sequence[float], scale_factor: float) -> Tuple[int, int]:
+    """Screen Position of the Viewport Origin in Device Pixels (at 100% Page Zoom). Side & Bottom Borders are split evenly from the Width, the Rest of the Height is the Toolbar"""
+    screen_x, screen_y, outer_width, outer_height, inner_width, inner_height = metrics
+    border = max(0.0, outer_width - inner_width) / 2
+    toolbar_height = max(0.0, outer_height - inner_height - border)
+    return int(round((screen_x + border) * scale_factor)), int(round((screen_y + toolbar_height) * scale_factor))
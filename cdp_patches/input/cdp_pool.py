@@ -0,0 +1,312 @@
+import asyncio
+import itertools
+import json
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Optional, Tuple
+
+from websockets.sync import client
+
+try:
+    from websockets.asyncio.client import connect as async_connect
+except ImportError:
+    # websockets < 13
+    from websockets.client import connect as async_connect  # type: ignore[attr-defined, no-redef]
+
+# Same Name as the Isolated Worlds created through Playwright
+world_name = "Shimmy shimmy yay, shimmy yay, shimmy ya"
+# Runtime.evaluate in an Isolated World a Navigation destroyed
+context_destroyed = "Cannot find context with specified id"
+
+
+class CDPConnection:
+    """Browser-Level CDP WebSocket shared by all Callers, Requests are multiplexed by their Id & answered by a Reader Thread"""
+
+    def __init__(self, ws_url: str, timeout: float = 30) -> None:
+        self.ws_url = ws_url
+        self.timeout = timeout
+        self.websocket = client.connect(ws_url, max_size=None, open_timeout=timeout)
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, "Future[Dict[str, Any]]"] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        # Flattened Session & Isolated World per Page Target, reused by all Evaluations until the Page navigates or closes
+        self._page_sessions: Dict[str, str] = {}
+        self._page_contexts: Dict[str, int] = {}
+        self._first_page: Optional[str] = None
+        # Guards the Session & World Caches, Callers on several Threads share the Connection
+        self._world_lock = threading.Lock()
+
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _read(self) -> None:
+        try:
+            for message in self.websocket:
+                data = json.loads(message)
+                # Events (without Id) arent subscribed to
+                with self._lock:
+                    future = self._pending.pop(data.get("id", 0), None)
+                if future is None:
+                    continue
+
+                if "error" in data:
+                    future.set_exception(RuntimeError(f"CDP Error: {data['error'].get('message')}"))
+                else:
+                    future.set_result(data.get("result", {}))
+        except Exception:
+            pass
+        finally:
+            with self._lock:
+                self._closed = True
+                pending, self._pending = self._pending, {}
+            for future in pending.values():
+                future.set_exception(ConnectionError("CDP Connection to the Browser was closed."))
+
+    def send(self, method: str, params: Optional[Dict[str, Any]] = None, session_id: Optional[str] = None) -> Dict[str, Any]:
+        future: "Future[Dict[str, Any]]" = Future()
+        with self._lock:
+            if self._closed:
+                raise ConnectionError("CDP Connection to the Browser was closed.")
+            request_id = next(self._ids)
+            self._pending[request_id] = future
+
+        message: Dict[str, Any] = {"id": request_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        try:
+            self.websocket.send(json.dumps(message))
+            return future.result(self.timeout)
+        finally:
+            with self._lock:
+                self._pending.pop(request_id, None)
+
+    def page_target(self) -> Dict[str, Any]:
+        for target in self.send("Target.getTargets")["targetInfos"]:
+            if target["type"] == "page":
+                page_target: Dict[str, Any] = target
+                return page_target
+
+        raise ValueError("No page found to evaluate in.")
+
+    def window_for_target(self, target_id: Optional[str] = None) -> Dict[str, Any]:
+        """Window Id & Bounds (left, top, width, height, windowState) of the Window showing the Target (Default: the first Page)"""
+        return self.send("Browser.getWindowForTarget", {"targetId": target_id or self.page_target()["targetId"]})
+
+    def _isolated_world(self, target_id: str) -> Tuple[str, int]:
+        # Held while creating, so concurrent Callers dont attach twice. Evaluations themselves run without it
+        with self._world_lock:
+            session_id = self._page_sessions.get(target_id)
+            if session_id is None:
+                session_id = self._page_sessions[target_id] = self.send("Target.attachToTarget", {"targetId": target_id, "flatten": True})["sessionId"]
+            context_id = self._page_contexts.get(target_id)
+            if context_id is None:
+                frame_tree = self.send("Page.getFrameTree", session_id=session_id)
+                isolated_world = self.send("Page.createIsolatedWorld", {"frameId": frame_tree["frameTree"]["frame"]["id"], "worldName": world_name}, session_id=session_id)
+                context_id = self._page_contexts[target_id] = isolated_world["executionContextId"]
+            return session_id, context_id
+
+    def evaluate(self, expression: str, target_id: Optional[str] = None, await_promise: bool = False) -> Any:
+        """
+        Evaluates in an Isolated World of the Page Target (Default: the first Page), without Runtime.enable.
+        The World is created once & only recreated after a Navigation destroyed it. await_promise resolves a returned Promise first.
+        """
+        for attempt in range(2):
+            with self._world_lock:
+                if target_id is None and self._first_page is None:
+                    self._first_page = self.page_target()["targetId"]
+                page_target = target_id or self._first_page
+            assert page_target
+            try:
+                session_id, context_id = self._isolated_world(page_target)
+                params = {"expression": expression, "contextId": context_id, "returnByValue": True, "awaitPromise": await_promise}
+                evaluation = self.send("Runtime.evaluate", params, session_id=session_id)
+                return evaluation["result"].get("value")
+            except RuntimeError as e:
+                # Navigated: recreate the World in the same Session. Page closed (Session detached): attach again, or to the current first Page
+                with self._world_lock:
+                    self._page_contexts.pop(page_target, None)
+                    if context_destroyed not in str(e):
+                        self._page_sessions.pop(page_target, None)
+                        self._first_page = None
+                if attempt:
+                    raise
+
+    def close(self) -> None:
+        self.websocket.close()
+        self._reader.join()
+
+
+class CDPConnectionPool:
+    """One persistent CDPConnection per Debugger Address, so repeated Handle Creation skips the HTTP Lookup & WebSocket Handshake"""
+
+    def __init__(self) -> None:
+        self.connections: Dict[str, "Future[CDPConnection]"] = {}
+        self._lock = threading.Lock()
+
+    def connection(self, url: str) -> CDPConnection:
+        from .browsers import ws_url_from_url
+
+        with self._lock:
+            future = self.connections.get(url)
+            connecting = future is None or (future.done() and (future.exception() is not None or future.result().closed))
+            if connecting:
+                future = self.connections[url] = Future()
+        assert future
+
+        # Connected outside the Lock, a slow Browser doesnt block other Addresses. Concurrent Callers wait for the same Connection Attempt
+        if connecting:
+            try:
+                future.set_result(CDPConnection(ws_url_from_url(url)))
+            except BaseException as e:
+                future.set_exception(e)
+        return future.result()
+
+    def close(self) -> None:
+        with self._lock:
+            futures, self.connections = self.connections, {}
+        for future in futures.values():
+            if future.done() and future.exception() is None:
+                future.result().close()
+
+
+class AsyncCDPConnection:
+    """CDPConnection for asyncio, Responses are matched to their Requests by a Reader Task"""
+
+    def __init__(self, websocket: Any, timeout: float = 30) -> None:
+        self.websocket = websocket
+        self.timeout = timeout
+        self.loop = asyncio.get_running_loop()
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, "asyncio.Future[Dict[str, Any]]"] = {}
+        self._closed = False
+        self._page_sessions: Dict[str, str] = {}
+        self._page_contexts: Dict[str, int] = {}
+        self._first_page: Optional[str] = None
+        self._reader = asyncio.ensure_future(self._read())
+
+    @classmethod
+    async def connect(cls, ws_url: str, timeout: float = 30) -> "AsyncCDPConnection":
+        websocket = await async_connect(ws_url, max_size=None, open_timeout=timeout)
+        return cls(websocket, timeout)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def _read(self) -> None:
+        try:
+            async for message in self.websocket:
+                data = json.loads(message)
+                future = self._pending.pop(data.get("id", 0), None)
+                if future is None or future.done():
+                    continue
+
+                if "error" in data:
+                    future.set_exception(RuntimeError(f"CDP Error: {data['error'].get('message')}"))
+                else:
+                    future.set_result(data.get("result", {}))
+        except Exception:
+            pass
+        finally:
+            self._closed = True
+            pending, self._pending = self._pending, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("CDP Connection to the Browser was closed."))
+
+    async def send(self, method: str, params: Optional[Dict[str, Any]] = None, session_id: Optional[str] = None) -> Dict[str, Any]:
+        if self._closed:
+            raise ConnectionError("CDP Connection to the Browser was closed.")
+        request_id = next(self._ids)
+        future: "asyncio.Future[Dict[str, Any]]" = self.loop.create_future()
+        self._pending[request_id] = future
+
+        message: Dict[str, Any] = {"id": request_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        try:
+            await self.websocket.send(json.dumps(message))
+            return await asyncio.wait_for(future, self.timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def page_target(self) -> Dict[str, Any]:
+        for target in (await self.send("Target.getTargets"))["targetInfos"]:
+            if target["type"] == "page":
+                page_target: Dict[str, Any] = target
+                return page_target
+
+        raise ValueError("No page found to evaluate in.")
+
+    async def window_for_target(self, target_id: Optional[str] = None) -> Dict[str, Any]:
+        return await self.send("Browser.getWindowForTarget", {"targetId": target_id or (await self.page_target())["targetId"]})
+
+    async def _isolated_world(self, target_id: str) -> Tuple[str, int]:
+        session_id = self._page_sessions.get(target_id)
+        if session_id is None:
+            session_id = self._page_sessions[target_id] = (await self.send("Target.attachToTarget", {"targetId": target_id, "flatten": True}))["sessionId"]
+        context_id = self._page_contexts.get(target_id)
+        if context_id is None:
+            frame_tree = await self.send("Page.getFrameTree", session_id=session_id)
+            isolated_world = await self.send("Page.createIsolatedWorld", {"frameId": frame_tree["frameTree"]["frame"]["id"], "worldName": world_name}, session_id=session_id)
+            context_id = self._page_contexts[target_id] = isolated_world["executionContextId"]
+        return session_id, context_id
+
+    async def evaluate(self, expression: str, target_id: Optional[str] = None, await_promise: bool = False) -> Any:
+        for attempt in range(2):
+            if target_id is None and self._first_page is None:
+                self._first_page = (await self.page_target())["targetId"]
+            page_target = target_id or self._first_page
+            assert page_target
+            try:
+                session_id, context_id = await self._isolated_world(page_target)
+                params = {"expression": expression, "contextId": context_id, "returnByValue": True, "awaitPromise": await_promise}
+                evaluation = await self.send("Runtime.evaluate", params, session_id=session_id)
+                return evaluation["result"].get("value")
+            except RuntimeError as e:
+                self._page_contexts.pop(page_target, None)
+                if context_destroyed not in str(e):
+                    self._page_sessions.pop(page_target, None)
+                    self._first_page = None
+                if attempt:
+                    raise
+
+    async def close(self) -> None:
+        await self.websocket.close()
+        await self._reader
+
+
+class AsyncCDPConnectionPool:
+    """CDPConnectionPool for asyncio, Connections are bound to the Event Loop they were opened in"""
+
+    def __init__(self) -> None:
+        self.connections: Dict[Tuple[int, str], "asyncio.Task[AsyncCDPConnection]"] = {}
+
+    async def _connect(self, url: str) -> AsyncCDPConnection:
+        from .browsers import async_ws_url_from_url
+
+        return await AsyncCDPConnection.connect(await async_ws_url_from_url(url))
+
+    async def connection(self, url: str) -> AsyncCDPConnection:
+        key = (id(asyncio.get_running_loop()), url)
+        task = self.connections.get(key)
+        # Concurrent Callers await the same Connection Attempt
+        if task is None or (task.done() and (task.exception() is not None or task.result().closed)):
+            task = self.connections[key] = asyncio.ensure_future(self._connect(url))
+        return await task
+
+    async def close(self) -> None:
+        loop_id = id(asyncio.get_running_loop())
+        for key in [key for key in self.connections if key[0] == loop_id]:
+            task = self.connections.pop(key)
+            if task.done() and task.exception() is None:
+                await task.result().close()
+
+
+cdp_pool = CDPConnectionPool()
+async_cdp_pool = AsyncCDPConnectionPool()
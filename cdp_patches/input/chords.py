@@ -0,0 +1,48 @@
+import re
+from typing import List, Sequence, Tuple
+
+modifier_aliases = {
+    "ctrl": "ctrl",
+    "control": "ctrl",
+    "shift": "shift",
+    "alt": "alt",
+    "option": "alt",
+    "meta": "meta",
+    "super": "meta",
+    "win": "meta",
+    "cmd": "meta",
+    "command": "meta",
+}
+# Splits "ctrl+shift+a" into its Parts, a trailing "+" is the Plus Key itself (e.g. "ctrl++")
+chord_regex = re.compile(r"(?:^|(?<=\+))(\+|[^+]+)")
+
+
+def normalize_modifiers(modifiers: Sequence[str]) -> List[str]:
+    normalized: List[str] = []
+    for modifier in modifiers:
+        name = modifier_aliases.get(modifier.strip().lower())
+        if not name:
+            raise ValueError(f"Unknown modifier: {modifier}")
+        if name not in normalized:
+            normalized.append(name)
+    return normalized
+
+
+def resolve_key(key: str) -> str:
+    """Resolves Key Names like "enter" or "PAGE_UP" to the KeyboardCodes of the current OS, single Characters stay as they are"""
+    if len(key) == 1:
+        return key
+
+    from cdp_patches.input import KeyboardCodes
+
+    code: str = getattr(KeyboardCodes, key.strip().upper().replace(" ", "_"), key)
+    return code
+
+
+def parse_chord(chord: str) -> Tuple[List[str], str]:
+    parts = [part.strip() for part in chord_regex.findall(chord) if part.strip()]
+    if not parts:
+        raise ValueError(f"Invalid chord: {chord!r}")
+
+    *modifiers, key = parts
+    return normalize_modifiers(modifiers), resolve_key(key)
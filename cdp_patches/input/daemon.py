@@ -0,0 +1,503 @@
+"""
+Input Daemon owning the X Connections & LinuxBase Instances of a Host, serving Gestures of many Worker Processes over a Unix Domain Socket.
+
+Run it with `python -m cdp_patches.input.daemon` and use SyncDaemonInput/AsyncDaemonInput instead of SyncInput/AsyncInput in the Workers.
+Gestures get compiled (Trajectories, Keystroke Timings) in the Worker and dispatched by the Daemon, one Timeline at a time,
+as all Windows on a Display share the same Pointer & Keyboard Focus.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import errno
+import os
+import socket
+import socketserver
+import stat
+import struct
+import tempfile
+import threading
+from typing import IO, Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+
+from cdp_patches.input.exceptions import WindowClosedException
+from cdp_patches.input.os_base.registry import BackendRegistry, SharedBackend
+from cdp_patches.input.rate_control import RateController
+from cdp_patches.input.timeline import TimelineEvent, async_run_in_thread
+
+from .async_input import AsyncInput
+from .sync_input import SyncInput
+
+# Frame: Opcode (1 Byte) + Payload Length (4 Bytes) + Payload
+HEADER = struct.Struct("!BI")
+ATTACH = struct.Struct("!Id")  # PID, Scale Factor (+ X Backend Name)
+POINT = struct.Struct("!Bii")  # Button, x, y
+MOVE = struct.Struct("!ii")
+SCROLL = struct.Struct("!Bi")  # Direction, Amount
+REGION = struct.Struct("!iiii")  # x, y, width, height (-1 for None)
+SHAPE = struct.Struct("!III")  # height, width, bytes per pixel
+COUNT = struct.Struct("!I")
+STEP = struct.Struct("!i")
+SCALE = struct.Struct("!d")
+EVENT = struct.Struct("!dBiiiiH")  # time, kind, x, y, amount, step, key length (+ key)
+
+# Requests
+OP_ATTACH = 0x01
+OP_GET_WINDOW = 0x02
+OP_SET_SCALE = 0x03
+OP_DOWN = 0x10
+OP_UP = 0x11
+OP_MOVE = 0x12
+OP_SCROLL = 0x13
+OP_KEYSTROKES = 0x14
+OP_CHORD = 0x15  # Modifiers joined by "+", NUL, Key
+OP_PRESS_MODIFIERS = 0x16
+OP_RELEASE_MODIFIERS = 0x17
+OP_PASTE = 0x18
+OP_TIMELINE = 0x20
+OP_CANCEL = 0x21
+OP_CAPTURE = 0x30
+# Replies
+OP_OK = 0x80
+OP_ERROR = 0x81
+OP_STEP = 0x82
+OP_DONE = 0x83
+
+event_kinds: Tuple[str, ...] = ("move", "down", "up", "key", "scroll", "step")
+buttons: Tuple[str, ...] = ("left", "right", "middle")
+directions: Tuple[str, ...] = ("up", "down", "left", "right")
+# Exceptions re-raised in the Client, everything else becomes a RuntimeError
+remote_exceptions: Dict[str, type] = {
+    "WindowClosedException": WindowClosedException,
+    "AssertionError": AssertionError,
+    "ValueError": ValueError,
+    "NotImplementedError": NotImplementedError,
+    "TimeoutError": TimeoutError,
+}
+
+
+def runtime_dir() -> str:
+    """$XDG_RUNTIME_DIR, or a private (0700) Directory of the User in the Temp Dir, so other Users cant connect to or replace the Socket"""
+    xdg_runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if xdg_runtime_dir and os.path.isdir(xdg_runtime_dir):
+        return xdg_runtime_dir
+
+    path = os.path.join(tempfile.gettempdir(), f"cdp_patches-{os.getuid()}")
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    # Dont follow a Symlink or use a Directory another User created in its Place
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"{path} must be a Directory only accessible by the current User.")
+    return path
+
+
+def default_socket_path(display_name: Optional[str] = None) -> str:
+    display_name = display_name or os.getenv("DISPLAY") or ":0"
+    return os.path.join(runtime_dir(), f"cdp_patches_input{display_name.replace(':', '_')}.sock")
+
+
+def create_linux_base(pid: int, x_backend: str) -> Any:
+    from cdp_patches.input.os_base.linux import LinuxBase
+
+    # Handlers scale their own Coordinates, so Clients with different Scale Factors can share it
+    return LinuxBase(pid, 1.0, x_backend=x_backend)  # type: ignore[arg-type]
+
+
+def encode_timeline(events: Sequence[TimelineEvent]) -> bytes:
+    chunks: List[bytes] = [COUNT.pack(len(events))]
+    for event in events:
+        key = event.key.encode()
+        chunks.append(EVENT.pack(event.time, event_kinds.index(event.kind), event.x, event.y, event.amount, event.step, len(key)))
+        chunks.append(key)
+    return b"".join(chunks)
+
+
+def decode_timeline(payload: bytes) -> List[TimelineEvent]:
+    (count,) = COUNT.unpack_from(payload)
+    offset = COUNT.size
+    events: List[TimelineEvent] = []
+    for _ in range(count):
+        time, kind, x, y, amount, step, key_length = EVENT.unpack_from(payload, offset)
+        offset += EVENT.size
+        key_end = offset + key_length
+        key = payload[offset:key_end].decode()
+        offset = key_end
+        events.append(TimelineEvent(time, event_kinds[kind], x, y, key, amount, step))  # type: ignore[arg-type]
+    return events
+
+
+def read_frame(stream: IO[bytes]) -> Optional[Tuple[int, bytes]]:
+    header = stream.read(HEADER.size)
+    if len(header) < HEADER.size:
+        return None
+    opcode, length = HEADER.unpack(header)
+    payload = stream.read(length) if length else b""
+    if len(payload) < length:
+        return None
+    return opcode, payload
+
+
+def write_frame(stream: IO[bytes], opcode: int, payload: bytes = b"") -> None:
+    stream.write(HEADER.pack(opcode, len(payload)) + payload)
+    stream.flush()
+
+
+class InputDaemonHandler(socketserver.StreamRequestHandler):
+    server: InputDaemon
+    # Per-Connection View over the shared Base, scaling the Coordinates with the Scale Factor of this Client
+    base: Optional[SharedBackend] = None
+    timeline_thread: Optional[threading.Thread] = None
+    cancel_event: Optional[threading.Event] = None
+
+    def setup(self) -> None:
+        super().setup()
+        self.write_lock = threading.Lock()
+
+    def send(self, opcode: int, payload: bytes = b"") -> None:
+        with self.write_lock:
+            write_frame(self.wfile, opcode, payload)
+
+    def send_error(self, error: BaseException) -> None:
+        self.send(OP_ERROR, f"{type(error).__name__}\0{error}".encode())
+
+    def handle(self) -> None:
+        try:
+            while True:
+                frame = read_frame(self.rfile)
+                if frame is None:
+                    return
+                opcode, payload = frame
+
+                if opcode == OP_CANCEL:
+                    if self.cancel_event:
+                        self.cancel_event.set()
+                    continue
+                # One Request at a Time per Client, only Cancellations are handled during a running Timeline
+                if self.timeline_thread:
+                    self.timeline_thread.join()
+                    self.timeline_thread = None
+
+                try:
+                    if opcode == OP_ATTACH:
+                        self.attach(payload)
+                    elif self.base is None:
+                        raise ValueError("Client must attach to a Browser PID first.")
+                    elif opcode == OP_TIMELINE:
+                        self.start_timeline(decode_timeline(payload))
+                    else:
+                        self.send(OP_OK, self.execute(opcode, payload))
+                except Exception as e:
+                    self.send_error(e)
+        finally:
+            if self.cancel_event:
+                self.cancel_event.set()
+            if self.timeline_thread:
+                self.timeline_thread.join()
+            if self.base:
+                self.release_base()
+
+    def attach(self, payload: bytes) -> None:
+        pid, scale_factor = ATTACH.unpack_from(payload)
+        backend_offset = ATTACH.size
+        x_backend = payload[backend_offset:].decode() or "xlib"
+        if self.base:
+            self.release_base()
+
+        self.base = self.server.registry.acquire((pid, x_backend), lambda: self.server.base_factory(pid, x_backend), scale_factor)
+        self.send(OP_OK)
+
+    def release_base(self) -> None:
+        assert self.base
+        base, self.base = self.base, None
+        # The last Client closes the shared Base, wait for running Dispatches on the Display
+        with self.server.dispatch_lock:
+            base.close()
+
+    def execute(self, opcode: int, payload: bytes) -> bytes:
+        base = self.base
+        assert base
+        if opcode == OP_PASTE:
+            # Only sending the Paste is dispatched exclusively, other Clients keep sending Input while the Browser reads it
+            with self.server.dispatch_lock:
+                finish = base.send_paste(payload.decode())
+            finish()
+            return b""
+        with self.server.dispatch_lock:
+            if opcode == OP_GET_WINDOW:
+                return COUNT.pack(base.get_window().id)
+            elif opcode == OP_SET_SCALE:
+                # Only this Client is affected, other Clients of the Browser keep their Scale Factor
+                (base.scale_factor,) = SCALE.unpack(payload)
+            elif opcode in (OP_DOWN, OP_UP):
+                button, x, y = POINT.unpack(payload)
+                (base.down if opcode == OP_DOWN else base.up)(button=buttons[button], x=x, y=y)
+            elif opcode == OP_MOVE:
+                x, y = MOVE.unpack(payload)
+                base.move(x=x, y=y)
+            elif opcode == OP_SCROLL:
+                direction, amount = SCROLL.unpack(payload)
+                base.scroll(direction=directions[direction], amount=amount)
+            elif opcode == OP_KEYSTROKES:
+                base.send_keystrokes(payload.decode())
+            elif opcode == OP_CHORD:
+                joined_modifiers, _, key = payload.decode().partition("\0")
+                base.send_chord([modifier for modifier in joined_modifiers.split("+") if modifier], key)
+            elif opcode in (OP_PRESS_MODIFIERS, OP_RELEASE_MODIFIERS):
+                modifiers = [modifier for modifier in payload.decode().split("+") if modifier]
+                (base.press_modifiers if opcode == OP_PRESS_MODIFIERS else base.release_modifiers)(modifiers)
+            elif opcode == OP_CAPTURE:
+                x, y, width, height = REGION.unpack(payload)
+                pixels: np.ndarray = base.capture(x=x, y=y, width=None if width < 0 else width, height=None if height < 0 else height)
+                return SHAPE.pack(*pixels.shape) + pixels.tobytes()
+            else:
+                raise ValueError(f"Unknown Opcode: {opcode:#x}")
+        return b""
+
+    def start_timeline(self, events: List[TimelineEvent]) -> None:
+        cancel_event = self.cancel_event = threading.Event()
+
+        def run() -> None:
+            try:
+                assert self.base
+                with self.server.dispatch_lock:
+                    completed = self.base.dispatch_timeline(events, cancel_event=cancel_event, on_step=lambda step: self.send(OP_STEP, STEP.pack(step)))
+                self.send(OP_DONE, bytes([completed]))
+            except Exception as e:
+                self.send_error(e)
+
+        # Dispatch in the Background, so OP_CANCEL can still be read from the Socket
+        self.timeline_thread = threading.Thread(target=run, daemon=True)
+        self.timeline_thread.start()
+
+
+class InputDaemon(socketserver.ThreadingUnixStreamServer):
+    """
+    Shares one LinuxBase per (PID, X Backend) between all Clients & serializes their Dispatches on the Display.
+    base_factory(pid, x_backend) creates the shared Bases, it defaults to a LinuxBase.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Optional[str] = None, base_factory: Callable[[int, str], Any] = create_linux_base) -> None:
+        self.socket_path = socket_path or default_socket_path()
+        self.base_factory = base_factory
+        self.remove_stale_socket()
+
+        # All Windows on a Display share one Pointer & Keyboard Focus, so Gestures must not interleave
+        self.dispatch_lock = threading.RLock()
+        self.registry = BackendRegistry()
+        super().__init__(self.socket_path, InputDaemonHandler)
+
+    def remove_stale_socket(self) -> None:
+        """Removes the Socket left behind by a crashed Daemon, but never the Socket of a running one"""
+        if not os.path.exists(self.socket_path):
+            return
+        if not stat.S_ISSOCK(os.lstat(self.socket_path).st_mode):
+            raise FileExistsError(errno.EEXIST, "Socket Path exists and isn't a Socket.", self.socket_path)
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(self.socket_path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.unlink(self.socket_path)
+                return
+        raise OSError(errno.EADDRINUSE, "An Input Daemon is already listening on the Socket.", self.socket_path)
+
+    def server_bind(self) -> None:
+        super().server_bind()
+        # Only the User running the Daemon may send Input through it
+        os.chmod(self.socket_path, 0o600)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.registry.close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+class DaemonBase:
+    """Client-Side Stand-In for LinuxBase, forwarding every Call to the Input Daemon"""
+
+    def __init__(self, pid: int, scale_factor: float, x_backend: Literal["xlib", "xcb"] = "xlib", socket_path: Optional[str] = None) -> None:
+        self.pid = pid
+        self._scale_factor = scale_factor
+        self.socket_path = socket_path or default_socket_path()
+        # The Daemon serializes all Dispatches on the Display, so Clients keep the full Point Density
+        self.rate_controller = RateController()
+
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.connect(self.socket_path)
+        self.rfile = self.socket.makefile("rb")
+        self.wfile = self.socket.makefile("wb")
+        self._request_lock = threading.RLock()
+        self._write_lock = threading.Lock()
+
+        self._request(OP_ATTACH, ATTACH.pack(pid, scale_factor) + x_backend.encode())
+
+    @property
+    def scale_factor(self) -> float:
+        return self._scale_factor
+
+    @scale_factor.setter
+    def scale_factor(self, scale_value: float) -> None:
+        self._scale_factor = scale_value
+        self._request(OP_SET_SCALE, SCALE.pack(scale_value))
+
+    def _send(self, opcode: int, payload: bytes = b"") -> None:
+        with self._write_lock:
+            write_frame(self.wfile, opcode, payload)
+
+    def _receive(self) -> Tuple[int, bytes]:
+        frame = read_frame(self.rfile)
+        if frame is None:
+            raise ConnectionError("Connection to the Input Daemon was closed.")
+        opcode, payload = frame
+        if opcode == OP_ERROR:
+            name, _, message = payload.decode().partition("\0")
+            raise remote_exceptions.get(name, RuntimeError)(message)
+        return opcode, payload
+
+    def _request(self, opcode: int, payload: bytes = b"") -> bytes:
+        with self._request_lock:
+            self._send(opcode, payload)
+            return self._receive()[1]
+
+    def close(self) -> None:
+        self.rfile.close()
+        self.wfile.close()
+        self.socket.close()
+
+    def get_window(self) -> int:
+        (window_id,) = COUNT.unpack(self._request(OP_GET_WINDOW))
+        return int(window_id)
+
+    async def async_get_window(self) -> int:
+        return await asyncio.get_running_loop().run_in_executor(None, self.get_window)
+
+    def down(self, button: Literal["left", "right", "middle"], x: int, y: int) -> None:
+        self._request(OP_DOWN, POINT.pack(buttons.index(button), x, y))
+
+    def up(self, button: Literal["left", "right", "middle"], x: int, y: int) -> None:
+        self._request(OP_UP, POINT.pack(buttons.index(button), x, y))
+
+    def move(self, x: int, y: int) -> None:
+        self._request(OP_MOVE, MOVE.pack(x, y))
+
+    def scroll(self, direction: Literal["up", "down", "left", "right"], amount: int) -> None:
+        self._request(OP_SCROLL, SCROLL.pack(directions.index(direction), amount))
+
+    def send_keystrokes(self, text: str) -> None:
+        self._request(OP_KEYSTROKES, text.encode())
+
+    def press_modifiers(self, modifiers: Sequence[str]) -> None:
+        self._request(OP_PRESS_MODIFIERS, "+".join(modifiers).encode())
+
+    def release_modifiers(self, modifiers: Sequence[str]) -> None:
+        self._request(OP_RELEASE_MODIFIERS, "+".join(modifiers).encode())
+
+    def paste(self, text: str) -> None:
+        self._request(OP_PASTE, text.encode())
+
+    def send_chord(self, modifiers: Sequence[str], key: str) -> None:
+        self._request(OP_CHORD, ("+".join(modifiers) + "\0" + key).encode())
+
+    def send_keystrokes_timeline(self, keys: Sequence[str], timestamps: np.ndarray) -> None:
+        self.dispatch_timeline([TimelineEvent(timestamp, "key", key=key) for key, timestamp in zip(keys, timestamps.tolist())])
+
+    async def async_send_keystrokes_timeline(self, keys: Sequence[str], timestamps: np.ndarray) -> None:
+        await self.async_dispatch_timeline([TimelineEvent(timestamp, "key", key=key) for key, timestamp in zip(keys, timestamps.tolist())])
+
+    def index_windows(self) -> List[Any]:
+        raise NotImplementedError("Window Indexing is not supported through the Input Daemon.")
+
+    def bind_window(self, window: Any) -> Any:
+        raise NotImplementedError("Window Binding is not supported through the Input Daemon.")
+
+    def bind_cdp_window(self, cdp_window_id: int, bounds: Dict[str, Any]) -> Any:
+        raise NotImplementedError("Window Binding is not supported through the Input Daemon.")
+
+    def capture(self, x: int = 0, y: int = 0, width: Optional[int] = None, height: Optional[int] = None) -> np.ndarray:
+        payload = self._request(OP_CAPTURE, REGION.pack(x, y, -1 if width is None else width, -1 if height is None else height))
+        shape = SHAPE.unpack_from(payload)
+        return np.frombuffer(payload, dtype=np.uint8, offset=SHAPE.size).reshape(shape)
+
+    def dispatch_timeline(self, events: Sequence[TimelineEvent], cancel_event: Optional[threading.Event] = None, on_step: Optional[Callable[[int], None]] = None) -> bool:
+        with self._request_lock:
+            self._send(OP_TIMELINE, encode_timeline(events))
+
+            finished = threading.Event()
+            if cancel_event:
+                # Forward a Cancellation to the Daemon while waiting for its Replies
+                def forward_cancel() -> None:
+                    while not finished.is_set():
+                        if cancel_event.wait(0.05):
+                            self._send(OP_CANCEL)
+                            return
+
+                threading.Thread(target=forward_cancel, daemon=True).start()
+
+            try:
+                while True:
+                    opcode, payload = self._receive()
+                    if opcode == OP_STEP:
+                        if on_step:
+                            on_step(STEP.unpack(payload)[0])
+                    elif opcode == OP_DONE:
+                        return bool(payload[0])
+            finally:
+                finished.set()
+
+    async def async_dispatch_timeline(self, events: Sequence[TimelineEvent], cancel_event: Optional[asyncio.Event] = None, on_step: Optional[Callable[[int], None]] = None) -> bool:
+        return await async_run_in_thread(self.dispatch_timeline, events, cancel_event=cancel_event, on_step=on_step)
+
+
+class SyncDaemonInput(SyncInput):
+    """SyncInput dispatching through the Input Daemon instead of its own X Connection"""
+
+    def __init__(self, *args: Any, socket_path: Optional[str] = None, **kwargs: Any) -> None:
+        self.socket_path = socket_path
+        super().__init__(*args, **kwargs)
+
+    def _create_base(self, x_backend: Literal["xlib", "xcb"]) -> DaemonBase:  # type: ignore[override]
+        if self.multi_pointer:
+            raise NotImplementedError("The Input Daemon serializes all Input on the Display, multi_pointer is not supported.")
+        assert self.pid
+        return DaemonBase(self.pid, self._scale_factor, x_backend=x_backend, socket_path=self.socket_path)
+
+
+class AsyncDaemonInput(AsyncInput):
+    """AsyncInput dispatching through the Input Daemon instead of its own X Connection"""
+
+    def __init__(self, *args: Any, socket_path: Optional[str] = None, **kwargs: Any) -> None:
+        self.socket_path = socket_path
+        super().__init__(*args, **kwargs)
+
+    def _create_base(self, x_backend: Literal["xlib", "xcb"]) -> DaemonBase:  # type: ignore[override]
+        if self.multi_pointer:
+            raise NotImplementedError("The Input Daemon serializes all Input on the Display, multi_pointer is not supported.")
+        assert self.pid
+        return DaemonBase(self.pid, self._scale_factor, x_backend=x_backend, socket_path=self.socket_path)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve CDP-Patches Input for all Browsers on this X Display over a Unix Domain Socket.")
+    parser.add_argument("--socket", default=None, help=f"Socket Path (Default: {default_socket_path()})")
+    args = parser.parse_args(argv)
+
+    server = InputDaemon(args.socket)
+    print(f"CDP-Patches Input Daemon listening on {server.socket_path}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+from typing import List, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+
+PointType = TypeVar("PointType")
+
+# Animation Frames recorded by the Probe, the first Interval is skipped (it starts mid-Frame)
+probe_frames = 12
+
+
+def frame_probe_script(timeout: float) -> str:
+    """
+    Promise resolving with the requestAnimationFrame Timestamps of the next Frames, or the ones recorded within timeout Seconds (Background Pages dont render).
+    Evaluated once (awaiting the Promise), so nothing is left behind in the Page.
+    """
+    return f"""new Promise((resolve) => {{
+    const frames = [];
+    const timer = setTimeout(() => resolve(frames), {int(timeout * 1000)});
+    const step = (timestamp) => {{
+        frames.push(timestamp);
+        if (frames.length < {probe_frames}) {{
+            requestAnimationFrame(step);
+        }} else {{
+            clearTimeout(timer);
+            resolve(frames);
+        }}
+    }};
+    requestAnimationFrame(step);
+}})"""
+
+
+def refresh_rate(timestamps: Sequence[float]) -> Optional[float]:
+    """Refresh Rate in Hz from requestAnimationFrame Timestamps (Milliseconds). None if too few Frames were recorded"""
+    intervals = np.diff(np.asarray(timestamps, dtype=np.float64))[1:]
+    intervals = intervals[intervals > 0]
+    if len(intervals) < 2:
+        return None
+    # Median, so single dropped Frames dont halve the Rate
+    return float(1000 / np.median(intervals))
+
+
+def frame_align(points: Sequence[PointType], interval: float, frame_interval: float) -> Tuple[List[PointType], List[float]]:
+    """
+    Keeps the last Point of every Frame (Chrome coalesces the others into the same pointermove) & aligns it to the Start of its Frame.
+    Points are originally sent every interval Seconds. Returns the kept Points & their Offsets in Seconds from the Start of the Movement.
+    """
+    if not points or interval <= 0 or frame_interval <= 0:
+        return list(points), [i * interval for i in range(len(points))]
+
+    frames = np.floor(np.arange(len(points)) * interval / frame_interval + 1e-9).astype(np.int64)
+    last_in_frame = np.append(frames[1:] != frames[:-1], True)
+    kept = np.flatnonzero(last_in_frame)
+    return [points[index] for index in kept.tolist()], (frames[kept] * frame_interval).tolist()
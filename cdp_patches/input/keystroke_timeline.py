@@ -0,0 +1,118 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# QWERTY Neighbours for realistic Typos & Hand Assignment for Digraph Timings
+keyboard_rows = ["1234567890-=", "qwertyuiop[]", "asdfghjkl;'", "zxcvbnm,./"]
+left_hand_keys = set("12345qwertasdfgzxcvb`~!@#$%QWERTASDFGZXCVB")
+neighbour_keys: Dict[str, str] = {}
+for row_index, row in enumerate(keyboard_rows):
+    for column, char in enumerate(row):
+        neighbours = ""
+        for neighbour_row, neighbour_column in ((row_index, column - 1), (row_index, column + 1), (row_index - 1, column), (row_index + 1, column)):
+            if 0 <= neighbour_row < len(keyboard_rows) and 0 <= neighbour_column < len(keyboard_rows[neighbour_row]):
+                neighbours += keyboard_rows[neighbour_row][neighbour_column]
+        neighbour_keys[char] = neighbours
+
+
+def fill_segments(text: str) -> List[Tuple[bool, str]]:
+    """Splits a Text into (is_key, Segment) for Fills: Key Names like {ENTER} still get pressed, the Text between them gets pasted"""
+    return [(segment[0] == "{" and segment[-1] == "}", segment) for segment in re.split(r"({[^{}]*})", text) if segment]
+
+
+class KeystrokeTimeline:
+    """Tokenizes a Text once & precomputes the Dispatch Time of every Key, so it can be typed at a precise WPM"""
+
+    selective_modifiers_regex = re.compile(r"{[^{}]*}|.")
+    # Relative Delay Factors
+    same_key_factor: float = 0.8
+    hand_alternation_factor: float = 0.85
+    same_hand_factor: float = 1.1
+    word_start_factor: float = 2.0
+    typo_correction_factor: float = 2.5
+    jitter_sigma: float = 0.3
+
+    def __init__(
+        self,
+        text: str,
+        wpm: float,
+        rng: Optional[np.random.Generator] = None,
+        typo_rate: float = 0.0,
+        word_pause: Optional[float] = None,
+        backspace_key: str = "{BACKSPACE}",
+    ) -> None:
+        if wpm <= 0:
+            raise ValueError("wpm must be greater than 0")
+        if not 0 <= typo_rate <= 1:
+            raise ValueError("typo_rate must be in range [0,1]")
+
+        self.text = text
+        self.wpm = wpm
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.tokens: List[str] = self.selective_modifiers_regex.findall(text)
+
+        self.keys, factors = self.generate_keys(typo_rate, backspace_key)
+        self.intervals = self.generate_intervals(factors, word_pause)
+        self.timestamps = np.cumsum(self.intervals)
+
+    @property
+    def duration(self) -> float:
+        return float(self.timestamps[-1]) if len(self.timestamps) else 0.0
+
+    def generate_keys(self, typo_rate: float, backspace_key: str) -> Tuple[List[str], np.ndarray]:
+        """Generates the Keys to send (including optional Typos & their Corrections) and their relative Delay Factors"""
+        typo_draws = self.rng.random(len(self.tokens))
+        keys: List[str] = []
+        factors: List[float] = []
+
+        previous = ""
+        for token, typo_draw in zip(self.tokens, typo_draws):
+            factor = self.digraph_factor(previous, token)
+            if previous == " ":
+                factor *= self.word_start_factor
+
+            neighbours = neighbour_keys.get(token.lower(), "")
+            if typo_draw < typo_rate and neighbours:
+                typo = neighbours[int(self.rng.integers(len(neighbours)))]
+                keys += [typo.upper() if token.isupper() else typo, backspace_key]
+                factors += [factor, self.typo_correction_factor]
+                factor = 1.0
+
+            keys.append(token)
+            factors.append(factor)
+            previous = token
+
+        return keys, np.asarray(factors, dtype=float)
+
+    def digraph_factor(self, previous: str, current: str) -> float:
+        if not previous or len(previous) != 1 or len(current) != 1 or not previous.isalpha() or not current.isalpha():
+            return 1.0
+        if previous.lower() == current.lower():
+            return self.same_key_factor
+        if (previous in left_hand_keys) != (current in left_hand_keys):
+            return self.hand_alternation_factor
+        return self.same_hand_factor
+
+    def generate_intervals(self, factors: np.ndarray, word_pause: Optional[float]) -> np.ndarray:
+        """Generates the Delays before every Key, scaled so the Text is typed at exactly the target WPM"""
+        if not len(factors):
+            return np.zeros(0)
+
+        # Lognormal Jitter with a mean of 1
+        jitter = self.rng.lognormal(-(self.jitter_sigma**2) / 2, self.jitter_sigma, size=len(factors))
+        intervals = factors * jitter
+        intervals[0] = 0.0
+
+        # One Word = 5 Characters. The first Key is sent immediately.
+        target_duration = (len(self.tokens) - 1) * 60 / (self.wpm * 5)
+        total = intervals.sum()
+        if total > 0:
+            intervals *= target_duration / total
+
+        # Explicit Pauses between Words (the timeout of type())
+        if word_pause:
+            word_starts = np.fromiter((i > 0 and self.keys[i - 1] == " " for i in range(len(self.keys))), dtype=bool, count=len(self.keys))
+            intervals[word_starts] += word_pause
+
+        return intervals
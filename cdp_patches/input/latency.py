@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from cdp_patches import is_windows
+
+from .browsers import get_async_evaluator, get_sync_evaluator
+
+if TYPE_CHECKING:
+    from .async_input import AsyncInput
+    from .sync_input import SyncInput
+
+# X Event Types (see Xlib.X)
+KEY_PRESS, KEY_RELEASE, BUTTON_PRESS, BUTTON_RELEASE, MOTION_NOTIFY = 2, 3, 4, 5, 6
+# DOM Events, which Chrome coalesces per Frame (only the latest Injection before them is correlated)
+coalesced_event_types = ("mousemove", "wheel")
+
+# Installed in the (isolated) Execution Context, stores [type, timeStamp, performance.now()] of every Input Event
+listener_script = """(() => {
+    const events = [];
+    const types = ["mousemove", "mousedown", "mouseup", "wheel", "keydown", "keyup"];
+    const listener = (e) => events.push([e.type, e.timeStamp, performance.now()]);
+    for (const type of types) window.addEventListener(type, listener, {capture: true, passive: true});
+    window.__cdpPatchesLatency = () => {
+        for (const type of types) window.removeEventListener(type, listener, {capture: true});
+        return events;
+    };
+    return performance.timeOrigin;
+})()"""
+collect_script = "window.__cdpPatchesLatency()"
+
+
+def injected_dom_type(event_type: int, detail: int) -> Optional[str]:
+    if event_type == MOTION_NOTIFY:
+        return "mousemove"
+    elif event_type == KEY_PRESS:
+        return "keydown"
+    elif event_type == KEY_RELEASE:
+        return "keyup"
+    elif event_type in (BUTTON_PRESS, BUTTON_RELEASE) and detail in (4, 5, 6, 7):
+        # Scroll Buttons, only the Press triggers a Wheel Event
+        return "wheel" if event_type == BUTTON_PRESS else None
+    elif event_type == BUTTON_PRESS:
+        return "mousedown"
+    elif event_type == BUTTON_RELEASE:
+        return "mouseup"
+    return None
+
+
+class LatencyStats(NamedTuple):
+    samples: int
+    coalesced: int  # Injections merged into another DOM Event
+    mean: float  # Milliseconds
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+def correlate(injections: Sequence[Tuple[str, float]], dom_events: Sequence[Tuple[str, float]]) -> Dict[str, Tuple[List[float], int]]:
+    """Pairs every DOM Event with the Injection(s) before it. Returns the Latencies & the Count of coalesced Injections per Event Type"""
+    results: Dict[str, Tuple[List[float], int]] = {}
+    for event_type in sorted({event_type for event_type, _ in dom_events}):
+        injected = sorted(timestamp for injected_type, timestamp in injections if injected_type == event_type)
+        received = sorted(timestamp for dom_type, timestamp in dom_events if dom_type == event_type)
+        latencies: List[float] = []
+        coalesced = 0
+
+        index = 0
+        for timestamp in received:
+            pending = index
+            while pending < len(injected) and injected[pending] <= timestamp:
+                pending += 1
+            if pending == index:
+                # Not caused by us (e.g. a real User Input)
+                continue
+
+            if event_type in coalesced_event_types:
+                latencies.append(timestamp - injected[pending - 1])
+                coalesced += pending - index - 1
+                index = pending
+            else:
+                latencies.append(timestamp - injected[index])
+                index += 1
+
+        results[event_type] = (latencies, coalesced)
+    return results
+
+
+class InjectionRecorder:
+    """Stand-In for the X Connection of a LinuxBase, timestamping every fake_input with perf_counter_ns"""
+
+    def __init__(self, connection: Any) -> None:
+        self.connection = connection
+        self.injections: List[Tuple[str, int]] = []
+
+    def fake_input(self, event_type: int, detail: int = 0, x: int = 0, y: int = 0) -> None:
+        dom_type = injected_dom_type(event_type, detail)
+        if dom_type:
+            self.injections.append((dom_type, time.perf_counter_ns()))
+        self.connection.fake_input(event_type, detail, x=x, y=y)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.connection, name)
+
+
+class BaseLatencyProbe:
+    """Measures the Latency from fake_input to the DOM Event, per Event Type"""
+
+    settle_timeout: float = 0.2
+    recorder: Optional[InjectionRecorder] = None
+    time_origin: float = 0.0
+    dom_events: List[Tuple[str, float, float]]
+
+    def __init__(self, input_handle: Any) -> None:
+        if is_windows:
+            raise NotImplementedError("Latency Probes are only supported on Linux.")
+        if not input_handle.browser:
+            raise ValueError("Latency Probes need the browser the Input Handle was created with.")
+        if not hasattr(input_handle.base, "connection"):
+            raise NotImplementedError(f"Latency Probes are not supported for {type(input_handle.base).__name__}.")
+
+        self.input = input_handle
+        self.dom_events = []
+        self.clock_offset_ns = 0
+
+    @staticmethod
+    def measure_clock_offset(samples: int = 25) -> int:
+        """Offset from perf_counter_ns to the Unix Epoch (time_ns), which performance.timeOrigin is based on"""
+        offsets = []
+        for _ in range(samples):
+            start = time.perf_counter_ns()
+            epoch = time.time_ns()
+            end = time.perf_counter_ns()
+            offsets.append(epoch - (start + end) // 2)
+        return int(statistics.median(offsets))
+
+    def _start_recording(self, time_origin: float) -> None:
+        self.time_origin = time_origin
+        self.clock_offset_ns = self.measure_clock_offset()
+        self.recorder = InjectionRecorder(self.base.connection)
+        self.base.connection = self.recorder
+
+    def _stop_recording(self) -> None:
+        if self.recorder:
+            self.base.connection = self.recorder.connection
+
+    @property
+    def base(self) -> Any:
+        # The Connection belongs to the shared Backend, not to the Handles View of it
+        return getattr(self.input.base, "backend", self.input.base)
+
+    def report(self, clock: Literal["dispatch", "timestamp"] = "dispatch") -> Dict[str, LatencyStats]:
+        """
+        Latency Distributions per DOM Event Type, in Milliseconds.
+        dispatch: until the Listener ran (performance.now()), timestamp: until the Event´s timeStamp (the Time Chrome received it)
+        """
+        if self.recorder is None:
+            raise ValueError("Latency Probe was never started.")
+
+        injections = [(event_type, (timestamp + self.clock_offset_ns) / 1e6) for event_type, timestamp in self.recorder.injections]
+        dom_events = [(event_type, self.time_origin + (dispatched if clock == "dispatch" else timestamp)) for event_type, timestamp, dispatched in self.dom_events]
+
+        stats: Dict[str, LatencyStats] = {}
+        for event_type, (latencies, coalesced) in correlate(injections, dom_events).items():
+            if not latencies:
+                continue
+            values = np.asarray(latencies)
+            p50, p95, p99 = np.percentile(values, (50, 95, 99)).tolist()
+            stats[event_type] = LatencyStats(len(values), coalesced, float(values.mean()), p50, p95, p99, float(values.max()))
+        return stats
+
+
+class SyncLatencyProbe(BaseLatencyProbe):
+    input: SyncInput
+
+    def __init__(self, input_handle: SyncInput) -> None:
+        super().__init__(input_handle)
+
+    def start(self) -> None:
+        self.evaluate = get_sync_evaluator(self.input.browser)  # type: ignore[arg-type]
+        self._start_recording(float(self.evaluate(listener_script)))
+
+    def stop(self) -> None:
+        # Let in-flight Events arrive
+        time.sleep(self.settle_timeout)
+        self._stop_recording()
+        with self.evaluate:
+            self.dom_events = [tuple(event) for event in self.evaluate(collect_script)]  # type: ignore[misc]
+
+    def __enter__(self) -> SyncLatencyProbe:
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+
+class AsyncLatencyProbe(BaseLatencyProbe):
+    input: AsyncInput
+
+    def __init__(self, input_handle: AsyncInput) -> None:
+        super().__init__(input_handle)
+
+    async def start(self) -> None:
+        self.evaluate = await get_async_evaluator(self.input.browser)  # type: ignore[arg-type]
+        self._start_recording(float(await self.evaluate(listener_script)))
+
+    async def stop(self) -> None:
+        await asyncio.sleep(self.settle_timeout)
+        self._stop_recording()
+        async with self.evaluate:
+            self.dom_events = [tuple(event) for event in await self.evaluate(collect_script)]  # type: ignore[misc]
+
+    async def __aenter__(self) -> AsyncLatencyProbe:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.stop()
@@ -1,6 +1,5 @@
 import math
-import random
-from typing import Any, Callable, List, NoReturn, Tuple, Union
+from typing import Any, Callable, List, NoReturn, Optional, Tuple, Union
 
 import numpy as np
 
@@ -8,9 +7,11 @@ import numpy as np
 # From https://github.com/riflosnake/HumanCursor/blob/main/humancursor/utilities/human_curve_generator.py
 # Edited by Vinyzu for more realistic mouse movements
 class HumanizeMouseTrajectory:
-    def __init__(self, from_point: Tuple[int, int], to_point: Tuple[int, int]) -> None:
+    def __init__(self, from_point: Tuple[int, int], to_point: Tuple[int, int], rng: Optional[np.random.Generator] = None) -> None:
         self.from_point = from_point
         self.to_point = to_point
+        # Per-Instance Generator (instead of the global np.random/random state), so Trajectories can be reproduced from a Seed
+        self.rng = rng if rng is not None else np.random.default_rng()
 
         if self.from_point == self.to_point:
             self.to_point = (self.from_point[0] + 10, self.from_point[1] + 10)
@@ -62,8 +63,7 @@ class HumanizeMouseTrajectory:
         std_deviation = min(midpoint_x - l_boundary, r_boundary - midpoint_x, midpoint_y - d_boundary, u_boundary - midpoint_y)
 
         # Generate knotsX and knotsY using normal distribution
-        knotsX = np.random.normal(midpoint_x, std_deviation, size=knots_count).astype(int)
-        knotsY = np.random.normal(midpoint_y, std_deviation, size=knots_count).astype(int)
+        knotsX, knotsY = self.rng.normal((midpoint_x, midpoint_y), std_deviation, size=(knots_count, 2)).astype(int).T
 
         # Clip values to within boundaries
         knotsX = np.clip(knotsX, l_boundary, r_boundary)
@@ -99,11 +99,13 @@ class HumanizeMouseTrajectory:
         if not (0 <= distortion_frequency <= 1):
             raise ValueError("distortion_frequency must be in range [0,1]")
 
-        distorted: List[Tuple[float, float]] = []
-        for i in range(1, len(points) - 1):
-            x, y = points[i]
-            delta = int(np.random.normal(distortion_mean, distortion_st_dev) if random.random() < distortion_frequency else 0)
-            distorted.append((x + delta // 5, y + delta // 5))
+        # Draw all Distortions of the Curve at once
+        inner_count = max(len(points) - 2, 0)
+        distort_mask = self.rng.random(inner_count) < distortion_frequency
+        deltas = np.where(distort_mask, self.rng.normal(distortion_mean, distortion_st_dev, size=inner_count), 0).astype(int)
+
+        inner_points = np.asarray(points[1:-1], dtype=float).reshape(-1, 2) + (deltas // 5)[:, np.newaxis]
+        distorted: List[Tuple[float, float]] = [(x, y) for x, y in inner_points.tolist()]
         distorted = [points[0]] + distorted + [points[-1]]
         return distorted
 
@@ -0,0 +1,81 @@
+import asyncio
+import threading
+from typing import Any, Callable, Dict, List, Literal, NamedTuple, Optional, Protocol, Sequence, Union
+
+import numpy as np
+
+from cdp_patches.input.rate_control import RateController
+from cdp_patches.input.timeline import TimelineEvent
+
+
+class WindowInfo(NamedTuple):
+    """Browser Window of a PID, indexed by the Backend (see index_windows)"""
+
+    window: Any  # Xlib Window or pywinauto Wrapper
+    id: int  # X Window Id or HWND
+    title: str
+    x: int
+    y: int
+    width: int
+    height: int
+    cdp_window_id: Optional[int] = None  # windowId of Browser.getWindowForTarget, once bound by a Target
+
+
+def match_window_bounds(windows: Sequence[WindowInfo], bounds: Dict[str, Any]) -> WindowInfo:
+    """Window whose Geometry is the closest to the CDP Window Bounds (left, top, width, height)"""
+    if not windows:
+        raise ValueError("No Windows indexed to match the Bounds against.")
+
+    def distance(info: WindowInfo) -> int:
+        left, top = int(bounds.get("left", info.x)), int(bounds.get("top", info.y))
+        width, height = int(bounds.get("width", info.width)), int(bounds.get("height", info.height))
+        return abs(info.x - left) + abs(info.y - top) + abs(info.width - width) + abs(info.height - height)
+
+    return min(windows, key=distance)
+
+
+class InputBackend(Protocol):
+    """Interface the Input Front-Ends (SyncInput, AsyncInput & their ActionChains) dispatch to. Implemented by LinuxBase, WindowsBase, DaemonBase & RecordingBase"""
+
+    scale_factor: float
+    rate_controller: RateController
+
+    def get_window(self) -> Any: ...
+
+    async def async_get_window(self) -> Any: ...
+
+    def down(self, button: Literal["left", "right", "middle"], x: int, y: int) -> None: ...
+
+    def up(self, button: Literal["left", "right", "middle"], x: int, y: int) -> None: ...
+
+    def move(self, x: int, y: int) -> None: ...
+
+    def scroll(self, direction: Literal["up", "down", "left", "right"], amount: int) -> None: ...
+
+    def send_keystrokes(self, text: str) -> None: ...
+
+    def send_keystrokes_timeline(self, keys: Sequence[str], timestamps: np.ndarray) -> None: ...
+
+    async def async_send_keystrokes_timeline(self, keys: Sequence[str], timestamps: np.ndarray) -> None: ...
+
+    def press_modifiers(self, modifiers: Sequence[str]) -> None: ...
+
+    def release_modifiers(self, modifiers: Sequence[str]) -> None: ...
+
+    def send_chord(self, modifiers: Sequence[str], key: str) -> None: ...
+
+    def paste(self, text: str) -> None: ...
+
+    def capture(self, x: int = 0, y: int = 0, width: Optional[int] = None, height: Optional[int] = None) -> np.ndarray: ...
+
+    def dispatch_timeline(self, events: Sequence[TimelineEvent], cancel_event: Optional[threading.Event] = None, on_step: Optional[Callable[[int], None]] = None) -> bool: ...
+
+    async def async_dispatch_timeline(self, events: Sequence[TimelineEvent], cancel_event: Optional[asyncio.Event] = None, on_step: Optional[Callable[[int], None]] = None) -> bool: ...
+
+    def index_windows(self) -> List[WindowInfo]: ...
+
+    def bind_window(self, window: Optional[Union[int, WindowInfo]]) -> Optional[WindowInfo]: ...
+
+    def bind_cdp_window(self, cdp_window_id: int, bounds: Dict[str, Any]) -> WindowInfo: ...
+
+    def close(self) -> None: ...
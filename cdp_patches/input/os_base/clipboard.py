@@ -0,0 +1,126 @@
+import threading
+import time
+from typing import Any, Optional
+
+import win32api
+import win32clipboard
+import win32con
+import win32gui
+
+
+class ClipboardOwner:
+    """
+    Owns the Windows Clipboard for a Text with delayed Rendering from a hidden Message-Only Window.
+    The Text is only rendered when a Reader (e.g. Chrome on Ctrl+V) requests it (WM_RENDERFORMAT), so the Paste is known to be read.
+    The Window lives on its own Thread, which pumps its Messages.
+    """
+
+    # Seconds to wait for a Reader to close the Clipboard before it can be opened again
+    open_timeout: float = 0.5
+
+    def __init__(self) -> None:
+        self.text: Optional[str] = None
+        # Clipboard Text before own(), set again by restore()
+        self.previous: Optional[str] = None
+        # Clipboard Sequence Number after own(), another Writer changes it
+        self.sequence_number = 0
+        # Set once a Reader requested the Text
+        self.served = threading.Event()
+        self.hwnd = 0
+
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._serve, name="cdp-patches-clipboard", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def own(self, text: str) -> None:
+        """Takes over the Clipboard for the Text, served until restore(), another Client writes to the Clipboard or close() is called"""
+        self.previous = self.current_text()
+        self.text = text
+        self.served.clear()
+        self._open()
+        try:
+            win32clipboard.EmptyClipboard()
+            # No Data: the Text is rendered on Request
+            win32clipboard.SetClipboardData(win32clipboard.CF_UNICODETEXT, None)
+        finally:
+            win32clipboard.CloseClipboard()
+        self.sequence_number = win32clipboard.GetClipboardSequenceNumber()
+
+    def restore(self) -> None:
+        """Sets the Text the Clipboard held before own() again, unless another Client wrote to it meanwhile. Only Text is restored, other Formats are lost"""
+        if win32clipboard.GetClipboardSequenceNumber() != self.sequence_number:
+            return
+        try:
+            self._open()
+        except win32clipboard.error:
+            # Still held by the Reader, the Clipboard keeps the pasted Text
+            return
+        try:
+            win32clipboard.EmptyClipboard()
+            if self.previous is not None:
+                win32clipboard.SetClipboardText(self.previous, win32clipboard.CF_UNICODETEXT)
+        finally:
+            win32clipboard.CloseClipboard()
+        self.text = self.previous
+
+    def current_text(self) -> Optional[str]:
+        """Text the Clipboard currently holds, None if it holds none"""
+        if win32clipboard.GetClipboardOwner() == self.hwnd:
+            return self.text
+        self._open()
+        try:
+            if not win32clipboard.IsClipboardFormatAvailable(win32clipboard.CF_UNICODETEXT):
+                return None
+            text: str = win32clipboard.GetClipboardData(win32clipboard.CF_UNICODETEXT)
+            return text
+        finally:
+            win32clipboard.CloseClipboard()
+
+    def close(self) -> None:
+        win32gui.PostMessage(self.hwnd, win32con.WM_CLOSE, 0, 0)
+        self._thread.join()
+
+    def _open(self) -> None:
+        # Readers hold the Clipboard open briefly, OpenClipboard fails meanwhile
+        deadline = time.perf_counter() + self.open_timeout
+        while True:
+            try:
+                win32clipboard.OpenClipboard(self.hwnd)
+                return
+            except win32clipboard.error:
+                if time.perf_counter() > deadline:
+                    raise
+                time.sleep(0.005)
+
+    def _serve(self) -> None:
+        window_class = win32gui.WNDCLASS()
+        window_class.lpfnWndProc = self._window_procedure
+        window_class.lpszClassName = f"cdp-patches-clipboard-{id(self)}"
+        window_class.hInstance = win32api.GetModuleHandle(None)
+        class_atom = win32gui.RegisterClass(window_class)
+        self.hwnd = win32gui.CreateWindow(class_atom, "cdp-patches-clipboard", 0, 0, 0, 0, 0, win32con.HWND_MESSAGE, 0, window_class.hInstance, None)
+        self._ready.set()
+        win32gui.PumpMessages()
+        win32gui.UnregisterClass(class_atom, window_class.hInstance)
+
+    def _window_procedure(self, hwnd: int, message: int, wparam: int, lparam: int) -> Any:
+        if message == win32con.WM_RENDERFORMAT:
+            # The Reader holds the Clipboard open & waits for the Data
+            if wparam == win32clipboard.CF_UNICODETEXT and self.text is not None:
+                win32clipboard.SetClipboardText(self.text, win32clipboard.CF_UNICODETEXT)
+                self.served.set()
+            return 0
+        elif message == win32con.WM_RENDERALLFORMATS:
+            # Destroyed while owning the Clipboard, the Text has to stay available
+            win32clipboard.OpenClipboard(hwnd)
+            try:
+                if win32clipboard.GetClipboardOwner() == hwnd and self.text is not None:
+                    win32clipboard.SetClipboardText(self.text, win32clipboard.CF_UNICODETEXT)
+            finally:
+                win32clipboard.CloseClipboard()
+            return 0
+        elif message == win32con.WM_DESTROY:
+            win32gui.PostQuitMessage(0)
+            return 0
+        return win32gui.DefWindowProc(hwnd, message, wparam, lparam)
@@ -1,17 +1,27 @@
 import asyncio
+import functools
 import os
 import re
 import subprocess
+import threading
 import time
-from typing import Any, List, Literal, Tuple
+import weakref
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Set, Tuple, TypeVar, Union, cast
 
-from Xlib import X, display
+import numpy as np
+from Xlib import X, Xatom, display
 from Xlib.error import BadWindow
 from Xlib.ext.xtest import fake_input
 from Xlib.XK import string_to_keysym
 from Xlib.xobject.drawable import Window
 
 from cdp_patches.input.exceptions import WindowClosedException
+from cdp_patches.input.os_base.backend import WindowInfo, match_window_bounds
+from cdp_patches.input.os_base.selection import SelectionOwner
+from cdp_patches.input.os_base.xcb import XCBConnection, XCBShmCapture
+from cdp_patches.input.os_base.xinput import MasterDevices, create_master, remove_master, set_client_pointer
+from cdp_patches.input.rate_control import RateController
+from cdp_patches.input.timeline import TimelineEvent, async_run_timeline, run_timeline
 
 # Every Common Symbol on a QWERTY Keyboard, Source: https://github.com/python-xlib/python-xlib/blob/4e8bbf8fc4941e5da301a8b3db8d27e98de68666/Xlib/keysymdef/latin1.py
 # Dict Source: https://github.com/svenlr/swift-map/blob/main/mainloop.py#L459
@@ -82,6 +92,58 @@ def get_kb_layout_shifted_chars() -> str:
     raise EnvironmentError("Keyboard layout not found!")
 
 
+modifier_keysyms = {"ctrl": "Control_L", "shift": "Shift_L", "alt": "Alt_L", "meta": "Super_L"}
+
+# Bases on the same X Display share the Core Pointer & Keyboard Focus, so their Input is serialized per Display (not globally).
+# Striping per Connection wouldnt help: Gestures of different Bases would still fight over the one Core Pointer, only multi_pointer Bases get their own Lock
+# Pastes get a second Lock per Display: the Selections are shared, but waiting for the Browser to read them mustnt block other Input
+_display_locks: Dict[Tuple[Optional[str], str], threading.RLock] = {}
+_display_locks_guard = threading.Lock()
+
+MethodType = TypeVar("MethodType", bound=Callable[..., Any])
+
+
+def display_lock(display_name: Optional[str], purpose: Literal["input", "clipboard"] = "input") -> threading.RLock:
+    with _display_locks_guard:
+        lock = _display_locks.get((display_name, purpose))
+        if lock is None:
+            lock = _display_locks[(display_name, purpose)] = threading.RLock()
+        return lock
+
+
+def synchronized(method: MethodType) -> MethodType:
+    """Runs the Method under the Lock of the Base, python-xlib Displays arent thread-safe"""
+
+    @functools.wraps(method)
+    def wrapper(self: "LinuxBase", *args: Any, **kwargs: Any) -> Any:
+        with self.lock:
+            return method(self, *args, **kwargs)
+
+    return cast(MethodType, wrapper)
+
+
+class XlibConnection:
+    """XTest Input Injection through python-xlib, sharing the Display Connection used for Window Discovery."""
+
+    def __init__(self, xlib_display: display.Display) -> None:
+        self.display = xlib_display
+
+    def fake_input(self, event_type: int, detail: int = 0, x: int = 0, y: int = 0) -> None:
+        fake_input(self.display, event_type, detail, x=x, y=y)
+
+    def set_client_pointer(self, pointer: int) -> None:
+        set_client_pointer(self.display, pointer)
+
+    def flush(self) -> None:
+        self.display.flush()
+
+    def sync(self) -> None:
+        self.display.sync()
+
+    def close(self) -> None:
+        pass
+
+
 class LinuxBase:
     browser_window: Window
     hwnd: int
@@ -90,20 +152,101 @@ class LinuxBase:
     toolbar_height: int = 0
     render_widget_height: int = 0
     shifted_chars = get_kb_layout_shifted_chars()
-
-    def __init__(self, pid: int, scale_factor: float) -> None:
+    connection: Union[XlibConnection, XCBConnection]
+    _shm_capture: Optional[XCBShmCapture] = None
+    _shm_unavailable: bool = False
+    # Serves the CLIPBOARD for paste, created with the first Paste
+    _selection_owner: Optional[SelectionOwner] = None
+    # Seconds paste waits for the Browser to fetch the Text
+    paste_timeout: float = 1.0
+    # Shift held for a Run of shifted Keys
+    _shift_run: bool = False
+    # Window Liveness, tracked from Events selected on the Browser Window
+    _window_alive: bool = False
+    _hints_changed: bool = False
+    _watched_window_id: int = 0
+    # Screen Offset of the Viewport, cached until the Window moves/resizes (ConfigureNotify) or its Toolbar changes
+    _offset: Optional[Tuple[int, int]] = None
+    # Dedicated XI2 Master Pointer/Keyboard (multi_pointer), instead of the shared Virtual Core Devices
+    master: Optional[MasterDevices] = None
+    _master_finalizer: weakref.finalize
+    # Window all Input is sent to (bind_window), instead of the first indexed one
+    bound_window_id: Optional[int] = None
+
+    def __init__(self, pid: int, scale_factor: float, x_backend: Literal["xlib", "xcb"] = "xlib", multi_pointer: bool = False) -> None:
         self.pid = pid
         self.scale_factor = scale_factor
-        self._loop = asyncio.get_event_loop()
+        self.x_backend = x_backend
+        # Fed with every Round-Trip, to thin out Trajectories when the X Server is saturated
+        self.rate_controller = RateController()
+        # Modifiers held explicitly (press_modifiers), across Clicks & Keys
+        self.held_modifiers: Set[str] = set()
+        # Candidate Browser Windows of the PID, from the last Tree Walk
+        self.windows: List[WindowInfo] = []
+        # Viewport Origin relative to the Window Origin per Window Id, measured over CDP (calibrate)
+        self.content_insets: Dict[int, Tuple[int, int]] = {}
 
         display_env = os.getenv("DISPLAY")
+        self.display_name = display_env
+        # Own Master Devices dont share a Pointer with other Bases, only the Connections of this Base need to be guarded then
+        self.lock = threading.RLock() if multi_pointer else display_lock(display_env)
         self.display = display.Display(display_env)
+        self.connection = self.create_connection(x_backend, display_env)
+        if multi_pointer:
+            self.attach_master()
         self.tab_pid = self.get_window()
 
         self.browser_window = self.display.create_resource_object("window", self.tab_pid)
 
-    def get_window(self) -> Any:
-        name_atom = self.display.get_atom("WM_NAME", only_if_exists=True)
+    def create_connection(self, x_backend: Literal["xlib", "xcb"], display_name: Optional[str]) -> Union[XlibConnection, XCBConnection]:
+        if x_backend == "xlib":
+            return XlibConnection(self.display)
+        elif x_backend == "xcb":
+            return XCBConnection(display_name)
+
+        raise ValueError(f"Invalid X Backend: {x_backend}")
+
+    @synchronized
+    def sync(self) -> None:
+        start = time.perf_counter()
+        self.connection.sync()
+        self.rate_controller.observe(time.perf_counter() - start)
+
+    @synchronized
+    def attach_master(self) -> None:
+        """Routes all Input of this Base through its own Master Pointer & Keyboard, so Bases on one Display dont fight over the Cursor & Focus"""
+        self.master = create_master(self.display)
+        # Masters outlive our Connection on the X Server, Bases dropped without close() still remove them once garbage collected (or at Exit)
+        self._master_finalizer = weakref.finalize(self, remove_master, self.display, self.master)
+        try:
+            # The Connection injects the Events, the Display sets the Keyboard Focus (the same Connection for xlib)
+            self.connection.set_client_pointer(self.master.pointer)
+            if self.x_backend == "xcb":
+                set_client_pointer(self.display, self.master.pointer)
+        except Exception:
+            self.detach_master()
+            raise
+
+    @synchronized
+    def detach_master(self) -> None:
+        if self.master:
+            self.master = None
+            self._master_finalizer()
+
+    @synchronized
+    def close(self) -> None:
+        if self._shm_capture:
+            self._shm_capture.close()
+        if self._selection_owner:
+            self._selection_owner.close()
+        try:
+            self.detach_master()
+        finally:
+            self.connection.close()
+            self.display.close()
+
+    @synchronized
+    def _search_windows(self) -> List[Window]:
         pid_atom = self.display.get_atom("_NET_WM_PID", only_if_exists=True)
         res_windows: List[Window] = []
 
@@ -117,68 +260,195 @@ class LinuxBase:
                     search_windows_by_pid(window.query_tree(), pid)
 
         search_windows_by_pid(self.display.screen().root.query_tree(), self.pid)
-        if not res_windows:
-            raise WindowClosedException(f"No windows found for PID: {self.pid}")
+        return res_windows
+
+    @synchronized
+    def _index_windows(self, res_windows: List[Window]) -> List[WindowInfo]:
+        name_atom = self.display.get_atom("WM_NAME", only_if_exists=True)
+        root = self.display.screen().root
+        # CDP Window Ids stay valid for the Lifetime of their Window
+        cdp_window_ids = {info.id: info.cdp_window_id for info in self.windows}
+        windows: List[WindowInfo] = []
 
         for window in res_windows:
-            # Getting necessary window properties
-            title = window.get_property(name_atom, 0, 0, pow(2, 32) - 1).value
-            min_height = window.get_wm_normal_hints().min_height
-            # parent_offset_coords = window.translate_coords(window.query_tree().parent, 0, 0)
-            # window_x, window_y = parent_offset_coords.x, parent_offset_coords.y
-
-            # Filter out non-browser windows, for example the Taskbar or Info Bars
-            if (b"google-chrome" in title) or (title == b"chrome") or (min_height == 0):  # or (window_x == window_y) or not all((window_x, window_y))
+            try:
+                # Getting necessary window properties
+                title_property = window.get_property(name_atom, 0, 0, pow(2, 32) - 1)
+                title = title_property.value if title_property else b""
+                min_height = window.get_wm_normal_hints().min_height
+
+                # Filter out non-browser windows, for example the Taskbar or Info Bars
+                if (b"google-chrome" in title) or (title == b"chrome") or (min_height == 0):
+                    continue
+
+                geometry = window.get_geometry()
+                # Position of the Root Origin relative to the Window
+                root_offset_coords = window.translate_coords(root, 0, 0)
+            except BadWindow:
+                # Closed during the Walk
                 continue
 
-            self.browser_window = window
-            return self.browser_window
+            windows.append(
+                WindowInfo(
+                    window=window,
+                    id=window.id,
+                    title=title.decode(errors="replace") if isinstance(title, bytes) else str(title),
+                    x=-root_offset_coords.x,
+                    y=-root_offset_coords.y,
+                    width=geometry.width,
+                    height=geometry.height,
+                    cdp_window_id=cdp_window_ids.get(window.id),
+                )
+            )
+
+        self.windows = windows
+        return windows
+
+    def index_windows(self) -> List[WindowInfo]:
+        """Indexes every Browser Window of the PID (Title, Geometry & CDP Window Id once bound) with one Tree Walk"""
+        return self._index_windows(self._search_windows())
+
+    def _indexed_window(self, window_id: int) -> Optional[WindowInfo]:
+        return next((info for info in self.windows if info.id == window_id), None)
+
+    @synchronized
+    def _select_window(self) -> Any:
+        if not self.windows:
+            raise WindowClosedException(f"No windows found for PID: {self.pid}")
+
+        # The bound Window, otherwise the first one (e.g. not a Popup opened later)
+        info = self.windows[0] if self.bound_window_id is None else self._indexed_window(self.bound_window_id)
+        if info is None:
+            raise WindowClosedException(f"Bound Window {self.bound_window_id} of PID {self.pid} was closed.")
 
-        raise WindowClosedException(f"No windows found for PID: {self.pid}")
+        self.browser_window = info.window
+        self._watch_window(info.window)
+        return self.browser_window
 
+    @synchronized
+    def get_window(self) -> Any:
+        self.index_windows()
+        return self._select_window()
+
+    @synchronized
+    def bind_window(self, window: Optional[Union[int, WindowInfo]]) -> Optional[WindowInfo]:
+        """Sends all Input to one indexed Window (by X Window Id), switching to it without a Tree Walk. None follows the first Window again"""
+        if window is None:
+            self.bound_window_id = None
+            self._select_window()
+            return None
+
+        window_id = window.id if isinstance(window, WindowInfo) else window
+        info = self._indexed_window(window_id)
+        if info is None:
+            # Opened after the last Tree Walk
+            self.index_windows()
+            info = self._indexed_window(window_id)
+            if info is None:
+                raise WindowClosedException(f"Window {window_id} of PID {self.pid} not found.")
+
+        self.bound_window_id = window_id
+        if self._watched_window_id != window_id:
+            self._select_window()
+        return info
+
+    @synchronized
+    def bind_cdp_window(self, cdp_window_id: int, bounds: Dict[str, Any]) -> WindowInfo:
+        """Binds the Window with the CDP Window Id (Browser.getWindowForTarget), matched once by its Bounds & remembered in the Index"""
+        info = next((info for info in self.windows if info.cdp_window_id == cdp_window_id), None)
+        if info is None:
+            # Fresh Geometry to match against
+            self.index_windows()
+            info = match_window_bounds([info for info in self.windows if info.cdp_window_id is None] or self.windows, bounds)._replace(cdp_window_id=cdp_window_id)
+            self.windows = [info if indexed.id == info.id else indexed for indexed in self.windows]
+
+        self.bind_window(info)
+        return info
+
+    def _watch_window(self, window: Window) -> None:
+        # Get notified about the Window being destroyed/unmapped or its Size Hints changing, instead of polling the X Server
+        self._watched_window_id = window.id
+        self._window_alive = True
+        self._hints_changed = False
+        self._offset = None
+        # StructureNotify also reports Moves & Resizes (ConfigureNotify), which invalidate the cached Viewport Offset
+        window.change_attributes(event_mask=X.StructureNotifyMask | X.PropertyChangeMask, onerror=self._on_watch_error)
+        self.display.flush()
+
+    def _on_watch_error(self, *args: Any) -> None:
+        self._window_alive = False
+
+    def _process_window_events(self) -> None:
+        normal_hints_atom = Xatom.WM_NORMAL_HINTS
+        # pending_events only reads already-received Events (no Round-Trip)
+        while self.display.pending_events():
+            event = self.display.next_event()
+            event_window = getattr(event, "window", None)
+            if event_window is None or event_window.id != self._watched_window_id:
+                continue
+
+            if event.type in (X.DestroyNotify, X.UnmapNotify):
+                self._window_alive = False
+            elif event.type == X.MapNotify:
+                self._window_alive = True
+            elif event.type in (X.ConfigureNotify, X.ReparentNotify):
+                self._offset = None
+            elif event.type == X.PropertyNotify and event.atom == normal_hints_atom:
+                # The Toolbar Height changed (e.g. Fullscreen), the calibrated Inset doesnt hold anymore
+                self._hints_changed = True
+                self._offset = None
+                self.content_insets.pop(self._watched_window_id, None)
+
+    @synchronized
     def ensure_window(self) -> None:
+        self._process_window_events()
+        if self._window_alive and not self._hints_changed:
+            return
+
         try:
             # No Easy Visibility Check, well just check a random window attribute...
-            if not self.browser_window.get_wm_normal_hints().min_height:
-                self.get_window()
+            if self._window_alive and self.browser_window.get_wm_normal_hints().min_height:
+                self._hints_changed = False
+                return
         except BadWindow:
-            self.get_window()
+            pass
+        self.get_window()
 
     async def async_get_window(self) -> Any:
-        name_atom = self.display.get_atom("WM_NAME", only_if_exists=True)
-        pid_atom = self.display.get_atom("_NET_WM_PID", only_if_exists=True)
-        res_windows: List[Window] = []
-
-        # Getting all WindowIds by PID by recursively searching through all windows under the root window query tree
-        def search_windows_by_pid(query_tree, pid: int):
-            for window in query_tree.children:
-                window_pid = window.get_property(pid_atom, 0, 0, pow(2, 32) - 1)
-                if window_pid and window_pid.value[0] == pid:
-                    res_windows.append(window)
-                if window.query_tree().children:
-                    search_windows_by_pid(window.query_tree(), pid)
+        # Waiting for the Display Lock mustnt block the Event Loop. The Loop is looked up per Call, Bases are also created off the Main Thread (e.g. by the Daemon)
+        return await asyncio.get_running_loop().run_in_executor(None, self.get_window)
 
-        await self._loop.run_in_executor(None, lambda: search_windows_by_pid(self.display.screen().root.query_tree(), self.pid))
-        if not res_windows:
-            raise WindowClosedException(f"No windows found for PID: {self.pid}")
-
-        for window in res_windows:
-            # Getting necessary window properties
-            title = window.get_property(name_atom, 0, 0, pow(2, 32) - 1).value
-            min_height = window.get_wm_normal_hints().min_height
-            # parent_offset_coords = window.translate_coords(window.query_tree().parent, 0, 0)
-            # window_x, window_y = parent_offset_coords.x, parent_offset_coords.y
-
-            # Filter out non-browser windows, for example the Taskbar or Info Bars
-            if (b"google-chrome" in title) or (title == b"chrome") or (min_height == 0):  # or (window_x == window_y) or not all((window_x, window_y))
-                continue
+    def _window_position(self) -> Tuple[int, int]:
+        # Position of the Root Origin relative to the Window, negated
+        root_offset_coords = self.browser_window.translate_coords(self.display.screen().root, 0, 0)
+        return -root_offset_coords.x, -root_offset_coords.y
 
-            self.browser_window = window
-            return self.browser_window
+    @synchronized
+    def calibrate(self, content_x: int, content_y: int) -> None:
+        """Stores the exact Screen Position of the Viewport (e.g. measured over CDP), used instead of the Toolbar Heuristic until the Toolbar changes"""
+        self.ensure_window()
+        window_x, window_y = self._window_position()
+        geometry = self.browser_window.get_geometry()
+        inset_x, inset_y = content_x - window_x, content_y - window_y
+        if not (0 <= inset_x <= geometry.width and 0 <= inset_y <= geometry.height):
+            raise ValueError(f"Viewport Origin {(content_x, content_y)} isnt inside of the Browser Window {self.browser_window.id}.")
 
-        raise WindowClosedException(f"No windows found for PID: {self.pid}")
+        self.content_insets[self.browser_window.id] = (inset_x, inset_y)
+        self._offset = (content_x, content_y)
 
+    @synchronized
     def _offset_toolbar_height(self) -> Tuple[int, int]:
+        # Only recomputed once the Window moved, resized or changed its Toolbar (see _process_window_events)
+        if self._offset is None:
+            inset = self.content_insets.get(self.browser_window.id)
+            if inset is None:
+                self._offset = self._estimate_offset()
+            else:
+                window_x, window_y = self._window_position()
+                self._offset = (window_x + inset[0], window_y + inset[1])
+        return self._offset
+
+    def _estimate_offset(self) -> Tuple[int, int]:
         # Get Window Location
         root_offset_coords = self.browser_window.translate_coords(self.browser_window.query_tree().root, 0, 0)
         parent_offset_coords = self.browser_window.translate_coords(self.browser_window.query_tree().parent, 0, 0)
@@ -205,8 +475,63 @@ class LinuxBase:
         offset_height: int = window_y - window_toolbar_height + chrome_toolbar_height
         return offset_width, offset_height
 
+    def _pixel_format(self) -> Tuple[int, int]:
+        # Bytes per Pixel & Scanline Padding (in Bytes) of ZPixmap Images on the Root Window
+        depth = self.display.screen().root_depth
+        for pixmap_format in self.display.display.info.pixmap_formats:
+            if pixmap_format.depth == depth:
+                return pixmap_format.bits_per_pixel // 8, pixmap_format.scanline_pad // 8
+
+        raise ValueError(f"No Pixmap Format found for Depth {depth}.")
+
+    @synchronized
+    def capture(self, x: int = 0, y: int = 0, width: Optional[int] = None, height: Optional[int] = None) -> np.ndarray:
+        self.ensure_window()
+        offset_width, offset_height = self._offset_toolbar_height()
+        root = self.display.screen().root
+
+        # Visible Viewport in Screen Pixels (Window Size minus the Chrome Toolbar)
+        geometry = self.browser_window.get_geometry()
+        viewport_width = geometry.width
+        viewport_height = geometry.height - (self.browser_window.get_wm_normal_hints().min_height - 1)
+
+        region_x = int(x * self.scale_factor)
+        region_y = int(y * self.scale_factor)
+        region_width = viewport_width - region_x if width is None else int(width * self.scale_factor)
+        region_height = viewport_height - region_y if height is None else int(height * self.scale_factor)
+
+        # Clip the Region to the Viewport & the Screen
+        root_x, root_y = max(offset_width + region_x, 0), max(offset_height + region_y, 0)
+        region_width = min(region_width, viewport_width - region_x, self.display.screen().width_in_pixels - root_x)
+        region_height = min(region_height, viewport_height - region_y, self.display.screen().height_in_pixels - root_y)
+        if region_width <= 0 or region_height <= 0:
+            raise ValueError(f"Capture Region {(x, y, width, height)} is outside of the Viewport.")
+
+        bytes_per_pixel, scanline_pad = self._pixel_format()
+        stride = -(-region_width * bytes_per_pixel // scanline_pad) * scanline_pad
+
+        rows: Optional[np.ndarray] = None
+        if not self._shm_unavailable:
+            try:
+                if self._shm_capture is None:
+                    self._shm_capture = XCBShmCapture(self.display_name)
+                rows = self._shm_capture.capture(root.id, root_x, root_y, region_width, region_height, stride)
+            except OSError:
+                # libxcb-shm missing (EnvironmentError), MIT-SHM not supported or our Segment not attachable (ShmCaptureError, e.g. Remote Display) -> Fallback to GetImage
+                self._shm_unavailable = True
+                if self._shm_capture is not None:
+                    self._shm_capture.close()
+                    self._shm_capture = None
+
+        if rows is None:
+            image = root.get_image(root_x, root_y, region_width, region_height, X.ZPixmap, 0xFFFFFFFF)
+            rows = np.frombuffer(image.data, dtype=np.uint8).reshape(region_height, stride)
+
+        # Strip the Scanline Padding without copying
+        return rows[:, : region_width * bytes_per_pixel].reshape(region_height, region_width, bytes_per_pixel)
+
     @staticmethod
-    def _translate_button(button: Literal["left", "right", "middle", "scroll_up", "scroll_down"]) -> int:
+    def _translate_button(button: Literal["left", "right", "middle", "scroll_up", "scroll_down", "scroll_left", "scroll_right"]) -> int:
         if button == "left":
             return 1
         elif button == "middle":
@@ -217,66 +542,246 @@ class LinuxBase:
             return 4
         elif button == "scroll_down":
             return 5
+        elif button == "scroll_left":
+            return 6
+        elif button == "scroll_right":
+            return 7
 
+    @synchronized
     def down(self, button: Literal["left", "right", "middle"], x: int, y: int) -> None:
         self.ensure_window()
         self.move(x=x, y=y)
-        fake_input(self.display, X.ButtonPress, self._translate_button(button))
-        self.display.sync()
+        self.connection.fake_input(X.ButtonPress, self._translate_button(button))
+        self.sync()
 
+    @synchronized
     def up(self, button: Literal["left", "right", "middle"], x: int, y: int) -> None:
         self.ensure_window()
         self.move(x=x, y=y)
-        fake_input(self.display, X.ButtonRelease, self._translate_button(button))
-        self.display.sync()
+        self.connection.fake_input(X.ButtonRelease, self._translate_button(button))
+        self.sync()
 
+    @synchronized
     def move(self, x: int, y: int) -> None:
         self.ensure_window()
         offset_width, offset_height = self._offset_toolbar_height()
         x = int(x * self.scale_factor) + offset_width
         y = int(y * self.scale_factor) + offset_height
 
-        fake_input(self.display, X.MotionNotify, x=x, y=y)
-        self.display.sync()
+        self.connection.fake_input(X.MotionNotify, x=x, y=y)
+        self.sync()
 
+    @synchronized
     def scroll(self, direction: Literal["up", "down", "left", "right"], amount: int) -> None:
         self.ensure_window()
-        if direction in ("left", "right"):
-            raise NotImplementedError("Scrolling horizontally is not supported on Linux.")
-
-        scroll_direction: Literal["scroll_up", "scroll_down"] = "scroll_up" if direction == "up" else "scroll_down"
+        # Buttons 6 & 7 are the horizontal Scroll Wheel
+        scroll_button = self._translate_button(f"scroll_{direction}")  # type: ignore[arg-type]
 
         for _ in range(amount):
-            fake_input(self.display, X.ButtonPress, self._translate_button(scroll_direction))
-            self.display.sync()
-            fake_input(self.display, X.ButtonRelease, self._translate_button(scroll_direction))
-            self.display.sync()
+            self.connection.fake_input(X.ButtonPress, scroll_button)
+            self.sync()
+            self.connection.fake_input(X.ButtonRelease, scroll_button)
+            self.sync()
 
-    def send_keystrokes(self, text: str) -> None:
+    @synchronized
+    def _prepare_keystrokes(self) -> int:
         self.ensure_window()
-        selective_regex = re.compile(r"{[^{}]*}|.")  # Only for redundancy of windows implementations
-        shift_keycode = self.display.keysym_to_keycode(0xFFE1)  # Shift Key (0xFFE1)
+        # Focus the Window once (instead of per key) & make sure the Focus Change arrived before injecting via a separate XCB Connection
+        self.browser_window.set_input_focus(X.RevertToNone, X.CurrentTime)
+        if self.x_backend == "xcb":
+            self.display.sync()
 
-        for key in selective_regex.findall(text):
-            shifted_key = key.isupper() or key in self.shifted_chars
-            if key in symbol_dict:
-                key = symbol_dict[key]
+        shift_keycode: int = self.display.keysym_to_keycode(0xFFE1)  # Shift Key (0xFFE1)
+        return shift_keycode
 
-            keysym = string_to_keysym(key)
-            keycode = self.display.keysym_to_keycode(keysym)
-            self.browser_window.set_input_focus(X.RevertToNone, X.CurrentTime)
+    def _keycode(self, key: str) -> int:
+        if key in symbol_dict:
+            key = symbol_dict[key]
+        elif len(key) > 2 and key[0] == "{" and key[-1] == "}":
+            # Named Keys, for example {BackSpace}
+            key = key[1:-1]
 
-            if shifted_key:
-                fake_input(self.display, X.KeyPress, shift_keycode)
-                # time.sleep(0.1)
+        keysym = string_to_keysym(key)
+        keycode: int = self.display.keysym_to_keycode(keysym)
+        return keycode
 
-            fake_input(self.display, X.KeyPress, keycode)
-            self.display.sync()
-            time.sleep(0.01)  # Note: Might want to increase this in the future, to make it more human-like, but pywinauto uses the same timeouts so for now its fine.
-
-            fake_input(self.display, X.KeyRelease, keycode)
+    def _send_key(self, key: str, shift_keycode: int) -> None:
+        shifted_key = len(key) == 1 and (key.isupper() or key in self.shifted_chars)
+        keycode = self._keycode(key)
 
+        # Runs of shifted Keys share one Shift Press (unless Shift is held explicitly)
+        if "shift" not in self.held_modifiers and shifted_key != self._shift_run:
             if shifted_key:
-                # time.sleep(0.1)
-                fake_input(self.display, X.KeyRelease, shift_keycode)
-            self.display.sync()
+                # Held for the whole Run (also across Timeline Gaps), Input of other Threads in between would get Shift applied
+                self.lock.acquire()
+                self.connection.fake_input(X.KeyPress, shift_keycode)
+                self._shift_run = True
+            else:
+                # Batched with the Key Press, the Dispatch still holds the Lock for it
+                self.connection.fake_input(X.KeyRelease, shift_keycode)
+                self._shift_run = False
+                self.lock.release()
+
+        self.connection.fake_input(X.KeyPress, keycode)
+        self.sync()
+        time.sleep(0.01)  # Note: Might want to increase this in the future, to make it more human-like, but pywinauto uses the same timeouts so for now its fine.
+
+        self.connection.fake_input(X.KeyRelease, keycode)
+        self.sync()
+
+    @synchronized
+    def _end_shift_run(self) -> None:
+        if self._shift_run:
+            self.connection.fake_input(X.KeyRelease, self.display.keysym_to_keycode(0xFFE1))
+            self._shift_run = False
+            self.sync()
+            # Taken by _send_key when the Run started
+            self.lock.release()
+
+    @synchronized
+    def send_keystrokes(self, text: str) -> None:
+        selective_regex = re.compile(r"{[^{}]*}|.")  # Only for redundancy of windows implementations
+        shift_keycode = self._prepare_keystrokes()
+
+        try:
+            for key in selective_regex.findall(text):
+                self._send_key(key, shift_keycode)
+        finally:
+            self._end_shift_run()
+
+    @synchronized
+    def press_modifiers(self, modifiers: Sequence[str]) -> None:
+        for modifier in modifiers:
+            if modifier not in self.held_modifiers:
+                self.connection.fake_input(X.KeyPress, self._keycode(modifier_keysyms[modifier]))
+                self.held_modifiers.add(modifier)
+        self.sync()
+
+    @synchronized
+    def release_modifiers(self, modifiers: Sequence[str]) -> None:
+        for modifier in reversed(modifiers):
+            if modifier in self.held_modifiers:
+                self.connection.fake_input(X.KeyRelease, self._keycode(modifier_keysyms[modifier]))
+                self.held_modifiers.discard(modifier)
+        self.sync()
+
+    @synchronized
+    def send_chord(self, modifiers: Sequence[str], key: str) -> None:
+        self._prepare_keystrokes()
+        keycode = self._keycode(key)
+        # Modifiers already held (e.g. by press_modifiers) stay pressed
+        chord_modifiers = [self._keycode(modifier_keysyms[modifier]) for modifier in modifiers if modifier not in self.held_modifiers]
+
+        # Whole Chord in one Batch
+        for modifier_keycode in chord_modifiers:
+            self.connection.fake_input(X.KeyPress, modifier_keycode)
+        self.connection.fake_input(X.KeyPress, keycode)
+        self.connection.fake_input(X.KeyRelease, keycode)
+        for modifier_keycode in reversed(chord_modifiers):
+            self.connection.fake_input(X.KeyRelease, modifier_keycode)
+        self.sync()
+
+    def paste(self, text: str) -> None:
+        """Fills the Text through the X Clipboard with one Ctrl+V, independent of its Length. The previous Clipboard Text is restored afterwards"""
+        self.send_paste(text)()
+
+    def send_paste(self, text: str) -> Callable[[], None]:
+        """
+        Takes over the Selections for the Text & sends the Ctrl+V under the Lock.
+        Returns the Function waiting for the Browser to read the Text & restoring the previous one, called without holding the Lock.
+        """
+        if not text:
+            return lambda: None
+        # Other Pastes on the Display wait until this one was read, other Input doesnt
+        clipboard_lock = display_lock(self.display_name, "clipboard")
+        clipboard_lock.acquire()
+        try:
+            with self.lock:
+                self.ensure_window()
+                if self._selection_owner is None:
+                    self._selection_owner = SelectionOwner(self.display_name)
+                selection_owner = self._selection_owner
+                selection_owner.own(text)
+                self.send_chord(["ctrl"], "v")
+        except BaseException:
+            clipboard_lock.release()
+            raise
+
+        def finish() -> None:
+            try:
+                # Chrome fetches the Text asynchronously, following Input of this Handle mustnt overtake the Paste
+                selection_owner.served.wait(self.paste_timeout)
+                selection_owner.restore()
+            finally:
+                clipboard_lock.release()
+
+        return finish
+
+    def send_keystrokes_timeline(self, keys: Sequence[str], timestamps: np.ndarray) -> None:
+        self.dispatch_timeline([TimelineEvent(timestamp, "key", key=key) for key, timestamp in zip(keys, timestamps.tolist())])
+
+    async def async_send_keystrokes_timeline(self, keys: Sequence[str], timestamps: np.ndarray) -> None:
+        await self.async_dispatch_timeline([TimelineEvent(timestamp, "key", key=key) for key, timestamp in zip(keys, timestamps.tolist())])
+
+    @synchronized
+    def _timeline_dispatcher(self, events: Sequence[TimelineEvent]) -> Tuple[Callable[[TimelineEvent], None], Set[str]]:
+        # Validate the Window & compute Offsets once for the whole Timeline
+        self.ensure_window()
+        offset_width, offset_height = self._offset_toolbar_height()
+        shift_keycode = self._prepare_keystrokes() if any(event.kind == "key" for event in events) else 0
+        pressed_buttons: Set[str] = set()
+
+        def dispatch(event: TimelineEvent) -> None:
+            with self.lock:
+                # Only a Flag Check (see _process_window_events)
+                self.ensure_window()
+                if event.kind == "key":
+                    self._send_key(event.key, shift_keycode)
+                    return
+
+                if event.kind in ("move", "down", "up"):
+                    x = int(event.x * self.scale_factor) + offset_width
+                    y = int(event.y * self.scale_factor) + offset_height
+                    self.connection.fake_input(X.MotionNotify, x=x, y=y)
+
+                if event.kind == "down":
+                    self.connection.fake_input(X.ButtonPress, self._translate_button(event.key))  # type: ignore[arg-type]
+                    pressed_buttons.add(event.key)
+                elif event.kind == "up":
+                    self.connection.fake_input(X.ButtonRelease, self._translate_button(event.key))  # type: ignore[arg-type]
+                    pressed_buttons.discard(event.key)
+                elif event.kind == "scroll":
+                    scroll_button = self._translate_button(f"scroll_{event.key}")  # type: ignore[arg-type]
+                    for _ in range(event.amount):
+                        self.connection.fake_input(X.ButtonPress, scroll_button)
+                        self.connection.fake_input(X.ButtonRelease, scroll_button)
+                self.sync()
+
+        return dispatch, pressed_buttons
+
+    @synchronized
+    def _release_buttons(self, pressed_buttons: Set[str]) -> None:
+        # Dont leave Buttons pressed after a cancelled Timeline
+        for button in pressed_buttons:
+            self.connection.fake_input(X.ButtonRelease, self._translate_button(button))  # type: ignore[arg-type]
+        self.sync()
+
+    def dispatch_timeline(self, events: Sequence[TimelineEvent], cancel_event: Optional[threading.Event] = None, on_step: Optional[Callable[[int], None]] = None) -> bool:
+        dispatch, pressed_buttons = self._timeline_dispatcher(events)
+        try:
+            completed = run_timeline(events, dispatch, cancel_event=cancel_event, on_step=on_step)
+        finally:
+            self._end_shift_run()
+        if not completed:
+            self._release_buttons(pressed_buttons)
+        return completed
+
+    async def async_dispatch_timeline(self, events: Sequence[TimelineEvent], cancel_event: Optional[asyncio.Event] = None, on_step: Optional[Callable[[int], None]] = None) -> bool:
+        dispatch, pressed_buttons = self._timeline_dispatcher(events)
+        try:
+            completed = await async_run_timeline(events, dispatch, cancel_event=cancel_event, on_step=on_step)
+        finally:
+            self._end_shift_run()
+        if not completed:
+            self._release_buttons(pressed_buttons)
+        return completed
@@ -0,0 +1,182 @@
+import asyncio
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from cdp_patches.input.exceptions import WindowClosedException
+from cdp_patches.input.os_base.backend import WindowInfo, match_window_bounds
+from cdp_patches.input.rate_control import RateController
+from cdp_patches.input.timeline import TimelineEvent, async_run_timeline, run_timeline
+
+event_kinds = ("move", "down", "up", "key", "scroll", "modifier_down", "modifier_up", "paste")
+# One preallocated Row per Event. key indexes RecordingBase.keys (Buttons, Keys, Modifiers & Scroll Directions)
+event_dtype = np.dtype([("kind", np.uint8), ("x", np.int32), ("y", np.int32), ("key", np.int32), ("amount", np.int32), ("time", np.float64)])
+
+
+class RecordingBase:
+    """
+    In-Memory Backend recording every Event into preallocated Arrays instead of sending it, to benchmark & test the Front-End without a Display.
+    realtime=False dispatches Timelines without waiting, recording the Time each Event was scheduled for instead.
+    """
+
+    def __init__(self, pid: int = 0, scale_factor: float = 1.0, capacity: int = 65536, realtime: bool = True, viewport: Tuple[int, int] = (1280, 720)) -> None:
+        self.pid = pid
+        self.scale_factor = scale_factor
+        self.realtime = realtime
+        self.viewport = viewport
+        self.rate_controller = RateController()
+        self.held_modifiers: Set[str] = set()
+        # One virtual Window covering the Viewport, Tests can index further ones
+        self.windows: List[WindowInfo] = [WindowInfo(None, 1, "", 0, 0, viewport[0], viewport[1])]
+        self.bound_window_id: Optional[int] = None
+
+        self.buffer = np.zeros(capacity, dtype=event_dtype)
+        self.count = 0
+        self.keys: List[str] = []
+        self._key_indices: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def events(self) -> np.ndarray:
+        """Recorded Events (a View into the Buffer)"""
+        return self.buffer[: self.count]
+
+    def recorded(self, kind: str) -> np.ndarray:
+        events = self.events
+        recorded: np.ndarray = events[events["kind"] == event_kinds.index(kind)]
+        return recorded
+
+    def key_names(self, events: np.ndarray) -> List[str]:
+        return [self.keys[index] for index in events["key"].tolist()]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.count = 0
+
+    def record(self, kind: str, x: int = 0, y: int = 0, key: str = "", amount: int = 0, timestamp: Optional[float] = None) -> None:
+        with self._lock:
+            if self.count == len(self.buffer):
+                # Double the Capacity instead of growing per Event
+                self.buffer = np.concatenate([self.buffer, np.zeros(len(self.buffer) or 1, dtype=event_dtype)])
+
+            key_index = self._key_indices.get(key)
+            if key_index is None:
+                key_index = self._key_indices[key] = len(self.keys)
+                self.keys.append(key)
+
+            self.buffer[self.count] = (event_kinds.index(kind), x, y, key_index, amount, time.perf_counter() if timestamp is None else timestamp)
+            self.count += 1
+
+    def close(self) -> None:
+        pass
+
+    def include_windows_scale_factor(self) -> None:
+        pass
+
+    def get_window(self) -> bool:
+        return True
+
+    async def async_get_window(self) -> bool:
+        return True
+
+    def index_windows(self) -> List[WindowInfo]:
+        return list(self.windows)
+
+    def bind_window(self, window: Optional[Union[int, WindowInfo]]) -> Optional[WindowInfo]:
+        if window is None:
+            self.bound_window_id = None
+            return None
+
+        window_id = window.id if isinstance(window, WindowInfo) else window
+        info = next((info for info in self.windows if info.id == window_id), None)
+        if info is None:
+            raise WindowClosedException(f"Window {window_id} of PID {self.pid} not found.")
+        self.bound_window_id = window_id
+        return info
+
+    def bind_cdp_window(self, cdp_window_id: int, bounds: Dict[str, Any]) -> WindowInfo:
+        info = next((info for info in self.windows if info.cdp_window_id == cdp_window_id), None)
+        if info is None:
+            info = match_window_bounds(self.windows, bounds)._replace(cdp_window_id=cdp_window_id)
+            self.windows = [info if indexed.id == info.id else indexed for indexed in self.windows]
+        self.bind_window(info)
+        return info
+
+    def down(self, button: Literal["left", "right", "middle"], x: int, y: int) -> None:
+        self.record("down", x, y, key=button)
+
+    def up(self, button: Literal["left", "right", "middle"], x: int, y: int) -> None:
+        self.record("up", x, y, key=button)
+
+    def move(self, x: int, y: int) -> None:
+        self.record("move", x, y)
+
+    def scroll(self, direction: Literal["up", "down", "left", "right"], amount: int) -> None:
+        self.record("scroll", key=direction, amount=amount)
+
+    def send_keystrokes(self, text: str) -> None:
+        for key in re.findall(r"{[^{}]*}|.", text, re.DOTALL):
+            self.record("key", key=key)
+
+    def press_modifiers(self, modifiers: Sequence[str]) -> None:
+        for modifier in modifiers:
+            if modifier not in self.held_modifiers:
+                self.record("modifier_down", key=modifier)
+                self.held_modifiers.add(modifier)
+
+    def release_modifiers(self, modifiers: Sequence[str]) -> None:
+        for modifier in reversed(modifiers):
+            if modifier in self.held_modifiers:
+                self.record("modifier_up", key=modifier)
+                self.held_modifiers.discard(modifier)
+
+    def send_chord(self, modifiers: Sequence[str], key: str) -> None:
+        chord_modifiers = [modifier for modifier in modifiers if modifier not in self.held_modifiers]
+        self.press_modifiers(chord_modifiers)
+        self.record("key", key=key)
+        self.release_modifiers(chord_modifiers)
+
+    def paste(self, text: str) -> None:
+        if text:
+            self.record("paste", key=text)
+
+    def capture(self, x: int = 0, y: int = 0, width: Optional[int] = None, height: Optional[int] = None) -> np.ndarray:
+        viewport_width, viewport_height = self.viewport
+        return np.zeros((viewport_height - y if height is None else height, viewport_width - x if width is None else width, 4), dtype=np.uint8)
+
+    def send_keystrokes_timeline(self, keys: Sequence[str], timestamps: np.ndarray) -> None:
+        self.dispatch_timeline([TimelineEvent(timestamp, "key", key=key) for key, timestamp in zip(keys, timestamps.tolist())])
+
+    async def async_send_keystrokes_timeline(self, keys: Sequence[str], timestamps: np.ndarray) -> None:
+        await self.async_dispatch_timeline([TimelineEvent(timestamp, "key", key=key) for key, timestamp in zip(keys, timestamps.tolist())])
+
+    def _dispatch(self, event: TimelineEvent, timestamp: Optional[float] = None) -> None:
+        if event.kind == "scroll":
+            self.record("scroll", key=event.key, amount=event.amount, timestamp=timestamp)
+        else:
+            self.record(event.kind, event.x, event.y, key=event.key, timestamp=timestamp)
+
+    def _dispatch_instantly(self, events: Sequence[TimelineEvent], is_cancelled: Callable[[], bool], on_step: Optional[Callable[[int], None]]) -> bool:
+        start = time.perf_counter()
+        for event in events:
+            if is_cancelled():
+                return False
+            if event.kind == "step":
+                if on_step:
+                    on_step(event.step)
+            else:
+                self._dispatch(event, timestamp=start + event.time)
+        return True
+
+    def dispatch_timeline(self, events: Sequence[TimelineEvent], cancel_event: Optional[threading.Event] = None, on_step: Optional[Callable[[int], None]] = None) -> bool:
+        if self.realtime:
+            return run_timeline(events, self._dispatch, cancel_event=cancel_event, on_step=on_step)
+        return self._dispatch_instantly(events, lambda: bool(cancel_event and cancel_event.is_set()), on_step)
+
+    async def async_dispatch_timeline(self, events: Sequence[TimelineEvent], cancel_event: Optional[asyncio.Event] = None, on_step: Optional[Callable[[int], None]] = None) -> bool:
+        if self.realtime:
+            return await async_run_timeline(events, self._dispatch, cancel_event=cancel_event, on_step=on_step)
+        return self._dispatch_instantly(events, lambda: bool(cancel_event and cancel_event.is_set()), on_step)
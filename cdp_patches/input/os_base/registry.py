@@ -0,0 +1,234 @@
+import asyncio
+import os
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Literal, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from cdp_patches import is_windows
+from cdp_patches.input.os_base.backend import WindowInfo
+from cdp_patches.input.timeline import TimelineEvent, async_run_in_thread
+
+
+class SharedBackend:
+    """
+    Cheap per-Handle View over a Backend shared by all Handles of one Browser (see BackendRegistry).
+    The shared Backend keeps a Scale Factor of 1, every View scales its own Coordinates, so Pages with different Device Scale Factors can share it.
+    Views bound to different Windows (bind_window) switch the shared Backend to their Window before sending Input.
+    Everything else (Connections, held Modifiers) is read from the shared Backend.
+    """
+
+    def __init__(self, registry: "BackendRegistry", key: Hashable, backend: Any, scale_factor: float, lock: Any) -> None:
+        self.registry = registry
+        self.key = key
+        self.backend = backend
+        self.lock = lock
+        self.pid = getattr(backend, "pid", None)
+        self.scale_factor = scale_factor
+        # Window of this View, None follows the first Window of the Browser
+        self.window_id: Optional[int] = None
+        self.closed = False
+        # Handles dropped without close() still release their Reference once garbage collected
+        self._release = weakref.finalize(self, registry.release, key)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "backend":
+            raise AttributeError(name)
+        return getattr(self.backend, name)
+
+    def close(self) -> None:
+        self.closed = True
+        self._release()
+
+    def include_windows_scale_factor(self) -> None:
+        from cdp_patches.input.os_base.windows import windows_scale_factor
+
+        self.scale_factor *= windows_scale_factor()
+
+    def _scale(self, value: int) -> int:
+        return int(value * self.scale_factor)
+
+    def _scale_amount(self, amount: int) -> int:
+        # WindowsBase scales Scroll Amounts as well
+        return self._scale(amount) if is_windows else amount
+
+    def _scale_event(self, event: TimelineEvent) -> TimelineEvent:
+        if event.kind in ("move", "down", "up"):
+            return event._replace(x=self._scale(event.x), y=self._scale(event.y))
+        elif event.kind == "scroll":
+            return event._replace(amount=self._scale_amount(event.amount))
+        return event
+
+    def _select_window(self) -> None:
+        # Switching between indexed Windows needs no Tree Walk
+        if getattr(self.backend, "bound_window_id", None) != self.window_id:
+            self.backend.bind_window(self.window_id)
+
+    @contextmanager
+    def _selected(self) -> Iterator[None]:
+        with self.lock:
+            self._select_window()
+            yield
+
+    def bind_window(self, window: Optional[Union[int, WindowInfo]]) -> Optional[WindowInfo]:
+        with self.lock:
+            info: Optional[WindowInfo] = self.backend.bind_window(window)
+            self.window_id = None if info is None else info.id
+            return info
+
+    def bind_cdp_window(self, cdp_window_id: int, bounds: Dict[str, Any]) -> WindowInfo:
+        with self.lock:
+            info: WindowInfo = self.backend.bind_cdp_window(cdp_window_id, bounds)
+            self.window_id = info.id
+            return info
+
+    def calibrate(self, content_x: int, content_y: int) -> None:
+        with self._selected():
+            self.backend.calibrate(content_x, content_y)
+
+    def client_origin(self) -> Tuple[int, int]:
+        with self._selected():
+            client_origin: Tuple[int, int] = self.backend.client_origin()
+            return client_origin
+
+    def get_window(self) -> Any:
+        with self.lock:
+            # Only the first Handle searches the Window Tree, later ones just check that the found Window is still alive
+            if getattr(self.backend, "browser_window", None) is None:
+                return self.backend.get_window()
+            self._select_window()
+            self.backend.ensure_window()
+            return self.backend.browser_window
+
+    async def async_get_window(self) -> Any:
+        if getattr(self.backend, "browser_window", None) is None:
+            return await self.backend.async_get_window()
+        # Waiting for the Lock mustnt block the Event Loop
+        return await asyncio.get_running_loop().run_in_executor(None, self.get_window)
+
+    def down(self, button: Literal["left", "right", "middle"], x: int, y: int) -> None:
+        with self._selected():
+            self.backend.down(button=button, x=self._scale(x), y=self._scale(y))
+
+    def up(self, button: Literal["left", "right", "middle"], x: int, y: int) -> None:
+        with self._selected():
+            self.backend.up(button=button, x=self._scale(x), y=self._scale(y))
+
+    def move(self, x: int, y: int) -> None:
+        with self._selected():
+            self.backend.move(x=self._scale(x), y=self._scale(y))
+
+    def scroll(self, direction: Literal["up", "down", "left", "right"], amount: int) -> None:
+        with self._selected():
+            self.backend.scroll(direction=direction, amount=self._scale_amount(amount))
+
+    def send_keystrokes(self, text: str) -> None:
+        with self._selected():
+            self.backend.send_keystrokes(text)
+
+    def press_modifiers(self, modifiers: Sequence[str]) -> None:
+        with self._selected():
+            self.backend.press_modifiers(modifiers)
+
+    def release_modifiers(self, modifiers: Sequence[str]) -> None:
+        with self._selected():
+            self.backend.release_modifiers(modifiers)
+
+    def send_chord(self, modifiers: Sequence[str], key: str) -> None:
+        with self._selected():
+            self.backend.send_chord(modifiers, key)
+
+    def paste(self, text: str) -> None:
+        self.send_paste(text)()
+
+    def send_paste(self, text: str) -> Callable[[], None]:
+        # Waiting for the Browser to read the Text runs without the Lock, other Views keep sending Input meanwhile
+        with self._selected():
+            send_paste = getattr(self.backend, "send_paste", None)
+            if send_paste is None:
+                self.backend.paste(text)
+                return lambda: None
+            finish: Callable[[], None] = send_paste(text)
+            return finish
+
+    def capture(self, x: int = 0, y: int = 0, width: Optional[int] = None, height: Optional[int] = None) -> np.ndarray:
+        with self._selected():
+            capture: np.ndarray = self.backend.capture(x=self._scale(x), y=self._scale(y), width=None if width is None else self._scale(width), height=None if height is None else self._scale(height))
+            return capture
+
+    def send_keystrokes_timeline(self, keys: Sequence[str], timestamps: np.ndarray) -> None:
+        self.dispatch_timeline([TimelineEvent(timestamp, "key", key=key) for key, timestamp in zip(keys, timestamps.tolist())])
+
+    async def async_send_keystrokes_timeline(self, keys: Sequence[str], timestamps: np.ndarray) -> None:
+        await self.async_dispatch_timeline([TimelineEvent(timestamp, "key", key=key) for key, timestamp in zip(keys, timestamps.tolist())])
+
+    def dispatch_timeline(self, events: Sequence[TimelineEvent], cancel_event: Optional[threading.Event] = None, on_step: Optional[Callable[[int], None]] = None) -> bool:
+        # Held for the whole Timeline, so other Views cant switch the Window in between
+        with self._selected():
+            completed: bool = self.backend.dispatch_timeline([self._scale_event(event) for event in events], cancel_event=cancel_event, on_step=on_step)
+            return completed
+
+    async def async_dispatch_timeline(self, events: Sequence[TimelineEvent], cancel_event: Optional[asyncio.Event] = None, on_step: Optional[Callable[[int], None]] = None) -> bool:
+        # A threading Lock cant be held across awaits, the Timeline is dispatched under it in a Worker Thread instead
+        return await async_run_in_thread(self.dispatch_timeline, events, cancel_event=cancel_event, on_step=on_step)
+
+
+class BackendRegistry:
+    """
+    Shares one Backend per Key (Display, PID & X Backend) between all Input Handles of this Process, closed once the last Handle released it.
+    Handles release their Reference with close(), or once they are garbage collected.
+    """
+
+    def __init__(self) -> None:
+        self.entries: Dict[Hashable, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Hashable, factory: Callable[[], Any], scale_factor: float = 1.0) -> SharedBackend:
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                backend = factory()
+                # Views switch the Window & send Input under the Lock of the Backend (LinuxBase locks per Display)
+                entry = self.entries[key] = [backend, 0, getattr(backend, "lock", None) or threading.RLock()]
+            entry[1] += 1
+            return SharedBackend(self, key, entry[0], scale_factor, entry[2])
+
+    def release(self, key: Hashable) -> None:
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            del self.entries[key]
+        entry[0].close()
+
+    def close(self) -> None:
+        """Closes every Backend, even if Handles still reference it"""
+        with self._lock:
+            entries = list(self.entries.values())
+            self.entries.clear()
+        for backend, _, _ in entries:
+            backend.close()
+
+    def references(self, key: Hashable) -> int:
+        entry = self.entries.get(key)
+        references: int = entry[1] if entry else 0
+        return references
+
+    def input_backend(self, pid: int, scale_factor: float, x_backend: Literal["xlib", "xcb"] = "xlib") -> SharedBackend:
+        """Shared WindowsBase or LinuxBase of the Browser Process"""
+        if is_windows:
+            from cdp_patches.input.os_base.windows import WindowsBase
+
+            return self.acquire((None, pid, None), lambda: WindowsBase(pid, 1.0), scale_factor)
+
+        from cdp_patches.input.os_base.linux import LinuxBase
+
+        return self.acquire((os.getenv("DISPLAY"), pid, x_backend), lambda: LinuxBase(pid, 1.0, x_backend=x_backend), scale_factor)
+
+
+backend_registry = BackendRegistry()
@@ -0,0 +1,166 @@
+import select
+import threading
+from typing import Any, Dict, Optional, Set, Tuple
+
+from Xlib import X, Xatom, display
+from Xlib.protocol import event as xevent
+
+# Selections filled for a Paste (Ctrl+V reads CLIPBOARD, Middle-Click reads PRIMARY)
+selection_names = ("CLIPBOARD", "PRIMARY")
+
+
+class SelectionOwner:
+    """
+    Owns the X Selections for a Text & serves it to Requestors (e.g. Chrome on Ctrl+V) from a Background Thread.
+    Uses its own Display Connection, so SelectionRequests dont get mixed up with the Events of the Input Connection.
+    Texts larger than one X Request are transferred incrementally (INCR).
+    """
+
+    # Seconds own() waits for the previous Owner of a Selection to hand out its Text
+    fetch_timeout: float = 0.2
+
+    def __init__(self, display_name: Optional[str]) -> None:
+        self.display = display.Display(display_name)
+        # Unmapped Window, only needed to own the Selections
+        self.window = self.display.screen().root.create_window(0, 0, 1, 1, 0, X.CopyFromParent)
+        self.atoms = {name: self.display.intern_atom(name) for name in selection_names + ("TARGETS", "UTF8_STRING", "TEXT", "INCR", "CDP_PATCHES_SELECTION")}
+        # Largest Property written in one ChangeProperty Request (its Header takes 24 Bytes)
+        self.chunk_size = self.display.display.info.max_request_length * 4 - 24
+
+        # Text served per Selection Atom, None refuses Requests
+        self.texts: Dict[int, Optional[str]] = {}
+        # Texts the Selections held before own(), served again by restore()
+        self.previous: Dict[int, Optional[str]] = {}
+        self.owned: Set[int] = set()
+        # Set once a Requestor fetched the whole Text
+        self.served = threading.Event()
+        # Pending INCR Transfers per (Requestor Window Id, Property): [Requestor, Type, Data, Offset]
+        self.transfers: Dict[Tuple[int, int], Any] = {}
+        # Texts converted from other Owners per Selection Atom (SelectionNotify)
+        self.fetched: Dict[int, Optional[str]] = {}
+        self.fetch_done = threading.Event()
+
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._serve, name="cdp-patches-selection", daemon=True)
+        self._thread.start()
+
+    def own(self, text: str) -> None:
+        """Takes over the Selections for the Text, served until restore(), another Client takes them over or close() is called"""
+        # Fetched before taking the Lock, the Serve Thread receives the Replies
+        previous = {self.atoms[name]: self.current_text(self.atoms[name]) for name in selection_names}
+        with self._lock:
+            self.previous = previous
+            self.texts = {atom: text for atom in previous}
+            self.served.clear()
+            self.transfers.clear()
+            for name in selection_names:
+                self.window.set_selection_owner(self.atoms[name], X.CurrentTime)
+                self.owned.add(self.atoms[name])
+
+            if self.display.get_selection_owner(self.atoms["CLIPBOARD"]).id != self.window.id:
+                raise RuntimeError("Couldn't take over the X Clipboard.")
+
+    def restore(self) -> None:
+        """Serves the Texts the Selections held before own() again. Only Text is restored, other Formats (e.g. Images) of the previous Owner are lost"""
+        with self._lock:
+            self.texts = dict(self.previous)
+
+    def current_text(self, selection: int) -> Optional[str]:
+        """Text the Selection currently holds, None if it has no Owner or its Owner doesnt hand out UTF-8 Text in time"""
+        if selection in self.owned:
+            return self.texts.get(selection)
+        if self.display.get_selection_owner(selection) == X.NONE:
+            return None
+
+        self.fetch_done.clear()
+        self.fetched.pop(selection, None)
+        self.window.convert_selection(selection, self.atoms["UTF8_STRING"], self.atoms["CDP_PATCHES_SELECTION"], X.CurrentTime)
+        self.display.flush()
+        if not self.fetch_done.wait(self.fetch_timeout):
+            return None
+        return self.fetched.get(selection)
+
+    def close(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+        self.window.destroy()
+        self.display.close()
+
+    def _serve(self) -> None:
+        fileno = self.display.fileno()
+        while not self._stopped.is_set():
+            # Wakes up regularly to notice close()
+            select.select([fileno], [], [], 0.1)
+            with self._lock:
+                while self.display.pending_events():
+                    self._handle_event(self.display.next_event())
+
+    def _handle_event(self, event: Any) -> None:
+        if event.type == X.SelectionRequest:
+            self._on_selection_request(event)
+        elif event.type == X.SelectionNotify:
+            self._on_selection_notify(event)
+        elif event.type == X.SelectionClear:
+            self.owned.discard(event.atom)
+        elif event.type == X.PropertyNotify and event.state == X.PropertyDelete:
+            # The Requestor read the last Chunk of an INCR Transfer
+            transfer = self.transfers.get((event.window.id, event.atom))
+            if transfer:
+                self._send_chunk(event.atom, transfer)
+
+    def _on_selection_request(self, request: Any) -> None:
+        # Obsolete Clients pass no Property, the Target is used instead
+        property_atom = request.property or request.target
+        target = request.target
+        requestor = request.requestor
+        text = self.texts.get(request.selection)
+
+        if text is None or request.selection not in self.owned:
+            property_atom = X.NONE
+        elif target == self.atoms["TARGETS"]:
+            requestor.change_property(property_atom, Xatom.ATOM, 32, [self.atoms["TARGETS"], self.atoms["UTF8_STRING"], self.atoms["TEXT"], Xatom.STRING])
+        elif target in (self.atoms["UTF8_STRING"], self.atoms["TEXT"], Xatom.STRING):
+            if target == Xatom.STRING:
+                property_type, data = Xatom.STRING, text.encode("latin-1", errors="replace")
+            else:
+                property_type, data = self.atoms["UTF8_STRING"], text.encode()
+
+            if len(data) > self.chunk_size:
+                # Announced with the Size, the Chunks follow once the Requestor deleted the Property
+                requestor.change_attributes(event_mask=X.PropertyChangeMask)
+                requestor.change_property(property_atom, self.atoms["INCR"], 32, [len(data)])
+                self.transfers[(requestor.id, property_atom)] = [requestor, property_type, data, 0]
+            else:
+                requestor.change_property(property_atom, property_type, 8, data)
+                self.served.set()
+        else:
+            property_atom = X.NONE
+
+        notify = xevent.SelectionNotify(time=request.time, requestor=requestor, selection=request.selection, target=target, property=property_atom)
+        requestor.send_event(notify)
+        self.display.flush()
+
+    def _on_selection_notify(self, notify: Any) -> None:
+        text = None
+        if notify.property != X.NONE:
+            reply = self.window.get_full_property(notify.property, X.AnyPropertyType)
+            # Texts the Owner transfers incrementally (INCR) arent restored
+            if reply is not None and reply.property_type == self.atoms["UTF8_STRING"]:
+                text = bytes(reply.value).decode(errors="replace")
+            self.window.delete_property(notify.property)
+        self.fetched[notify.selection] = text
+        self.fetch_done.set()
+
+    def _send_chunk(self, property_atom: int, transfer: Any) -> None:
+        requestor, property_type, data, offset = transfer
+        end = offset + self.chunk_size
+        chunk = data[offset:end]
+        requestor.change_property(property_atom, property_type, 8, chunk)
+        transfer[3] = end
+        if not chunk:
+            # The empty Chunk ends the Transfer
+            del self.transfers[(requestor.id, property_atom)]
+            requestor.change_attributes(event_mask=X.NoEventMask)
+            self.served.set()
+        self.display.flush()
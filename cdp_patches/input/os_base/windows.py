@@ -1,15 +1,22 @@
 import asyncio
 import ctypes
 import re
+import threading
 import warnings
-from typing import List, Literal, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Set, Tuple, Union
 
+import numpy as np
 from pywinauto import application, timings
 from pywinauto.application import WindowSpecification
 from pywinauto.base_wrapper import ElementNotVisible
 from pywinauto.controls.hwndwrapper import HwndWrapper, InvalidWindowHandle
+from pywinauto.win32structures import RECT
 
 from cdp_patches.input.exceptions import WindowClosedException
+from cdp_patches.input.os_base.backend import WindowInfo, match_window_bounds
+from cdp_patches.input.os_base.clipboard import ClipboardOwner
+from cdp_patches.input.rate_control import RateController
+from cdp_patches.input.timeline import TimelineEvent, async_run_timeline, run_timeline
 
 timings.Timings.fast()
 timings.TimeConfig._timings["sendmessagetimeout_timeout"] = 0
@@ -36,6 +43,19 @@ def get_top_window(app: application.Application, windows=List[Union[WindowSpecif
     return WindowSpecification(criteria, allow_magic_lookup=app.allow_magic_lookup)
 
 
+def windows_scale_factor() -> float:
+    """Display Scale (DPI) configured in Windows, e.g. 1.5 for 150%"""
+    scale_factor: float = ctypes.windll.shcore.GetScaleFactorForDevice(0) / 100
+    return scale_factor
+
+
+modifier_virtual_keys = {"ctrl": "VK_CONTROL", "shift": "VK_SHIFT", "alt": "VK_MENU", "meta": "VK_LWIN"}
+modifier_mouse_flags = {"ctrl": "control", "shift": "shift"}
+
+# The Clipboard is shared by the whole Session: Pastes wait until the previous one was read, other Input doesnt
+clipboard_lock = threading.Lock()
+
+
 class WindowsBase:
     browser_window: Union[WindowSpecification, HwndWrapper]
     hwnd: int
@@ -43,15 +63,34 @@ class WindowsBase:
     scale_factor: float = 1.0
     toolbar_height: int = 0
     win32_app: application.Application = None
+    # Window all Input is sent to (bind_window) & the Top-Level Window currently selected
+    bound_window_id: Optional[int] = None
+    window_id: int = 0
+    # Renders the Clipboard Text for paste, created with the first Paste
+    _clipboard_owner: Optional[ClipboardOwner] = None
+    # Seconds paste waits for the Browser to read the Text
+    paste_timeout: float = 1.0
 
     def __init__(self, pid: int, scale_factor: float) -> None:
         self.pid = pid
         self.scale_factor = scale_factor
-        self._loop = asyncio.get_event_loop()
+        # Buttons currently held down, so Moves are sent as Drags (WM_MOUSEMOVE with the matching MK_* Flags)
+        self.pressed_buttons: Set[str] = set()
+        # Modifiers held explicitly (press_modifiers), across Clicks & Keys
+        self.held_modifiers: Set[str] = set()
+        # Visible Browser Windows of the PID, from the last Indexing
+        self.windows: List[WindowInfo] = []
+        # Window Messages have no Round-Trip to measure, so this stays at full Density
+        self.rate_controller = RateController()
+
+    def close(self) -> None:
+        # pywinauto holds no Connection to release, only the Clipboard Window has to be destroyed
+        if self._clipboard_owner:
+            self._clipboard_owner.close()
+            self._clipboard_owner = None
 
     def include_windows_scale_factor(self):
-        windows_scale_factor = ctypes.windll.shcore.GetScaleFactorForDevice(0) / 100
-        self.scale_factor *= windows_scale_factor
+        self.scale_factor *= windows_scale_factor()
 
     def get_window(
         self,
@@ -65,14 +104,27 @@ class WindowsBase:
             windows = self.win32_app.windows()
         except InvalidWindowHandle:
             raise WindowClosedException(pid=self.pid)
+        return self._select_window(windows)
+
+    def _select_window(self, windows: List[HwndWrapper]) -> WindowSpecification:
         if not windows:
             raise WindowClosedException(f"No windows found for PID: {self.pid}")
-        for window in windows:
-            if window.element_info.class_name == "Chrome_WidgetWin_1" and window.is_visible():
-                self.browser_window = window
-                break
+        if self.bound_window_id is not None:
+            # The bound Window (bind_window), otherwise the first visible one
+            for window in windows:
+                if window.handle == self.bound_window_id:
+                    self.browser_window = window
+                    break
+            else:
+                raise WindowClosedException(f"Bound Window {self.bound_window_id} of PID {self.pid} was closed.")
         else:
-            self.browser_window = get_top_window(self.win32_app, windows)
+            for window in windows:
+                if window.element_info.class_name == "Chrome_WidgetWin_1" and window.is_visible():
+                    self.browser_window = window
+                    break
+            else:
+                self.browser_window = get_top_window(self.win32_app, windows)
+        self.window_id = self.browser_window.handle
 
         for child in self.browser_window.iter_children():
             if child.element_info.class_name == "Chrome_RenderWidgetHostHWND":
@@ -89,6 +141,54 @@ class WindowsBase:
 
         return self.browser_window
 
+    def index_windows(self, timeout: float = 1) -> List[WindowInfo]:
+        """Indexes every visible Browser Window of the PID (Title, Geometry & CDP Window Id once bound)"""
+        if self.win32_app is None:
+            self.win32_app = application.Application(backend="win32")
+            self.win32_app.connect(process=self.pid, timeout=timeout)
+
+        cdp_window_ids = {info.id: info.cdp_window_id for info in self.windows}
+        windows: List[WindowInfo] = []
+        for window in self.win32_app.windows():
+            if window.element_info.class_name != "Chrome_WidgetWin_1" or not window.is_visible():
+                continue
+            rect = window.rectangle()
+            windows.append(WindowInfo(window, window.handle, window.window_text(), rect.left, rect.top, rect.width(), rect.height(), cdp_window_ids.get(window.handle)))
+
+        self.windows = windows
+        return windows
+
+    def bind_window(self, window: Optional[Union[int, WindowInfo]]) -> Optional[WindowInfo]:
+        """Sends all Input to one indexed Window (by HWND). None follows the first Window again"""
+        if window is None:
+            self.bound_window_id = None
+            self.get_window()
+            return None
+
+        window_id = window.id if isinstance(window, WindowInfo) else window
+        info = next((info for info in self.windows if info.id == window_id), None)
+        if info is None:
+            # Opened after the last Indexing
+            info = next((info for info in self.index_windows() if info.id == window_id), None)
+            if info is None:
+                raise WindowClosedException(f"Window {window_id} of PID {self.pid} not found.")
+
+        self.bound_window_id = window_id
+        if self.window_id != window_id:
+            self._select_window([info.window])
+        return info
+
+    def bind_cdp_window(self, cdp_window_id: int, bounds: Dict[str, Any]) -> WindowInfo:
+        """Binds the Window with the CDP Window Id (Browser.getWindowForTarget), matched once by its Bounds & remembered in the Index"""
+        info = next((info for info in self.windows if info.cdp_window_id == cdp_window_id), None)
+        if info is None:
+            self.index_windows()
+            info = match_window_bounds([info for info in self.windows if info.cdp_window_id is None] or self.windows, bounds)._replace(cdp_window_id=cdp_window_id)
+            self.windows = [info if indexed.id == info.id else indexed for indexed in self.windows]
+
+        self.bind_window(info)
+        return info
+
     def ensure_window(self) -> None:
         try:
             if not self.browser_window.is_visible():
@@ -100,50 +200,52 @@ class WindowsBase:
         if self.win32_app is None:
             # save time
             self.win32_app = application.Application(backend="win32")
-            await self._loop.run_in_executor(None, lambda: self.win32_app.connect(process=self.pid, timeout=timeout))
+            await asyncio.get_running_loop().run_in_executor(None, lambda: self.win32_app.connect(process=self.pid, timeout=timeout))
 
         windows = self.win32_app.windows()
-        if not windows:
-            raise WindowClosedException(f"No windows found for PID: {self.pid}")
-        for window in windows:
-            if window.element_info.class_name == "Chrome_WidgetWin_1" and window.is_visible():
-                self.browser_window = window
-                break
-        else:
-            self.browser_window = get_top_window(self.win32_app, windows)
+        return self._select_window(windows)
 
-        for child in self.browser_window.iter_children():
-            if child.element_info.class_name == "Chrome_RenderWidgetHostHWND":
-                self.browser_window = child
+    def client_origin(self) -> Tuple[int, int]:
+        """Screen Position of the Client Area (the Viewport), all Input Coordinates are relative to it"""
+        self.ensure_window()
+        origin_x, origin_y = self.browser_window.client_to_screen((0, 0))
+        return int(origin_x), int(origin_y)
 
-        self.hwnd = self.browser_window.handle
-        # Perform Window Checks
-        try:
-            self.browser_window.verify_actionable()
-        except ElementNotVisible:
-            raise WindowClosedException(pid=self.pid)
-        if not self.browser_window.is_normal():
-            raise WindowClosedException(pid=self.pid)
+    def capture(self, x: int = 0, y: int = 0, width: Optional[int] = None, height: Optional[int] = None) -> np.ndarray:
+        # Input Coordinates are Client-relative, the Capture Rectangle is in Screen Coordinates
+        origin_x, origin_y = self.client_origin()
+        client_rect = self.browser_window.client_rect()
+        client_right, client_bottom = origin_x + client_rect.width(), origin_y + client_rect.height()
+        left = origin_x + int(x * self.scale_factor)
+        top = origin_y + int(y * self.scale_factor)
+        right = client_right if width is None else min(client_right, left + int(width * self.scale_factor))
+        bottom = client_bottom if height is None else min(client_bottom, top + int(height * self.scale_factor))
 
-        return self.browser_window
+        image = self.browser_window.capture_as_image(RECT(left, top, right, bottom))
+        if image is None:
+            raise ImportError("Pillow is required to capture windows on Windows.")
+        return np.asarray(image)
 
     def down(self, button: Literal["left", "right", "middle"], x: int, y: int) -> None:
         self.ensure_window()
-        self.browser_window.press_mouse(button=button, coords=(int(x * self.scale_factor), int(y * self.scale_factor)))
+        self.browser_window.press_mouse(button=button, coords=(int(x * self.scale_factor), int(y * self.scale_factor)), pressed=self._pressed_flags())
+        self.pressed_buttons.add(button)
 
     def up(self, button: Literal["left", "right", "middle"], x: int, y: int) -> None:
         self.ensure_window()
-        self.browser_window.release_mouse(button=button, coords=(int(x * self.scale_factor), int(y * self.scale_factor)))
+        self.pressed_buttons.discard(button)
+        self.browser_window.release_mouse(button=button, coords=(int(x * self.scale_factor), int(y * self.scale_factor)), pressed=self._pressed_flags())
 
     def move(self, x: int, y: int) -> None:
         self.ensure_window()
-        self.browser_window.move_mouse(coords=(int(x * self.scale_factor), int(y * self.scale_factor)), pressed="left")
+        self.browser_window.move_mouse(coords=(int(x * self.scale_factor), int(y * self.scale_factor)), pressed=self._pressed_flags())
 
     def scroll(self, direction: Literal["up", "down", "left", "right"], amount: int) -> None:
         self.ensure_window()
         self.browser_window.scroll(direction=direction, amount="line", count=int(amount * self.scale_factor))
 
-    def send_keystrokes(self, text: str) -> None:
+    @staticmethod
+    def _escape_keystrokes(text: str) -> str:
         # Unmodifying Pywinauto's modifiers & adding down/up modifiers
         modified_text = ""
         selective_regex = re.compile(r"{[^{}]*}|.")
@@ -153,6 +255,119 @@ class WindowsBase:
                 key = "{" + key + "}"
 
             modified_text += key
+        return modified_text
 
+    def send_keystrokes(self, text: str) -> None:
+        modified_text = self._escape_keystrokes(text)
         self.ensure_window()
         self.browser_window.send_keystrokes(modified_text)
+
+    @staticmethod
+    def _chord_key(key: str) -> str:
+        if len(key) == 1:
+            return WindowsBase._escape_keystrokes(key)
+        return key if key[0] == "{" else "{" + key + "}"
+
+    def press_modifiers(self, modifiers: Sequence[str]) -> None:
+        self.ensure_window()
+        pressed = [modifier for modifier in modifiers if modifier not in self.held_modifiers]
+        self.browser_window.send_keystrokes("".join(f"{{{modifier_virtual_keys[modifier]} down}}" for modifier in pressed))
+        self.held_modifiers.update(pressed)
+
+    def release_modifiers(self, modifiers: Sequence[str]) -> None:
+        self.ensure_window()
+        released = [modifier for modifier in reversed(modifiers) if modifier in self.held_modifiers]
+        self.browser_window.send_keystrokes("".join(f"{{{modifier_virtual_keys[modifier]} up}}" for modifier in released))
+        self.held_modifiers.difference_update(released)
+
+    def send_chord(self, modifiers: Sequence[str], key: str) -> None:
+        self.ensure_window()
+        # Modifiers already held (e.g. by press_modifiers) stay pressed
+        chord_modifiers = [modifier_virtual_keys[modifier] for modifier in modifiers if modifier not in self.held_modifiers]
+        downs = "".join(f"{{{virtual_key} down}}" for virtual_key in chord_modifiers)
+        ups = "".join(f"{{{virtual_key} up}}" for virtual_key in reversed(chord_modifiers))
+        self.browser_window.send_keystrokes(downs + self._chord_key(key) + ups)
+
+    def paste(self, text: str) -> None:
+        """Fills the Text through the Clipboard with one Ctrl+V, independent of its Length. The previous Clipboard Text is restored afterwards"""
+        self.send_paste(text)()
+
+    def send_paste(self, text: str) -> Callable[[], None]:
+        """
+        Takes over the Clipboard for the Text & sends the Ctrl+V.
+        Returns the Function waiting for the Browser to read the Text & restoring the previous one, called without holding the Lock.
+        """
+        if not text:
+            return lambda: None
+        clipboard_lock.acquire()
+        try:
+            self.ensure_window()
+            if self._clipboard_owner is None:
+                self._clipboard_owner = ClipboardOwner()
+            clipboard_owner = self._clipboard_owner
+            clipboard_owner.own(text)
+            self.send_chord(["ctrl"], "v")
+        except BaseException:
+            clipboard_lock.release()
+            raise
+
+        def finish() -> None:
+            try:
+                # Chrome reads the Clipboard asynchronously, the next Paste mustnt replace the Text before
+                clipboard_owner.served.wait(self.paste_timeout)
+                clipboard_owner.restore()
+            finally:
+                clipboard_lock.release()
+
+        return finish
+
+    def send_keystrokes_timeline(self, keys: Sequence[str], timestamps: np.ndarray) -> None:
+        self.dispatch_timeline([TimelineEvent(timestamp, "key", key=key) for key, timestamp in zip(keys, timestamps.tolist())])
+
+    async def async_send_keystrokes_timeline(self, keys: Sequence[str], timestamps: np.ndarray) -> None:
+        await self.async_dispatch_timeline([TimelineEvent(timestamp, "key", key=key) for key, timestamp in zip(keys, timestamps.tolist())])
+
+    def _pressed_flags(self) -> str:
+        # MK_* Flags of Mouse Messages, Alt & Win have none
+        flags = self.pressed_buttons | {modifier_mouse_flags[modifier] for modifier in self.held_modifiers if modifier in modifier_mouse_flags}
+        return " ".join(sorted(flags))
+
+    def _timeline_dispatcher(self) -> Tuple[Callable[[TimelineEvent], None], Set[str]]:
+        self.ensure_window()
+        pressed_buttons = self.pressed_buttons
+
+        def dispatch(event: TimelineEvent) -> None:
+            coords = (int(event.x * self.scale_factor), int(event.y * self.scale_factor))
+            if event.kind == "key":
+                self.browser_window.send_keystrokes(self._escape_keystrokes(event.key))
+            elif event.kind == "move":
+                self.browser_window.move_mouse(coords=coords, pressed=self._pressed_flags())
+            elif event.kind == "down":
+                self.browser_window.press_mouse(button=event.key, coords=coords, pressed=self._pressed_flags())
+                pressed_buttons.add(event.key)
+            elif event.kind == "up":
+                pressed_buttons.discard(event.key)
+                self.browser_window.release_mouse(button=event.key, coords=coords, pressed=self._pressed_flags())
+            elif event.kind == "scroll":
+                self.browser_window.scroll(direction=event.key, amount="line", count=int(event.amount * self.scale_factor))
+
+        return dispatch, pressed_buttons
+
+    def _release_buttons(self, pressed_buttons: Set[str]) -> None:
+        for button in list(pressed_buttons):
+            self.browser_window.release_mouse(button=button)
+        pressed_buttons.clear()
+
+    def dispatch_timeline(self, events: Sequence[TimelineEvent], cancel_event: Optional[threading.Event] = None, on_step: Optional[Callable[[int], None]] = None) -> bool:
+        dispatch, pressed_buttons = self._timeline_dispatcher()
+        completed = run_timeline(events, dispatch, cancel_event=cancel_event, on_step=on_step)
+        if not completed:
+            self._release_buttons(pressed_buttons)
+        return completed
+
+    async def async_dispatch_timeline(self, events: Sequence[TimelineEvent], cancel_event: Optional[asyncio.Event] = None, on_step: Optional[Callable[[int], None]] = None) -> bool:
+        dispatch, pressed_buttons = self._timeline_dispatcher()
+        completed = await async_run_timeline(events, dispatch, cancel_event=cancel_event, on_step=on_step)
+        if not completed:
+            self._release_buttons(pressed_buttons)
+        return completed
@@ -0,0 +1,263 @@
+import ctypes
+import ctypes.util
+from typing import Optional
+
+import numpy as np
+
+IPC_PRIVATE = 0
+IPC_CREAT = 0o1000
+IPC_RMID = 0
+XCB_IMAGE_FORMAT_Z_PIXMAP = 2
+
+
+class _Cookie(ctypes.Structure):
+    _fields_ = [("sequence", ctypes.c_uint)]
+
+
+class _Libraries:
+    xcb: ctypes.CDLL
+    xtest: ctypes.CDLL
+    libc: ctypes.CDLL
+    shm: Optional[ctypes.CDLL] = None
+    xinput: Optional[ctypes.CDLL] = None
+
+
+_libraries: Optional[_Libraries] = None
+
+
+def _load_library(name: str) -> ctypes.CDLL:
+    path = ctypes.util.find_library(name)
+    if not path:
+        raise EnvironmentError(f"Shared library lib{name} not found! Install it to use the XCB backend.")
+    return ctypes.CDLL(path)
+
+
+def load_libraries() -> _Libraries:
+    global _libraries
+    if _libraries is not None:
+        return _libraries
+
+    libs = _Libraries()
+    libs.xcb = _load_library("xcb")
+    libs.xtest = _load_library("xcb-xtest")
+    libs.libc = _load_library("c")
+
+    libs.xcb.xcb_connect.argtypes = [ctypes.c_char_p, ctypes.POINTER(ctypes.c_int)]
+    libs.xcb.xcb_connect.restype = ctypes.c_void_p
+    libs.xcb.xcb_connection_has_error.argtypes = [ctypes.c_void_p]
+    libs.xcb.xcb_connection_has_error.restype = ctypes.c_int
+    libs.xcb.xcb_disconnect.argtypes = [ctypes.c_void_p]
+    libs.xcb.xcb_disconnect.restype = None
+    libs.xcb.xcb_flush.argtypes = [ctypes.c_void_p]
+    libs.xcb.xcb_flush.restype = ctypes.c_int
+    # GetInputFocus is the cheapest request with a reply, used for round-trips (like XSync)
+    libs.xcb.xcb_get_input_focus.argtypes = [ctypes.c_void_p]
+    libs.xcb.xcb_get_input_focus.restype = _Cookie
+    libs.xcb.xcb_get_input_focus_reply.argtypes = [ctypes.c_void_p, _Cookie, ctypes.POINTER(ctypes.c_void_p)]
+    libs.xcb.xcb_get_input_focus_reply.restype = ctypes.c_void_p
+
+    # type, detail, time, root, rootX, rootY, deviceid
+    libs.xtest.xcb_test_fake_input.argtypes = [ctypes.c_void_p, ctypes.c_uint8, ctypes.c_uint8, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_int16, ctypes.c_int16, ctypes.c_uint8]
+    libs.xtest.xcb_test_fake_input.restype = _Cookie
+
+    libs.libc.free.argtypes = [ctypes.c_void_p]
+    libs.libc.free.restype = None
+
+    _libraries = libs
+    return libs
+
+
+def load_shm_library() -> ctypes.CDLL:
+    libs = load_libraries()
+    if libs.shm is not None:
+        return libs.shm
+
+    shm = _load_library("xcb-shm")
+    shm.xcb_shm_query_version.argtypes = [ctypes.c_void_p]
+    shm.xcb_shm_query_version.restype = _Cookie
+    shm.xcb_shm_query_version_reply.argtypes = [ctypes.c_void_p, _Cookie, ctypes.POINTER(ctypes.c_void_p)]
+    shm.xcb_shm_query_version_reply.restype = ctypes.c_void_p
+    # shmseg, shmid, read_only
+    shm.xcb_shm_attach.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_uint8]
+    shm.xcb_shm_attach.restype = _Cookie
+    shm.xcb_shm_detach.argtypes = [ctypes.c_void_p, ctypes.c_uint32]
+    shm.xcb_shm_detach.restype = _Cookie
+    # drawable, x, y, width, height, plane_mask, format, shmseg, offset
+    shm.xcb_shm_get_image.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_uint32,
+        ctypes.c_int16,
+        ctypes.c_int16,
+        ctypes.c_uint16,
+        ctypes.c_uint16,
+        ctypes.c_uint32,
+        ctypes.c_uint8,
+        ctypes.c_uint32,
+        ctypes.c_uint32,
+    ]
+    shm.xcb_shm_get_image.restype = _Cookie
+    shm.xcb_shm_get_image_reply.argtypes = [ctypes.c_void_p, _Cookie, ctypes.POINTER(ctypes.c_void_p)]
+    shm.xcb_shm_get_image_reply.restype = ctypes.c_void_p
+
+    libs.xcb.xcb_generate_id.argtypes = [ctypes.c_void_p]
+    libs.xcb.xcb_generate_id.restype = ctypes.c_uint32
+
+    libs.libc.shmget.argtypes = [ctypes.c_int, ctypes.c_size_t, ctypes.c_int]
+    libs.libc.shmget.restype = ctypes.c_int
+    libs.libc.shmat.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_int]
+    libs.libc.shmat.restype = ctypes.c_void_p
+    libs.libc.shmdt.argtypes = [ctypes.c_void_p]
+    libs.libc.shmdt.restype = ctypes.c_int
+    libs.libc.shmctl.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p]
+    libs.libc.shmctl.restype = ctypes.c_int
+
+    libs.shm = shm
+    return shm
+
+
+def load_xinput_library() -> ctypes.CDLL:
+    libs = load_libraries()
+    if libs.xinput is not None:
+        return libs.xinput
+
+    xinput = _load_library("xcb-xinput")
+    # major_version, minor_version
+    xinput.xcb_input_xi_query_version.argtypes = [ctypes.c_void_p, ctypes.c_uint16, ctypes.c_uint16]
+    xinput.xcb_input_xi_query_version.restype = _Cookie
+    xinput.xcb_input_xi_query_version_reply.argtypes = [ctypes.c_void_p, _Cookie, ctypes.POINTER(ctypes.c_void_p)]
+    xinput.xcb_input_xi_query_version_reply.restype = ctypes.c_void_p
+    # window, deviceid
+    xinput.xcb_input_xi_set_client_pointer.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_uint16]
+    xinput.xcb_input_xi_set_client_pointer.restype = _Cookie
+
+    libs.xinput = xinput
+    return xinput
+
+
+class XCBConnection:
+    """XTest Input Injection through libxcb, skipping python-xlib´s request encoding."""
+
+    def __init__(self, display_name: Optional[str] = None) -> None:
+        self._libs = load_libraries()
+        screen = ctypes.c_int(0)
+        self._conn = self._libs.xcb.xcb_connect(display_name.encode() if display_name else None, ctypes.byref(screen))
+        if not self._conn or self._libs.xcb.xcb_connection_has_error(self._conn):
+            raise ConnectionError(f"Couldn't connect to X Display {display_name} via XCB.")
+
+    def fake_input(self, event_type: int, detail: int = 0, x: int = 0, y: int = 0) -> None:
+        # Time: CurrentTime (0), Root: None (0) -> Screen of the current Pointer, DeviceId: None (0)
+        self._libs.xtest.xcb_test_fake_input(self._conn, event_type, detail, 0, 0, x, y, 0)
+
+    def set_client_pointer(self, pointer: int) -> None:
+        # XI2 Requests are only accepted after announcing the supported Version
+        xinput = load_xinput_library()
+        reply = xinput.xcb_input_xi_query_version_reply(self._conn, xinput.xcb_input_xi_query_version(self._conn, 2, 0), None)
+        if not reply:
+            raise EnvironmentError("XInput 2 is not available on this X Display.")
+        self._libs.libc.free(reply)
+
+        # Window None (0) -> this Connection
+        xinput.xcb_input_xi_set_client_pointer(self._conn, 0, pointer)
+        self.sync()
+
+    def flush(self) -> None:
+        self._libs.xcb.xcb_flush(self._conn)
+
+    def sync(self) -> None:
+        cookie = self._libs.xcb.xcb_get_input_focus(self._conn)
+        reply = self._libs.xcb.xcb_get_input_focus_reply(self._conn, cookie, None)
+        if reply:
+            self._libs.libc.free(reply)
+        if self._libs.xcb.xcb_connection_has_error(self._conn):
+            raise ConnectionError("XCB Connection to the X Display was closed.")
+
+    def close(self) -> None:
+        if self._conn:
+            self._libs.xcb.xcb_disconnect(self._conn)
+            self._conn = None
+
+
+class ShmCaptureError(OSError):
+    """MIT-SHM Capture isnt possible (e.g. the X Server cant attach our Segment across IPC Namespaces), callers fall back to GetImage"""
+
+
+class XCBShmCapture:
+    """Reads Pixels of a Drawable via the MIT-SHM Extension through a reusable Shared-Memory Segment, without transferring them over the X Connection."""
+
+    _shmid: int = -1
+    _shmaddr: Optional[int] = None
+    _shmseg: int = 0
+    _size: int = 0
+
+    def __init__(self, display_name: Optional[str] = None) -> None:
+        self._libs = load_libraries()
+        self._shm = load_shm_library()
+        screen = ctypes.c_int(0)
+        self._conn = self._libs.xcb.xcb_connect(display_name.encode() if display_name else None, ctypes.byref(screen))
+        if not self._conn or self._libs.xcb.xcb_connection_has_error(self._conn):
+            raise ConnectionError(f"Couldn't connect to X Display {display_name} via XCB.")
+
+        # Remote Displays (or Servers without the Extension) cant share Memory with us
+        reply = self._shm.xcb_shm_query_version_reply(self._conn, self._shm.xcb_shm_query_version(self._conn), None)
+        if not reply:
+            self.close()
+            raise ShmCaptureError("MIT-SHM Extension is not available on this X Display.")
+        self._libs.libc.free(reply)
+
+    def _ensure_segment(self, size: int) -> None:
+        if size <= self._size:
+            return
+        self._release_segment()
+
+        libc = self._libs.libc
+        shmid = libc.shmget(IPC_PRIVATE, size, IPC_CREAT | 0o600)
+        if shmid < 0:
+            raise ShmCaptureError(f"Couldn't allocate {size} bytes of shared memory.")
+        shmaddr = libc.shmat(shmid, None, 0)
+        if shmaddr in (None, ctypes.c_void_p(-1).value):
+            libc.shmctl(shmid, IPC_RMID, None)
+            raise ShmCaptureError("Couldn't attach to the shared memory segment.")
+
+        self._shmseg = self._libs.xcb.xcb_generate_id(self._conn)
+        self._shm.xcb_shm_attach(self._conn, self._shmseg, shmid, 0)
+        self.sync()
+        # Segment gets freed by the Kernel as soon as both the X Server and we detached from it
+        libc.shmctl(shmid, IPC_RMID, None)
+
+        self._shmid, self._shmaddr, self._size = shmid, shmaddr, size
+
+    def _release_segment(self) -> None:
+        if self._shmaddr is None:
+            return
+        self._shm.xcb_shm_detach(self._conn, self._shmseg)
+        self.sync()
+        self._libs.libc.shmdt(self._shmaddr)
+        self._shmid, self._shmaddr, self._size = -1, None, 0
+
+    def sync(self) -> None:
+        cookie = self._libs.xcb.xcb_get_input_focus(self._conn)
+        reply = self._libs.xcb.xcb_get_input_focus_reply(self._conn, cookie, None)
+        if reply:
+            self._libs.libc.free(reply)
+
+    def capture(self, drawable: int, x: int, y: int, width: int, height: int, stride: int) -> np.ndarray:
+        """Returns the raw ZPixmap rows (height, stride), copied out of the shared Buffer"""
+        size = stride * height
+        self._ensure_segment(size)
+
+        cookie = self._shm.xcb_shm_get_image(self._conn, drawable, x, y, width, height, 0xFFFFFFFF, XCB_IMAGE_FORMAT_Z_PIXMAP, self._shmseg, 0)
+        reply = self._shm.xcb_shm_get_image_reply(self._conn, cookie, None)
+        if not reply:
+            # Also the Case if the X Server couldnt attach the Segment (ShmAttach isnt checked)
+            raise ShmCaptureError(f"Couldn't capture region {(x, y, width, height)} of drawable {drawable}.")
+        self._libs.libc.free(reply)
+
+        buffer = (ctypes.c_uint8 * size).from_address(self._shmaddr)  # type: ignore[arg-type]
+        # The Segment is reused by the next Capture & unmapped when it regrows or on close(), a View into it would dangle
+        return np.ctypeslib.as_array(buffer).reshape(height, stride).copy()
+
+    def close(self) -> None:
+        if self._conn:
+            self._release_segment()
+            self._libs.xcb.xcb_disconnect(self._conn)
+            self._conn = None
@@ -0,0 +1,98 @@
+import itertools
+import os
+import struct
+from typing import NamedTuple
+
+from Xlib import display
+from Xlib.ext import xinput
+from Xlib.protocol import rq
+
+# XI2 Hierarchy Changes (see XI2proto.txt)
+ADD_MASTER, REMOVE_MASTER = 1, 2
+ATTACH_TO_MASTER = 1
+VIRTUAL_CORE_POINTER, VIRTUAL_CORE_KEYBOARD = 2, 3
+
+_master_counter = itertools.count()
+
+
+class XIChangeHierarchy(rq.Request):
+    _request = rq.Struct(
+        rq.Card8("opcode"),
+        rq.Opcode(43),
+        rq.RequestLength(),
+        rq.Card8("num_changes"),
+        rq.Pad(3),
+        # Pre-encoded List of Hierarchy Changes (variable-sized)
+        rq.String8("changes"),
+    )
+
+
+class XISetClientPointer(rq.Request):
+    _request = rq.Struct(
+        rq.Card8("opcode"),
+        rq.Opcode(44),
+        rq.RequestLength(),
+        rq.Card32("window"),
+        rq.Card16("deviceid"),
+        rq.Pad(2),
+    )
+
+
+class MasterDevices(NamedTuple):
+    pointer: int
+    keyboard: int
+    name: str
+
+
+def encode_add_master(name: str) -> bytes:
+    encoded_name = name.encode()
+    padded_name = encoded_name + b"\0" * (-len(encoded_name) % 4)
+    # type, length (in 4-Byte Units), name_len, send_core, enable
+    return struct.pack("=HHHBB", ADD_MASTER, 2 + len(padded_name) // 4, len(encoded_name), 1, 1) + padded_name
+
+
+def encode_remove_master(pointer: int) -> bytes:
+    # type, length, deviceid, return_mode, pad, return_pointer, return_keyboard
+    return struct.pack("=HHHBxHH", REMOVE_MASTER, 3, pointer, ATTACH_TO_MASTER, VIRTUAL_CORE_POINTER, VIRTUAL_CORE_KEYBOARD)
+
+
+def ensure_xinput2(xlib_display: display.Display) -> int:
+    if not xlib_display.has_extension(xinput.extname):
+        raise EnvironmentError("XInputExtension is not available on this X Display.")
+
+    version = xlib_display.xinput_query_version()
+    if version.major_version < 2:
+        raise EnvironmentError(f"XInput 2 is required for multiple Pointers, the X Display only supports {version.major_version}.{version.minor_version}.")
+
+    opcode: int = xlib_display.get_extension_major(xinput.extname)
+    return opcode
+
+
+def create_master(xlib_display: display.Display, name: str = "") -> MasterDevices:
+    """Adds a Master Pointer/Keyboard Pair. The X Server attaches its own XTEST Slave Devices to it"""
+    opcode = ensure_xinput2(xlib_display)
+    name = name or f"cdp-patches-{os.getpid()}-{next(_master_counter)}"
+    XIChangeHierarchy(display=xlib_display.display, opcode=opcode, num_changes=1, changes=encode_add_master(name))
+
+    # Masters are named "<name> pointer" & "<name> keyboard", the Pointer is attached to its paired Keyboard
+    for device in xlib_display.xinput_query_device(xinput.AllMasterDevices).devices:
+        device_name = device.name.decode() if isinstance(device.name, bytes) else device.name
+        if device.use == xinput.MasterPointer and device_name == f"{name} pointer":
+            return MasterDevices(device.deviceid, device.attachment, name)
+
+    raise EnvironmentError(f"Master Pointer {name} could not be created.")
+
+
+def remove_master(xlib_display: display.Display, master: MasterDevices) -> None:
+    # The XTEST Slaves get removed with the Master
+    opcode = xlib_display.get_extension_major(xinput.extname)
+    XIChangeHierarchy(display=xlib_display.display, opcode=opcode, num_changes=1, changes=encode_remove_master(master.pointer))
+    xlib_display.sync()
+
+
+def set_client_pointer(xlib_display: display.Display, pointer: int) -> None:
+    """Core Events of this Connection (incl. XTest fake_input & SetInputFocus) now go through the given Master & its paired Keyboard"""
+    opcode = xlib_display.get_extension_major(xinput.extname)
+    # Window None -> the requesting Client
+    XISetClientPointer(display=xlib_display.display, opcode=opcode, window=0, deviceid=pointer)
+    xlib_display.sync()
@@ -0,0 +1,84 @@
+import threading
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+
+PointType = TypeVar("PointType")
+
+
+class RateReport(NamedTuple):
+    latency: float  # Smoothed Round-Trip Latency in Seconds
+    density: float  # Fraction of Trajectory Points sent
+    interval_scale: float  # Factor applied to the Delay between two sent Points
+    saturated: bool
+
+
+class RateController:
+    """
+    Adapts the Point Density of Trajectories to the Round-Trip Latency of the Display Server (AIMD).
+    Fewer Points get sent with proportionally longer Delays, so Gestures keep their Duration while producing less Events.
+    """
+
+    def __init__(
+        self,
+        low_latency: float = 0.001,
+        high_latency: float = 0.004,
+        smoothing: float = 0.2,
+        min_density: float = 0.25,
+        decrease_factor: float = 0.75,
+        increase_step: float = 0.05,
+        adjust_interval: int = 8,
+        on_adjust: Optional[Callable[[RateReport], None]] = None,
+    ) -> None:
+        if not 0 < min_density <= 1:
+            raise ValueError("min_density must be in range (0,1]")
+        if low_latency > high_latency:
+            raise ValueError("low_latency must be less than or equal to high_latency")
+
+        self.low_latency = low_latency
+        self.high_latency = high_latency
+        self.smoothing = smoothing
+        self.min_density = min_density
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.adjust_interval = adjust_interval
+        self.on_adjust = on_adjust
+
+        self.latency = 0.0
+        self.density = 1.0
+        self._observations = 0
+        self._lock = threading.Lock()
+
+    def observe(self, latency: float) -> None:
+        """Feeds one measured Round-Trip (e.g. a display.sync()) into the Controller"""
+        with self._lock:
+            self.latency = latency if not self._observations else self.smoothing * latency + (1 - self.smoothing) * self.latency
+            self._observations += 1
+            # Only adjust every few Observations, so single Spikes dont cause Oscillations
+            if self._observations % self.adjust_interval:
+                return
+
+            previous = self.density
+            if self.latency > self.high_latency:
+                self.density = max(self.min_density, self.density * self.decrease_factor)
+            elif self.latency < self.low_latency:
+                self.density = min(1.0, self.density + self.increase_step)
+            if self.density == previous:
+                return
+            report = self.report()
+
+        if self.on_adjust:
+            self.on_adjust(report)
+
+    def report(self) -> RateReport:
+        return RateReport(self.latency, self.density, 1 / self.density, self.latency > self.high_latency)
+
+    def thin(self, points: Sequence[PointType]) -> Tuple[List[PointType], float]:
+        """Subsamples the Points to the current Density (keeping the Endpoint). Returns them & the Factor to scale the Delay between them by"""
+        density = self.density
+        if density >= 1.0 or len(points) <= 2:
+            return list(points), 1.0
+
+        count = max(2, int(round(len(points) * density)))
+        indices = np.linspace(0, len(points) - 1, count).round().astype(int)
+        return [points[index] for index in indices.tolist()], len(points) / count
@@ -0,0 +1,40 @@
+from typing import Literal, Optional, Tuple
+
+from cdp_patches import is_windows
+
+# Read in one Evaluation: [scrollX, scrollY, innerWidth, innerHeight, scrollWidth, scrollHeight]
+viewport_metrics_script = "[window.scrollX, window.scrollY, window.innerWidth, window.innerHeight, document.documentElement.scrollWidth, document.documentElement.scrollHeight]"
+scroll_position_script = "[window.scrollX, window.scrollY]"
+# CSS Pixels scrolled per Wheel Notch by Chrome (Linux: 53 1/3, Windows: 100 for 3 Lines)
+default_notch_pixels = 100.0 if is_windows else 53.333
+# Targets closer than this to the Viewport Edge get scrolled into View as well
+scroll_margin = 20
+
+
+def scroll_notches(position: float, scroll: float, size: float, notch_pixels: float, scroll_size: Optional[float] = None) -> int:
+    """
+    Signed Number of Wheel Notches to bring the Page Position into the Viewport (centered). 0 if its already visible.
+    Near the Document Edges the Position cant be centered, the Scroll stops at 0 & scroll_size - size (the Document Size, if known).
+    """
+    if scroll + scroll_margin <= position <= scroll + size - scroll_margin:
+        return 0
+
+    wanted = max(position - size / 2, 0.0)
+    if scroll_size is not None:
+        wanted = min(wanted, max(scroll_size - size, 0.0))
+    delta = wanted - scroll
+    # Already scrolled as far as possible towards a visible Position, more Notches wouldnt move the Page
+    if abs(delta) < 1 and scroll <= position <= scroll + size:
+        return 0
+    notches = int(round(delta / notch_pixels))
+    return notches or (1 if delta > 0 else -1)
+
+
+def scroll_directions(notches_x: int, notches_y: int) -> Tuple[Optional[Literal["left", "right"]], Optional[Literal["up", "down"]]]:
+    direction_x: Optional[Literal["left", "right"]] = None
+    direction_y: Optional[Literal["up", "down"]] = None
+    if notches_x:
+        direction_x = "right" if notches_x > 0 else "left"
+    if notches_y:
+        direction_y = "down" if notches_y > 0 else "up"
+    return direction_x, direction_y
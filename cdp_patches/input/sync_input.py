@@ -1,10 +1,10 @@
 import platform
-import random
-import re
 import sys
 import threading
 import time
-from typing import Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, List, Literal, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 if sys.version_info.minor >= 10:
     from typing import TypeAlias
@@ -30,8 +30,23 @@ else:
     InputBase = LinuxBase  # type: ignore
     WindowErrors = (AssertionError, ValueError, WindowClosedException)  # type: ignore[assignment]
 
-from .browsers import DriverlessSyncChrome, SeleniumChrome, get_sync_browser_pid, get_sync_scale_factor, sync_browsers
+from .action_chain import ActionChain
+from .browsers import DriverlessSyncChrome, SeleniumChrome, SyncEvaluator, get_sync_browser_pid, get_sync_evaluator, get_sync_scale_factor, get_sync_window_for_target, sync_browsers
+from .calibration import viewport_origin, window_metrics_script
+from .chords import normalize_modifiers, parse_chord
+from .frame_rate import frame_align, frame_probe_script, refresh_rate
+from .keystroke_timeline import KeystrokeTimeline, fill_segments
+from .latency import SyncLatencyProbe
 from .mouse_trajectory import HumanizeMouseTrajectory
+from .os_base.backend import WindowInfo
+from .os_base.registry import backend_registry
+from .scrolling import default_notch_pixels, scroll_directions, scroll_notches, scroll_position_script, viewport_metrics_script
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page as SyncPage
+
+    from .os_base.backend import InputBackend
+    from .trajectory_store import TrajectoryTemplates
 
 
 class SyncInput:
@@ -45,20 +60,51 @@ class SyncInput:
     typing_speed: int = 50
     last_x: int = 0
     last_y: int = 0
-    selective_modifiers_regex = re.compile(r"{[^{}]*}|.")
+    backspace_key: str = "{BACKSPACE}" if is_windows else "{BackSpace}"
+    # CSS Pixels per Scroll Notch, corrected by a second Pass if the Page scrolled differently
+    scroll_notch_pixels: float = default_notch_pixels
+    scroll_settle_timeout: float = 1.0
+    scroll_passes: int = 2
+    # Pre-generated Trajectories (see trajectory_store) used instead of generating every Curve on the fly
+    trajectory_templates: Optional["TrajectoryTemplates"] = None
+    # Refresh Rate of the Page in Hz (see detect_frame_rate), Trajectory Points get sent at most once per Frame if set
+    frame_rate: Optional[float] = None
+    frame_probe_timeout: float = 1.0
+    _evaluator: Optional[SyncEvaluator] = None
 
     def __init__(
-        self, pid: Optional[int] = None, browser: Optional[sync_browsers] = None, scale_factor: Optional[float] = 1.0, emulate_behaviour: Optional[bool] = True, window_timeout: Optional[float] = 30.0
+        self,
+        pid: Optional[int] = None,
+        browser: Optional[sync_browsers] = None,
+        scale_factor: Optional[float] = 1.0,
+        emulate_behaviour: Optional[bool] = True,
+        window_timeout: Optional[float] = 30.0,
+        x_backend: Literal["xlib", "xcb"] = "xlib",
+        seed: Optional[Union[int, np.random.Generator]] = None,
+        multi_pointer: bool = False,
+        base: Optional["InputBackend"] = None,
     ) -> None:
         if platform.system() not in ("Windows", "Linux"):
             raise SystemError("Unknown system (You´re probably using MacOS, which is currently not supported).")
+        if multi_pointer and is_windows:
+            raise NotImplementedError("Multiple Pointers are only supported on Linux (XInput 2).")
 
+        self.browser = browser
         self._scale_factor = scale_factor or self._scale_factor
         self.window_timeout = window_timeout or self.window_timeout
         self.emulate_behaviour = emulate_behaviour or self.emulate_behaviour
-        self._move_lock = threading.Lock()
-
-        if browser:
+        # Per-Handle Generator for all Randomness (Trajectories, Timings), reproducible if seeded
+        self.rng = np.random.default_rng(seed)
+        # Own XI2 Master Pointer & Keyboard, so Handles on one Display can send Input concurrently
+        self.multi_pointer = multi_pointer
+        # Guards last_x/last_y & keeps Gestures of one Handle from interleaving across Threads (the Base locks per Display Connection)
+        self._lock = threading.RLock()
+
+        if base is not None:
+            # Custom Backend (e.g. RecordingBase), no Browser Process needed
+            self.pid = pid or getattr(base, "pid", None)
+            self._scale_factor = base.scale_factor
+        elif browser:
             self.pid = get_sync_browser_pid(browser)
             self._scale_factor = float(get_sync_scale_factor(browser))
         elif pid:
@@ -66,13 +112,32 @@ class SyncInput:
         else:
             raise ValueError("You must provide a pid or a browser")
 
-        self._base = InputBase(self.pid, self._scale_factor)  # type: ignore
+        self._base = self._create_base(x_backend) if base is None else base  # type: ignore[assignment]
         self._wait_for_window()
 
         # Include Windows Scale Factor for every browser except DriverlessSyncChrome
-        if is_windows and not isinstance(browser, (DriverlessSyncChrome, SeleniumChrome)):
+        if base is None and is_windows and not isinstance(browser, (DriverlessSyncChrome, SeleniumChrome)):
             self._base.include_windows_scale_factor()
 
+    def _create_base(self, x_backend: Literal["xlib", "xcb"]) -> InputBase:
+        assert self.pid
+        if self.multi_pointer:
+            return InputBase(self.pid, self._scale_factor, x_backend=x_backend, multi_pointer=True)  # type: ignore
+        # Handles of the same Browser (e.g. one per Context or Page) share the Backend & its Window Discovery
+        return backend_registry.input_backend(self.pid, self._scale_factor, x_backend=x_backend)  # type: ignore[return-value]
+
+    def trajectory(self, from_point: Tuple[int, int], to_point: Tuple[int, int]) -> List[Tuple[float, float]]:
+        if self.trajectory_templates is not None:
+            return self.trajectory_templates.sample(from_point, to_point, rng=self.rng)
+        return HumanizeMouseTrajectory(from_point, to_point, rng=self.rng).points
+
+    def close(self) -> None:
+        """Releases the Handles Reference to the shared Backend (closing its X Connections with the last Handle) or the Master Devices of multi_pointer Handles"""
+        if self._evaluator:
+            self._evaluator.close()
+            self._evaluator = None
+        self._base.close()
+
     @property
     def base(self) -> Union[WindowsBase, LinuxBase]:
         return self._base
@@ -111,66 +176,243 @@ class SyncInput:
         # while time.perf_counter() - start < timeout:
         #     pass
 
-    def click(self, button: Literal["left", "right", "middle"], x: Union[int, float], y: Union[int, float], emulate_behaviour: Optional[bool] = True, timeout: Optional[float] = 0.07) -> None:
+    def click(
+        self,
+        button: Literal["left", "right", "middle"],
+        x: Union[int, float],
+        y: Union[int, float],
+        emulate_behaviour: Optional[bool] = True,
+        timeout: Optional[float] = 0.07,
+        modifiers: Optional[Sequence[str]] = None,
+        page_coords: bool = False,
+    ) -> None:
+        if page_coords:
+            x, y = self.scroll_into_view(x, y)
         x, y = int(x), int(y)
 
-        self.down(button=button, x=x, y=y, emulate_behaviour=emulate_behaviour, timeout=timeout)
-        if self.emulate_behaviour and emulate_behaviour:
-            self._sleep_timeout(timeout=timeout)
-        self.up(button=button, x=x, y=y)
-        self.last_x, self.last_y = x, y
+        held_modifiers = normalize_modifiers(modifiers or [])
+        with self._lock:
+            if held_modifiers:
+                # Move first, then hold the Modifiers only around the Click
+                if self.emulate_behaviour and emulate_behaviour:
+                    self.move(x=x, y=y, emulate_behaviour=emulate_behaviour, timeout=timeout)
+                self._base.press_modifiers(held_modifiers)
+
+            try:
+                self.down(button=button, x=x, y=y, emulate_behaviour=emulate_behaviour and not held_modifiers, timeout=timeout)
+                if self.emulate_behaviour and emulate_behaviour:
+                    self._sleep_timeout(timeout=timeout)
+                self.up(button=button, x=x, y=y)
+            finally:
+                if held_modifiers:
+                    self._base.release_modifiers(held_modifiers)
+            self.last_x, self.last_y = x, y
 
     def double_click(self, button: Literal["left", "right", "middle"], x: Union[int, float], y: Union[int, float], emulate_behaviour: Optional[bool] = True, timeout: Optional[float] = None) -> None:
         x, y = int(x), int(y)
 
-        self.click(button=button, x=x, y=y, timeout=timeout, emulate_behaviour=emulate_behaviour)
-        if emulate_behaviour and self.emulate_behaviour:
-            self._sleep_timeout(random.uniform(0.14, 0.21))
-            # self._sleep_timeout(timeout=timeout)
-        self.click(button=button, x=x, y=y, emulate_behaviour=False, timeout=timeout)
+        with self._lock:
+            self.click(button=button, x=x, y=y, timeout=timeout, emulate_behaviour=emulate_behaviour)
+            if emulate_behaviour and self.emulate_behaviour:
+                self._sleep_timeout(self.rng.uniform(0.14, 0.21))
+                # self._sleep_timeout(timeout=timeout)
+            self.click(button=button, x=x, y=y, emulate_behaviour=False, timeout=timeout)
 
-        self.last_x, self.last_y = x, y
+            self.last_x, self.last_y = x, y
 
     def down(self, button: Literal["left", "right", "middle"], x: Union[int, float], y: Union[int, float], emulate_behaviour: Optional[bool] = True, timeout: Optional[float] = None) -> None:
         x, y = int(x), int(y)
 
-        if self.emulate_behaviour and emulate_behaviour:
-            self.move(x=x, y=y, emulate_behaviour=emulate_behaviour, timeout=timeout)
-        self._base.down(button=button, x=x, y=y)
-        self.last_x, self.last_y = x, y
+        with self._lock:
+            if self.emulate_behaviour and emulate_behaviour:
+                self.move(x=x, y=y, emulate_behaviour=emulate_behaviour, timeout=timeout)
+            self._base.down(button=button, x=x, y=y)
+            self.last_x, self.last_y = x, y
 
     def up(self, button: Literal["left", "right", "middle"], x: Union[int, float], y: Union[int, float]) -> None:
         x, y = int(x), int(y)
 
-        self._base.up(button=button, x=x, y=y)
-        self.last_x, self.last_y = x, y
+        with self._lock:
+            self._base.up(button=button, x=x, y=y)
+            self.last_x, self.last_y = x, y
 
-    def move(self, x: Union[int, float], y: Union[int, float], emulate_behaviour: Optional[bool] = True, timeout: Optional[float] = None) -> None:
-        with self._move_lock:
+    def move(self, x: Union[int, float], y: Union[int, float], emulate_behaviour: Optional[bool] = True, timeout: Optional[float] = None, page_coords: bool = False) -> None:
+        if page_coords:
+            x, y = self.scroll_into_view(x, y)
+        with self._lock:
             x, y = int(x), int(y)
 
             if self.emulate_behaviour and emulate_behaviour:
-                humanized_points = HumanizeMouseTrajectory((self.last_x, self.last_y), (x, y))
+                # Fewer Points with longer Delays if the Display Server is saturated
+                points, interval_scale = self._base.rate_controller.thin(self.trajectory((self.last_x, self.last_y), (x, y)))
 
-                # Move Mouse to new random locations
-                for i, (human_x, human_y) in enumerate(humanized_points.points):
-                    self._base.move(x=int(human_x), y=int(human_y))
-                    self._sleep_timeout(timeout=timeout)
+                interval = (timeout or self.sleep_timeout) * interval_scale
+
+                if self.frame_rate:
+                    self._move_per_frame(points, interval)
+                else:
+                    # Move Mouse to new random locations
+                    for i, (human_x, human_y) in enumerate(points):
+                        self._base.move(x=int(human_x), y=int(human_y))
+                        self._sleep_timeout(timeout=interval)
 
             self._base.move(x=x, y=y)
             self.last_x, self.last_y = x, y
 
-    def scroll(self, direction: Literal["up", "down", "left", "right"], amount: int) -> None:
-        self._base.scroll(direction=direction, amount=amount)
-
-    def type(self, text: str, fill: Optional[bool] = False, timeout: Optional[float] = None) -> None:
-        if self.emulate_behaviour and not fill:
-            for i, char in enumerate(self.selective_modifiers_regex.findall(text)):
-                # If new word is started wait some more time
-                if i != 0 and text[i - 1] == " ":
-                    self._sleep_timeout(timeout=timeout)
+    def _move_per_frame(self, points: Sequence[Tuple[float, float]], interval: float) -> None:
+        assert self.frame_rate
+        aligned, offsets = frame_align(points, interval, 1 / self.frame_rate)
+        # Scheduled from the Start, so the Points dont drift out of their Frames
+        start = time.perf_counter()
+        for (human_x, human_y), offset in zip(aligned, offsets):
+            time.sleep(max(0.0, start + offset - time.perf_counter()))
+            self._base.move(x=int(human_x), y=int(human_y))
+        time.sleep(max(0.0, start + len(points) * interval - time.perf_counter()))
+
+    def calibrate(self) -> Tuple[int, int]:
+        """
+        Measures the Screen Position of the Viewport over CDP once (Linux), so Moves only add the cached Offset instead of querying the Toolbar Height.
+        Windows sends Input relative to the Client Area (the Viewport), nothing is measured & its Screen Position is returned.
+        """
+        if is_windows:
+            with self._lock:
+                client_origin: Tuple[int, int] = self._base.client_origin()  # type: ignore[attr-defined]
+            return client_origin
+        if not self.browser:
+            raise ValueError("Calibrating needs the browser the Input Handle was created with.")
+
+        with get_sync_evaluator(self.browser) as evaluate:  # type: ignore[arg-type]
+            content_x, content_y = viewport_origin(evaluate(window_metrics_script), self.scale_factor)
+        with self._lock:
+            self._base.calibrate(content_x, content_y)  # type: ignore[attr-defined]
+        return content_x, content_y
+
+    def detect_frame_rate(self) -> float:
+        """Measures the Refresh Rate of the Page with a requestAnimationFrame Probe & sends Trajectory Points at most once per Frame from then on"""
+        if not self.browser:
+            raise ValueError("Detecting the Frame Rate needs the browser the Input Handle was created with.")
+
+        with get_sync_evaluator(self.browser) as evaluate:  # type: ignore[arg-type]
+            frames = evaluate(frame_probe_script(self.frame_probe_timeout))
+
+        frame_rate = refresh_rate(frames)
+        if frame_rate is None:
+            # Hidden/Background Pages dont render Frames
+            raise TimeoutError(f"No Animation Frames rendered in {self.frame_probe_timeout} seconds.")
+        self.frame_rate = frame_rate
+        return frame_rate
+
+    def drag(
+        self,
+        from_point: Tuple[Union[int, float], Union[int, float]],
+        to_point: Tuple[Union[int, float], Union[int, float]],
+        button: Literal["left", "right", "middle"] = "left",
+        dwell: float = 0.0,
+        via: Optional[Sequence[Tuple[Union[int, float], Union[int, float]]]] = None,
+        emulate_behaviour: Optional[bool] = True,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self.chain().drag(from_point, to_point, button=button, dwell=dwell, via=via, emulate_behaviour=emulate_behaviour, timeout=timeout).perform()
+
+    def _page_evaluator(self) -> SyncEvaluator:
+        # Created once per Handle & reused by every Scroll, closed with the Handle
+        if self._evaluator is None:
+            self._evaluator = get_sync_evaluator(self.browser)  # type: ignore[arg-type]
+        return self._evaluator
+
+    def scroll_into_view(self, x: Union[int, float], y: Union[int, float]) -> Tuple[int, int]:
+        """Scrolls the Page Coordinates into the Viewport with one Scroll Batch & returns them as Viewport Coordinates"""
+        if not self.browser:
+            raise ValueError("Page Coordinates need the browser the Input Handle was created with.")
+
+        evaluate = self._page_evaluator()
+        scroll_x, scroll_y, width, height, scroll_width, scroll_height = evaluate(viewport_metrics_script)
+        notch_x = notch_y = self.scroll_notch_pixels
+
+        for scroll_pass in range(self.scroll_passes + 1):
+            notches_x, notches_y = scroll_notches(x, scroll_x, width, notch_x, scroll_width), scroll_notches(y, scroll_y, height, notch_y, scroll_height)
+            if not notches_x and not notches_y:
+                return int(x - scroll_x), int(y - scroll_y)
+            if scroll_pass == self.scroll_passes:
+                break
+
+            direction_x, direction_y = scroll_directions(notches_x, notches_y)
+            if direction_y:
+                self.scroll(direction_y, abs(notches_y))
+            if direction_x:
+                self.scroll(direction_x, abs(notches_x))
+
+            # Re-read the Position once the Scroll settled, instead of once per Notch
+            new_x, new_y = self._wait_for_scroll(evaluate, scroll_x, scroll_y)
+            if notches_x and new_x != scroll_x:
+                notch_x = abs(new_x - scroll_x) / abs(notches_x)
+            if notches_y and new_y != scroll_y:
+                notch_y = abs(new_y - scroll_y) / abs(notches_y)
+            scroll_x, scroll_y = new_x, new_y
+
+        raise ValueError(f"Couldn't scroll {(x, y)} into the Viewport.")
+
+    def _wait_for_scroll(self, evaluate: Callable[[str], Any], previous_x: float, previous_y: float) -> Tuple[float, float]:
+        # Smooth Scrolling animates the Scroll, wait until the Position stops changing
+        max_wait = time.perf_counter() + self.scroll_settle_timeout
+        position = evaluate(scroll_position_script)
+        while time.perf_counter() < max_wait:
+            self._sleep_timeout(0.05)
+            current = evaluate(scroll_position_script)
+            if current == position and current != [previous_x, previous_y]:
+                break
+            position = current
+        return position[0], position[1]
 
-                self._base.send_keystrokes(char)
-                self._sleep_timeout((random.random() * 10) / self.typing_speed)
-        else:
-            self._base.send_keystrokes(text)
+    def scroll(self, direction: Literal["up", "down", "left", "right"], amount: int) -> None:
+        with self._lock:
+            self._base.scroll(direction=direction, amount=amount)
+
+    def type(self, text: str, fill: Optional[bool] = False, timeout: Optional[float] = None, typo_rate: float = 0.0) -> None:
+        with self._lock:
+            if self.emulate_behaviour and not fill:
+                # The Handle Generator isnt thread-safe either
+                timeline = KeystrokeTimeline(text, wpm=self.typing_speed, rng=self.rng, typo_rate=typo_rate, word_pause=timeout or self.sleep_timeout, backspace_key=self.backspace_key)
+                self._base.send_keystrokes_timeline(timeline.keys, timeline.timestamps)
+            elif fill:
+                # One Ctrl+V per Text Run through the Clipboard instead of a Key per Character
+                for is_key, segment in fill_segments(text):
+                    if is_key:
+                        self._base.send_keystrokes(segment)
+                    else:
+                        self._base.paste(segment)
+            else:
+                self._base.send_keystrokes(text)
+
+    def press_chord(self, chord: str) -> None:
+        """Sends a Keyboard Shortcut like "ctrl+a" or "ctrl+shift+t" in one Batch"""
+        modifiers, key = parse_chord(chord)
+        with self._lock:
+            self._base.send_chord(modifiers, key)
+
+    def capture(self, x: Union[int, float] = 0, y: Union[int, float] = 0, width: Optional[Union[int, float]] = None, height: Optional[Union[int, float]] = None) -> np.ndarray:
+        return self._base.capture(x=int(x), y=int(y), width=None if width is None else int(width), height=None if height is None else int(height))
+
+    def chain(self) -> ActionChain:
+        return ActionChain(self)
+
+    def windows(self) -> List[WindowInfo]:
+        """Indexes every Browser Window of the PID (Title, Geometry & CDP Window Id once bound)"""
+        return self._base.index_windows()
+
+    def bind_window(self, window: Optional[Union[int, WindowInfo]]) -> Optional[WindowInfo]:
+        """Sends all Input of this Handle to one Window of windows(), switching without a Window Search. None follows the first Window again"""
+        with self._lock:
+            return self._base.bind_window(window)
+
+    def bind_target(self, target: Optional[Union[str, "SyncPage"]] = None) -> WindowInfo:
+        """Binds the Handle to the Window showing a CDP Target (Target Id or Playwright Page, Default: the current/first Page)"""
+        if not self.browser:
+            raise ValueError("Binding a Target needs the browser the Input Handle was created with.")
+
+        window = get_sync_window_for_target(self.browser, target)
+        with self._lock:
+            return self._base.bind_cdp_window(window["windowId"], window["bounds"])
+
+    def latency_probe(self) -> SyncLatencyProbe:
+        return SyncLatencyProbe(self)
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+from contextlib import suppress
+from typing import Callable, Literal, NamedTuple, Optional, Sequence
+
+EventKind = Literal["move", "down", "up", "key", "scroll", "step"]
+
+
+class TimelineEvent(NamedTuple):
+    time: float  # Seconds after the Start of the Timeline
+    kind: EventKind
+    x: int = 0
+    y: int = 0
+    key: str = ""  # Button, Key or Scroll Direction
+    amount: int = 0
+    step: int = -1  # Index of the Action this Event belongs to
+
+
+def run_timeline(
+    events: Sequence[TimelineEvent],
+    dispatch: Callable[[TimelineEvent], None],
+    cancel_event: Optional[threading.Event] = None,
+    on_step: Optional[Callable[[int], None]] = None,
+) -> bool:
+    """Dispatches every Event at its Deadline (start + event.time), so Delays dont add up. Returns False if cancelled"""
+    start = time.perf_counter()
+    for event in events:
+        delay = start + event.time - time.perf_counter()
+        if cancel_event:
+            # Waiting on the Event instead of sleeping, to react to Cancellations immediately
+            if (delay > 0 and cancel_event.wait(delay)) or cancel_event.is_set():
+                return False
+        elif delay > 0:
+            time.sleep(delay)
+
+        if event.kind == "step":
+            if on_step:
+                on_step(event.step)
+        else:
+            dispatch(event)
+    return True
+
+
+async def async_run_timeline(
+    events: Sequence[TimelineEvent],
+    dispatch: Callable[[TimelineEvent], None],
+    cancel_event: Optional[asyncio.Event] = None,
+    on_step: Optional[Callable[[int], None]] = None,
+) -> bool:
+    start = time.perf_counter()
+    for event in events:
+        delay = start + event.time - time.perf_counter()
+        if cancel_event:
+            # Waiting on the Event instead of sleeping, so long Gaps can be cancelled as well
+            if delay > 0:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(cancel_event.wait(), delay)
+            if cancel_event.is_set():
+                return False
+        elif delay > 0:
+            await asyncio.sleep(delay)
+
+        if event.kind == "step":
+            if on_step:
+                on_step(event.step)
+        else:
+            dispatch(event)
+    return True
+
+
+async def async_run_in_thread(
+    dispatch_timeline: Callable[[Sequence[TimelineEvent], Optional[threading.Event], Optional[Callable[[int], None]]], bool],
+    events: Sequence[TimelineEvent],
+    cancel_event: Optional[asyncio.Event] = None,
+    on_step: Optional[Callable[[int], None]] = None,
+) -> bool:
+    """Runs a blocking dispatch_timeline in a Worker Thread, forwarding Cancellations to it & its Steps back to the Event Loop"""
+    loop = asyncio.get_running_loop()
+    thread_cancel_event = threading.Event()
+
+    async def bridge_cancel() -> None:
+        if cancel_event:
+            await cancel_event.wait()
+            thread_cancel_event.set()
+
+    def thread_on_step(step: int) -> None:
+        if on_step:
+            loop.call_soon_threadsafe(on_step, step)
+
+    bridge = asyncio.ensure_future(bridge_cancel())
+    try:
+        return await loop.run_in_executor(None, dispatch_timeline, events, thread_cancel_event, thread_on_step)
+    except asyncio.CancelledError:
+        # Dont keep dispatching for a cancelled Task
+        thread_cancel_event.set()
+        raise
+    finally:
+        bridge.cancel()
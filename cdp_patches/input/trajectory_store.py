@@ -0,0 +1,174 @@
+"""
+Bulk Generation of HumanizeMouseTrajectory Paths into a columnar .npz File & loading them back as Trajectory Templates.
+Usage: python -m cdp_patches.input.trajectory_store trajectories.npz [--count 100000] [--width 1920] [--height 1080] [--seed 0]
+"""
+
+import argparse
+import collections
+import math
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .mouse_trajectory import HumanizeMouseTrajectory
+
+# Every Chunk is stored as flat Points (float32, [n, 2]), Offsets into them (int64, [count + 1]) & the requested Endpoints (int32, [count, 4])
+chunk_member_regex = re.compile(r"(points|offsets|endpoints)_(\d+)")
+
+
+def sample_endpoints(rng: np.random.Generator, count: int, width: int, height: int) -> np.ndarray:
+    """Uniformly distributed Start & End Points [x0, y0, x1, y1] on a Screen of the given Size"""
+    return rng.integers((0, 0, 0, 0), (width, height, width, height), size=(count, 4), dtype=np.int32)
+
+
+def generate_chunk(seed: np.random.SeedSequence, count: int, width: int, height: int, endpoints: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Generates the Trajectories of one Chunk (in a Worker Process). Returns its Points, Offsets & Endpoints"""
+    rng = np.random.default_rng(seed)
+    if endpoints is None:
+        endpoints = sample_endpoints(rng, count, width, height)
+
+    trajectories = [np.asarray(HumanizeMouseTrajectory((from_x, from_y), (to_x, to_y), rng=rng).points, dtype=np.float32).reshape(-1, 2) for from_x, from_y, to_x, to_y in endpoints.tolist()]
+    offsets = np.zeros(len(trajectories) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(trajectory) for trajectory in trajectories])
+    points = np.concatenate(trajectories) if trajectories else np.empty((0, 2), dtype=np.float32)
+    return points, offsets, np.asarray(endpoints, dtype=np.int32)
+
+
+def _write_member(archive: zipfile.ZipFile, name: str, array: np.ndarray) -> None:
+    with archive.open(f"{name}.npy", "w", force_zip64=True) as file:
+        np.lib.format.write_array(file, array, allow_pickle=False)
+
+
+def write_trajectories(
+    path: Union[str, "os.PathLike[str]"],
+    count: int,
+    width: int = 1920,
+    height: int = 1080,
+    seed: Optional[int] = None,
+    chunk_size: int = 1000,
+    processes: Optional[int] = None,
+    endpoints: Optional[np.ndarray] = None,
+) -> int:
+    """
+    Generates count Trajectories in a Process Pool & streams them Chunk by Chunk into an .npz File, so only a few Chunks are held in Memory.
+    Endpoints default to uniformly distributed Points on a width x height Screen. The Output only depends on the Seed, not on the Process Count.
+    """
+    if endpoints is not None:
+        endpoints = np.asarray(endpoints, dtype=np.int32).reshape(-1, 4)
+        count = len(endpoints)
+    if count < 0 or chunk_size < 1:
+        raise ValueError("count must be positive and chunk_size at least 1")
+
+    chunk_count = math.ceil(count / chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(chunk_count)
+    processes = processes or os.cpu_count() or 1
+    written = 0
+
+    with ProcessPoolExecutor(processes) as executor, zipfile.ZipFile(path, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+        pending: Deque["Future[Tuple[np.ndarray, np.ndarray, np.ndarray]]"] = collections.deque()
+
+        def write_next() -> None:
+            nonlocal written
+            points, offsets, chunk_endpoints = pending.popleft().result()
+            index = written // chunk_size
+            _write_member(archive, f"points_{index:06d}", points)
+            _write_member(archive, f"offsets_{index:06d}", offsets)
+            _write_member(archive, f"endpoints_{index:06d}", chunk_endpoints)
+            written += len(chunk_endpoints)
+
+        for index, chunk_seed in enumerate(seeds):
+            start, end = index * chunk_size, min((index + 1) * chunk_size, count)
+            chunk_endpoints = None if endpoints is None else endpoints[start:end]
+            pending.append(executor.submit(generate_chunk, chunk_seed, end - start, width, height, chunk_endpoints))
+            # Bounded Backlog, Results are written in Order as they complete
+            if len(pending) >= processes * 2:
+                write_next()
+        while pending:
+            write_next()
+
+    return written
+
+
+class TrajectoryTemplates:
+    """Trajectories loaded from a write_trajectories File, replayed (rotated & scaled) between new Start & End Points"""
+
+    # Templates with the closest Lengths to randomly pick from (keeps the Point Density of the Generator)
+    candidates: int = 16
+
+    def __init__(self, points: np.ndarray, offsets: np.ndarray, endpoints: Optional[np.ndarray] = None) -> None:
+        if len(offsets) < 2:
+            raise ValueError("TrajectoryTemplates need at least one Trajectory")
+
+        self.points = np.asarray(points, dtype=np.float32).reshape(-1, 2)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.endpoints = endpoints
+
+        starts, ends = self.points[self.offsets[:-1]], self.points[self.offsets[1:] - 1]
+        self.lengths = np.hypot(*(ends - starts).T)
+        self._by_length = np.argsort(self.lengths)
+
+    @classmethod
+    def load(cls, path: Union[str, "os.PathLike[str]"]) -> "TrajectoryTemplates":
+        chunks: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        with np.load(path, allow_pickle=False) as archive:
+            indices = sorted({int(match.group(2)) for match in map(chunk_member_regex.fullmatch, archive.files) if match})
+            for index in indices:
+                chunks.append((archive[f"points_{index:06d}"], archive[f"offsets_{index:06d}"], archive[f"endpoints_{index:06d}"]))
+
+        # Chunk Offsets are local, shift them by the Points of all previous Chunks
+        point_counts = np.cumsum([0] + [len(points) for points, _, _ in chunks])
+        offsets = np.concatenate([[0]] + [chunk_offsets[1:] + shift for (_, chunk_offsets, _), shift in zip(chunks, point_counts.tolist())])
+        return cls(np.concatenate([points for points, _, _ in chunks]), offsets, np.concatenate([endpoints for _, _, endpoints in chunks]))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.points[start:end]
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def sample(self, from_point: Sequence[float], to_point: Sequence[float], rng: Optional[np.random.Generator] = None) -> List[Tuple[float, float]]:
+        """Picks a Template of similar Length & maps its Start & End onto the given Points (like HumanizeMouseTrajectory.points)"""
+        rng = rng if rng is not None else np.random.default_rng()
+        start, end = complex(*from_point), complex(*to_point)
+
+        position = int(np.searchsorted(self.lengths, abs(end - start), sorter=self._by_length))
+        low = max(0, min(position - self.candidates // 2, len(self) - self.candidates))
+        template = self[int(self._by_length[rng.integers(low, min(low + self.candidates, len(self)))])]
+
+        # Similarity Transform (Rotation, Scale & Translation) as Complex Multiplication
+        path = template[:, 0].astype(np.float64) + 1j * template[:, 1]
+        template_start, template_end = path[0], path[-1]
+        scale = (end - start) / (template_end - template_start) if template_end != template_start else 1
+        mapped = start + (path - template_start) * scale
+        return list(zip(mapped.real.tolist(), mapped.imag.tolist()))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate HumanizeMouseTrajectory Paths in Bulk into a columnar .npz File.")
+    parser.add_argument("path", help="Output .npz File")
+    parser.add_argument("--count", type=int, default=100000, help="Amount of Trajectories to generate.")
+    parser.add_argument("--width", type=int, default=1920, help="Width of the Screen the Endpoints are distributed on.")
+    parser.add_argument("--height", type=int, default=1080, help="Height of the Screen the Endpoints are distributed on.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible Output.")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Trajectories per Worker Task & File Chunk.")
+    parser.add_argument("--processes", type=int, default=None, help="Worker Processes (Default: CPU Count).")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    written = write_trajectories(args.path, args.count, args.width, args.height, seed=args.seed, chunk_size=args.chunk_size, processes=args.processes)
+    duration = time.perf_counter() - start
+    print(f"Generated {written} Trajectories into {args.path} in {duration:.2f}s ({written / max(duration, 1e-9):.0f}/s)", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 import asyncio
+from typing import List
 
 import pytest
 from playwright.async_api import Locator, Page
 
+from cdp_patches.input.browsers import get_async_evaluator
 from cdp_patches.input.exceptions import WindowClosedException
 from tests.server import Server
 
@@ -210,6 +212,110 @@ async def test_keyboard_type_into_a_textarea(async_page: Page) -> None:
 #         )
 
 
+@pytest.mark.asyncio
+async def test_action_chain(async_page: Page, server: Server) -> None:
+    await async_page.goto(server.PREFIX + "/input/textarea.html")
+    x, y = await get_locator_pos(async_page.locator("textarea"))
+
+    steps: List[int] = []
+    completed = await async_page.async_input.chain().click("left", x, y).type("chained text").wait(0.1).perform(on_step=steps.append)  # type: ignore[attr-defined]
+    assert completed
+    assert steps == [0, 1, 2]
+    assert await async_page.evaluate("() => document.querySelector('textarea').value") == "chained text"
+
+
+@pytest.mark.asyncio
+async def test_drag(async_page: Page) -> None:
+    await async_page.set_content(
+        """<div id="source" style="position:absolute;left:50px;top:50px;width:50px;height:50px"></div>
+        <div id="target" style="position:absolute;left:300px;top:300px;width:50px;height:50px"></div>"""
+    )
+    await async_page.evaluate(
+        """() => {
+        window.dragEvents = [];
+        document.addEventListener('mousedown', e => dragEvents.push(['down', e.target.id]));
+        document.addEventListener('mousemove', e => e.buttons && dragEvents.push(['move', e.buttons]));
+        document.addEventListener('mouseup', e => dragEvents.push(['up', e.target.id]));
+    }"""
+    )
+    x1, y1 = await get_locator_pos(async_page.locator("#source"))
+    x2, y2 = await get_locator_pos(async_page.locator("#target"))
+
+    await async_page.async_input.drag((x1, y1), (x2, y2), dwell=0.2)  # type: ignore[attr-defined]
+    events = await async_page.evaluate("() => dragEvents")
+    assert events[0] == ["down", "source"]
+    assert events[-1] == ["up", "target"]
+    assert ["move", 1] in events
+
+
+@pytest.mark.asyncio
+async def test_capture(async_page: Page) -> None:
+    await async_page.evaluate("() => document.body.style.background = 'rgb(255, 0, 0)'")
+    await asyncio.sleep(0.5)
+    red = (await async_page.async_input.capture(10, 10, 20, 20)).copy()  # type: ignore[attr-defined]
+    assert red.shape[:2] == (20, 20)
+    assert (red == red[0, 0]).all()
+
+    await async_page.evaluate("() => document.body.style.background = 'rgb(0, 0, 255)'")
+    await asyncio.sleep(0.5)
+    blue = await async_page.async_input.capture(10, 10, 20, 20)  # type: ignore[attr-defined]
+    assert (blue == blue[0, 0]).all()
+    assert (blue[0, 0] != red[0, 0]).any()
+
+
+@pytest.mark.asyncio
+async def test_click_with_modifiers(async_page: Page, server: Server) -> None:
+    await async_page.goto(server.PREFIX + "/input/button.html")
+    x, y = await get_locator_pos(async_page.locator("button"))
+    await async_page.async_input.click("left", x, y, modifiers=["shift"])  # type: ignore[attr-defined]
+    assert await async_page.evaluate("shiftKey")
+
+
+@pytest.mark.asyncio
+async def test_press_chord(async_page: Page, server: Server) -> None:
+    await async_page.goto(server.PREFIX + "/input/textarea.html")
+    x, y = await get_locator_pos(async_page.locator("textarea"))
+    await async_page.async_input.click("left", x, y)  # type: ignore[attr-defined]
+    await async_page.async_input.type("Replace ME")  # type: ignore[attr-defined]
+    await async_page.async_input.press_chord("ctrl+a")  # type: ignore[attr-defined]
+    await async_page.async_input.type("Done")  # type: ignore[attr-defined]
+    assert await async_page.evaluate("() => document.querySelector('textarea').value") == "Done"
+
+
+@pytest.mark.asyncio
+async def test_click_page_coords(async_page: Page) -> None:
+    await async_page.set_content(
+        """<div style="height: 5000px; width: 3000px; position: relative">
+        <button style="position: absolute; left: 2500px; top: 4000px; width: 100px; height: 40px" onclick="window.clicked = true">Deep</button>
+    </div>"""
+    )
+    await async_page.async_input.click("left", 2550, 4020, page_coords=True)  # type: ignore[attr-defined]
+    assert await async_page.evaluate("window.clicked")
+
+
+@pytest.mark.asyncio
+async def test_latency_probe(async_page: Page, server: Server) -> None:
+    await async_page.goto(server.PREFIX + "/input/button.html")
+    x, y = await get_locator_pos(async_page.locator("button"))
+
+    async with async_page.async_input.latency_probe() as probe:  # type: ignore[attr-defined]
+        await async_page.async_input.click("left", x, y)  # type: ignore[attr-defined]
+
+    report = probe.report()
+    assert report["mousedown"].samples == report["mouseup"].samples == 1
+    assert 0 <= report["mousedown"].p50 < 1000
+
+
+@pytest.mark.asyncio
+async def test_evaluator_survives_navigation(async_page: Page, server: Server) -> None:
+    async with await get_async_evaluator(async_page.context) as evaluate:
+        assert await evaluate("1 + 1") == 2
+
+        # The Isolated World is recreated in the new Document
+        await async_page.goto(server.PREFIX + "/input/button.html")
+        assert await evaluate("document.querySelector('button') !== null")
+
+
 @pytest.mark.asyncio
 async def test_quit_exception(async_page: Page) -> None:
     await async_page.close()
@@ -0,0 +1,159 @@
+import asyncio
+import gc
+import threading
+from typing import List, Optional
+
+import pytest
+
+from cdp_patches.input import AsyncInput, SyncInput, browsers
+from cdp_patches.input.os_base.backend import WindowInfo
+from cdp_patches.input.os_base.recording import RecordingBase
+from cdp_patches.input.os_base.registry import BackendRegistry
+from cdp_patches.input.timeline import TimelineEvent
+
+
+class ClosingRecordingBase(RecordingBase):
+    closed = 0
+
+    def close(self) -> None:
+        self.closed += 1
+
+
+def test_backends_are_shared_per_key() -> None:
+    registry = BackendRegistry()
+    created: List[ClosingRecordingBase] = []
+
+    def factory() -> ClosingRecordingBase:
+        created.append(ClosingRecordingBase(pid=1234, realtime=False))
+        return created[-1]
+
+    views = [registry.acquire((":0", 1234, "xlib"), factory, scale_factor) for scale_factor in (1.0, 2.0, 1.5)]
+    other = registry.acquire((":1", 1234, "xlib"), factory)
+    assert len(created) == 2
+    assert all(view.backend is created[0] for view in views)
+    assert registry.references((":0", 1234, "xlib")) == 3
+    # Reads fall through to the shared Backend
+    assert views[1].held_modifiers is created[0].held_modifiers
+
+    views[0].close()
+    views[0].close()
+    views[1].close()
+    assert registry.references((":0", 1234, "xlib")) == 1 and not created[0].closed
+    views[2].close()
+    other.close()
+    assert created[0].closed == 1 and created[1].closed == 1
+    assert not registry.entries
+
+
+def test_views_scale_their_own_coordinates() -> None:
+    registry = BackendRegistry()
+    base = RecordingBase(realtime=False)
+    page_input = SyncInput(base=registry.acquire("browser", lambda: base, 2.0))
+    other_input = SyncInput(base=registry.acquire("browser", lambda: RecordingBase(), 1.0))
+
+    page_input.click("left", 10, 20, emulate_behaviour=False)
+    other_input.click("left", 10, 20, emulate_behaviour=False)
+    page_input.chain().move(30, 40, emulate_behaviour=False).scroll("down", 2).perform()
+
+    downs = base.recorded("down")
+    assert list(zip(downs["x"].tolist(), downs["y"].tolist())) == [(20, 40), (10, 20)]
+    moves = base.recorded("move")
+    assert (moves["x"][-1], moves["y"][-1]) == (60, 80)
+    assert base.recorded("scroll")["amount"].tolist() == [2]
+
+
+def test_dropped_views_release_the_backend() -> None:
+    registry = BackendRegistry()
+    base = ClosingRecordingBase()
+    view = registry.acquire("browser", lambda: base)
+    del view
+    gc.collect()
+    assert base.closed == 1 and not registry.entries
+
+
+class WindowRecordingBase(RecordingBase):
+    """Records the Window every Event was dispatched to"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.windows.append(WindowInfo(None, 2, "", 0, 0, 1280, 720))
+        self.dispatched_windows: List[Optional[int]] = []
+
+    def _dispatch(self, event: TimelineEvent, timestamp: Optional[float] = None) -> None:
+        self.dispatched_windows.append(self.bound_window_id)
+        super()._dispatch(event, timestamp)
+
+    def move(self, x: int, y: int) -> None:
+        self.dispatched_windows.append(self.bound_window_id)
+        super().move(x, y)
+
+
+def test_timeline_keeps_its_window() -> None:
+    registry = BackendRegistry()
+    base = WindowRecordingBase()
+    first, second = registry.acquire("browser", lambda: base), registry.acquire("browser", lambda: base)
+    first.bind_window(1)
+    second.bind_window(2)
+
+    timeline = [TimelineEvent(delay, "move", 10, 10) for delay in (0.0, 0.05, 0.1)]
+    # The second View switches the Window while the Timeline of the first one is running
+    switcher = threading.Timer(0.02, lambda: second.move(20, 20))
+    switcher.start()
+    assert first.dispatch_timeline(timeline)
+    switcher.join()
+    assert base.dispatched_windows == [1, 1, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_async_timeline_keeps_its_window() -> None:
+    registry = BackendRegistry()
+    base = WindowRecordingBase()
+    first, second = registry.acquire("browser", lambda: base), registry.acquire("browser", lambda: base)
+    first.bind_window(1)
+    second.bind_window(2)
+
+    steps: List[int] = []
+    timeline = [TimelineEvent(0.0, "move", 10, 10), TimelineEvent(0.05, "step", step=0), TimelineEvent(0.1, "move", 10, 10)]
+    dispatch = asyncio.ensure_future(first.async_dispatch_timeline(timeline, on_step=steps.append))
+    await asyncio.sleep(0.02)
+    await asyncio.get_running_loop().run_in_executor(None, second.move, 20, 20)
+    assert await dispatch and steps == [0]
+    assert base.dispatched_windows == [1, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_async_input_doesnt_block_the_loop_during_timelines() -> None:
+    registry = BackendRegistry()
+    base = WindowRecordingBase()
+    first, second = registry.acquire("browser", lambda: base), registry.acquire("browser", lambda: base)
+    async_input = await AsyncInput(base=second)  # type: ignore[arg-type]
+
+    # The first View holds the Lock for its whole Timeline, the other Handle clicks meanwhile
+    timeline = [TimelineEvent(0.0, "move", 10, 10), TimelineEvent(0.2, "move", 10, 10)]
+    dispatch = asyncio.ensure_future(first.async_dispatch_timeline(timeline))
+    await asyncio.sleep(0.02)
+    click = asyncio.ensure_future(async_input.click("left", 20, 20, emulate_behaviour=False))
+    ticks = 0
+    while not click.done():
+        await asyncio.sleep(0.01)
+        ticks += 1
+    assert await dispatch
+    # The Loop kept running while the Click waited for the Lock
+    assert ticks > 5 and base.key_names(base.recorded("down")) == ["left"]
+
+
+def test_scale_factor_is_probed_once_per_browser(monkeypatch: pytest.MonkeyPatch) -> None:
+    class FakeChrome:
+        pass
+
+    probes: List[FakeChrome] = []
+
+    def probe(driver: FakeChrome) -> int:
+        probes.append(driver)
+        return 2
+
+    monkeypatch.setattr(browsers, "SeleniumChrome", FakeChrome)
+    monkeypatch.setattr(browsers, "get_sync_selenium_scale_factor", probe)
+    driver, other_driver = FakeChrome(), FakeChrome()
+    assert [browsers.get_sync_scale_factor(browser) for browser in (driver, driver, other_driver)] == [2, 2, 2]  # type: ignore[arg-type]
+    assert probes == [driver, other_driver]
@@ -0,0 +1,10 @@
+from cdp_patches.input.calibration import viewport_origin
+
+
+def test_viewport_origin() -> None:
+    # Chrome Frame without Borders: 85px Toolbar
+    assert viewport_origin([100, 50, 1280, 805, 1280, 720], 1.0) == (100, 135)
+    # 4px Borders on every Side, scaled to Device Pixels
+    assert viewport_origin([10, 20, 808, 800, 800, 700], 2.0) == (28, 232)
+    # Page Zoom can make the Viewport larger than the Window
+    assert viewport_origin([0, 0, 800, 600, 1000, 750], 1.0) == (0, 0)
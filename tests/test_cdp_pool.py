@@ -0,0 +1,208 @@
+import asyncio
+import json
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+import pytest
+from websockets.sync.server import Server, ServerConnection, serve
+
+from cdp_patches.input import browsers, cdp_pool
+from cdp_patches.input.browsers import async_ws_url_from_url
+from cdp_patches.input.cdp_pool import AsyncCDPConnection, CDPConnection, CDPConnectionPool
+
+
+@pytest.fixture
+def cdp_server() -> Iterator[Server]:
+    def handler(websocket: ServerConnection) -> None:
+        pending = []
+        for message in websocket:
+            request = json.loads(message)
+            if request["method"] == "Fail":
+                websocket.send(json.dumps({"id": request["id"], "error": {"message": "Failed"}}))
+                continue
+            pending.append(request)
+            # Answer two Requests at once, in reversed Order
+            if len(pending) == 2:
+                websocket.send(json.dumps({"method": "Target.targetCreated", "params": {}}))
+                for answered in reversed(pending):
+                    websocket.send(json.dumps({"id": answered["id"], "result": {"method": answered["method"]}}))
+                pending.clear()
+
+    with serve(handler, "127.0.0.1", 0) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+
+
+def test_multiplexed_requests(cdp_server: Server) -> None:
+    host, port = cdp_server.socket.getsockname()[:2]
+    connection = CDPConnection(f"ws://{host}:{port}")
+    results = {}
+
+    def request(method: str) -> None:
+        results[method] = connection.send(method)["method"]
+
+    threads = [threading.Thread(target=request, args=(method,)) for method in ("SystemInfo.getProcessInfo", "Browser.getVersion")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {"SystemInfo.getProcessInfo": "SystemInfo.getProcessInfo", "Browser.getVersion": "Browser.getVersion"}
+
+    with pytest.raises(RuntimeError):
+        connection.send("Fail")
+
+    connection.close()
+    assert connection.closed
+    with pytest.raises(ConnectionError):
+        connection.send("Browser.getVersion")
+
+
+@pytest.mark.asyncio
+async def test_async_multiplexed_requests(cdp_server: Server) -> None:
+    host, port = cdp_server.socket.getsockname()[:2]
+    connection = await AsyncCDPConnection.connect(f"ws://{host}:{port}")
+
+    results = await asyncio.gather(connection.send("SystemInfo.getProcessInfo"), connection.send("Browser.getVersion"))
+    assert [result["method"] for result in results] == ["SystemInfo.getProcessInfo", "Browser.getVersion"]
+    with pytest.raises(RuntimeError):
+        await connection.send("Fail")
+
+    await connection.close()
+    assert connection.closed
+
+
+@pytest.mark.asyncio
+async def test_async_ws_url_from_url() -> None:
+    body = json.dumps({"webSocketDebuggerUrl": "ws://127.0.0.1:9222/devtools/browser/abc"}).encode()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        request = await reader.readuntil(b"\r\n\r\n")
+        assert request.startswith(b"GET /json/version HTTP/1.1")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body))
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        assert await async_ws_url_from_url(f"127.0.0.1:{port}") == "ws://127.0.0.1:9222/devtools/browser/abc"
+
+
+class FakeBrowser:
+    """Two Page Targets, answering Requests in Order & recording the created Isolated Worlds"""
+
+    def __init__(self) -> None:
+        self.worlds: List[str] = []
+        self.live_contexts: Set[int] = set()
+
+    def answer(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        method, params, session_id = request["method"], request["params"], request.get("sessionId", "")
+        if method == "Target.getTargets":
+            return {"result": {"targetInfos": [{"type": "page", "targetId": "first"}, {"type": "page", "targetId": "active"}]}}
+        elif method == "Target.attachToTarget":
+            return {"result": {"sessionId": f"session-{params['targetId']}"}}
+        elif method == "Page.getFrameTree":
+            return {"result": {"frameTree": {"frame": {"id": "frame"}}}}
+        elif method == "Page.createIsolatedWorld":
+            self.worlds.append(session_id)
+            self.live_contexts.add(len(self.worlds))
+            return {"result": {"executionContextId": len(self.worlds)}}
+        elif method == "Runtime.evaluate":
+            if params["contextId"] not in self.live_contexts:
+                return {"error": {"message": "Cannot find context with specified id"}}
+            return {"result": {"result": {"value": [session_id, params["expression"], params["awaitPromise"]]}}}
+        raise AssertionError(method)
+
+    def navigate(self) -> None:
+        self.live_contexts.clear()
+
+
+@pytest.fixture
+def fake_browser() -> Iterator[Tuple[FakeBrowser, str]]:
+    browser = FakeBrowser()
+
+    def handler(websocket: ServerConnection) -> None:
+        for message in websocket:
+            request = json.loads(message)
+            websocket.send(json.dumps({"id": request["id"], **browser.answer(request)}))
+
+    with serve(handler, "127.0.0.1", 0) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        host, port = server.socket.getsockname()[:2]
+        yield browser, f"ws://{host}:{port}"
+        server.shutdown()
+
+
+def test_evaluate_reuses_the_isolated_world(fake_browser: Tuple[FakeBrowser, str]) -> None:
+    browser, ws_url = fake_browser
+    connection = CDPConnection(ws_url)
+
+    # Evaluates in the given Target, not the first Page
+    assert connection.evaluate("1", target_id="active") == ["session-active", "1", False]
+    assert connection.evaluate("2", target_id="active", await_promise=True) == ["session-active", "2", True]
+    assert browser.worlds == ["session-active"]
+    assert connection.evaluate("3") == ["session-first", "3", False]
+
+    # Recreated once the Navigation destroyed it
+    browser.navigate()
+    assert connection.evaluate("4", target_id="active") == ["session-active", "4", False]
+    assert connection.evaluate("5", target_id="active") == ["session-active", "5", False]
+    assert browser.worlds == ["session-active", "session-first", "session-active"]
+    connection.close()
+
+
+@pytest.mark.asyncio
+async def test_async_evaluate_reuses_the_isolated_world(fake_browser: Tuple[FakeBrowser, str]) -> None:
+    browser, ws_url = fake_browser
+    connection = await AsyncCDPConnection.connect(ws_url)
+
+    assert await connection.evaluate("1", target_id="active") == ["session-active", "1", False]
+    assert await connection.evaluate("2", target_id="active", await_promise=True) == ["session-active", "2", True]
+    browser.navigate()
+    assert await connection.evaluate("3", target_id="active") == ["session-active", "3", False]
+    assert browser.worlds == ["session-active", "session-active"]
+    await connection.close()
+
+
+def test_concurrent_evaluations_create_one_world(fake_browser: Tuple[FakeBrowser, str]) -> None:
+    browser, ws_url = fake_browser
+    connection = CDPConnection(ws_url)
+    results: List[Any] = []
+    threads = [threading.Thread(target=lambda: results.append(connection.evaluate("1", target_id="active"))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [["session-active", "1", False]] * 4 and browser.worlds == ["session-active"]
+    connection.close()
+
+
+def test_slow_browser_doesnt_block_the_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    class FakeConnection:
+        closed = False
+
+        def __init__(self, ws_url: str) -> None:
+            self.ws_url = ws_url
+
+    handshake = threading.Event()
+    monkeypatch.setattr(cdp_pool, "CDPConnection", FakeConnection)
+    # The Lookup of the slow Browser hangs until released
+    monkeypatch.setattr(browsers, "ws_url_from_url", lambda url: url if url == "fast" or handshake.wait(5) else "")
+    pool = CDPConnectionPool()
+
+    slow: List[Any] = []
+    threads = [threading.Thread(target=lambda: slow.append(pool.connection("slow"))) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    start = time.perf_counter()
+    assert pool.connection("fast").ws_url == "fast"  # type: ignore[attr-defined]
+    assert time.perf_counter() - start < 1
+    handshake.set()
+    for thread in threads:
+        thread.join()
+    # Both Callers got the same Connection
+    assert len(slow) == 2 and slow[0] is slow[1]
@@ -0,0 +1,15 @@
+import pytest
+
+from cdp_patches.input import KeyboardCodes
+from cdp_patches.input.chords import parse_chord
+
+
+def test_parse_chord() -> None:
+    assert parse_chord("ctrl+a") == (["ctrl"], "a")
+    assert parse_chord("Control + Shift + T") == (["ctrl", "shift"], "T")
+    assert parse_chord("ctrl++") == (["ctrl"], "+")
+    assert parse_chord("alt+enter") == (["alt"], KeyboardCodes.ENTER)  # type: ignore[attr-defined]
+    assert parse_chord("ctrl+page up") == (["ctrl"], KeyboardCodes.PAGE_UP)  # type: ignore[attr-defined]
+
+    with pytest.raises(ValueError):
+        parse_chord("hyper+a")
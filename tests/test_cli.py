@@ -0,0 +1,18 @@
+from cdp_patches.__main__ import StepTimer, measure
+
+
+def test_measure() -> None:
+    calls = []
+    stats = measure(lambda x, y: calls.append((x, y)), [(1, 2), (3, 4)])
+    assert calls == [(1, 2), (3, 4)]
+    assert stats["count"] == 2
+    assert stats["max_ms"] >= stats["p50_ms"]
+    assert measure(lambda: None, []) == {"count": 0}
+
+
+def test_step_timer() -> None:
+    timer = StepTimer()
+    with timer.step("first"):
+        pass
+    assert list(timer.steps) == ["first"]
+    assert timer.steps["first"] >= 0
@@ -0,0 +1,115 @@
+import asyncio
+import errno
+import os
+import stat
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Iterator, List, Tuple
+
+import pytest
+from Xlib import display
+
+from cdp_patches.input.daemon import DaemonBase, InputDaemon, create_linux_base, decode_timeline, encode_timeline
+from cdp_patches.input.os_base import linux
+from cdp_patches.input.os_base.backend import WindowInfo
+from cdp_patches.input.os_base.recording import RecordingBase
+from cdp_patches.input.timeline import TimelineEvent
+
+
+def test_timeline_encoding_roundtrip() -> None:
+    events = [
+        TimelineEvent(0.0, "move", 10, 20),
+        TimelineEvent(0.05, "down", 10, 20, key="left"),
+        TimelineEvent(0.1, "key", key="{BackSpace}"),
+        TimelineEvent(0.1, "key", key="ü"),
+        TimelineEvent(0.2, "scroll", key="down", amount=3),
+        TimelineEvent(0.2, "step", step=0),
+    ]
+    assert decode_timeline(encode_timeline(events)) == events
+
+
+class DaemonRecordingBase(RecordingBase):
+    def get_window(self) -> WindowInfo:  # type: ignore[override]
+        return self.windows[0]
+
+
+@pytest.fixture
+def daemon(tmp_path: Path) -> Iterator[Tuple[InputDaemon, List[RecordingBase]]]:
+    bases: List[RecordingBase] = []
+
+    def base_factory(pid: int, x_backend: str) -> RecordingBase:
+        bases.append(DaemonRecordingBase(pid=pid, realtime=False))
+        return bases[-1]
+
+    server = InputDaemon(str(tmp_path / "input.sock"), base_factory=base_factory)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server, bases
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def test_daemon_roundtrip(daemon: Tuple[InputDaemon, List[RecordingBase]]) -> None:
+    server, bases = daemon
+    assert stat.S_IMODE(os.stat(server.socket_path).st_mode) == 0o600
+
+    client = DaemonBase(1234, 2.0, socket_path=server.socket_path)
+    other = DaemonBase(1234, 1.0, socket_path=server.socket_path)
+    # Both Clients share one Base, but keep their own Scale Factor
+    assert len(bases) == 1 and client.get_window() == 1
+    client.down("left", 10, 20)
+    other.down("left", 10, 20)
+    client.scale_factor = 3.0
+    client.move(10, 20)
+    other.move(10, 20)
+    base = bases[0]
+    downs, moves = base.recorded("down"), base.recorded("move")
+    assert list(zip(downs["x"].tolist(), downs["y"].tolist())) == [(20, 40), (10, 20)]
+    assert list(zip(moves["x"].tolist(), moves["y"].tolist())) == [(30, 60), (10, 20)]
+
+    steps: List[int] = []
+    events = [TimelineEvent(0.0, "move", 1, 2), TimelineEvent(0.0, "step", step=0), TimelineEvent(0.0, "key", key="a")]
+    assert other.dispatch_timeline(events, on_step=steps.append)
+    assert steps == [0] and base.key_names(base.recorded("key")) == ["a"]
+    assert client.capture(0, 0, 4, 2).shape == (6, 12, 4)
+
+    with pytest.raises(ValueError):
+        # Unknown Opcode
+        client._request(0x7F)
+    client.close()
+    other.close()
+
+
+def test_daemon_keeps_a_live_socket(daemon: Tuple[InputDaemon, List[RecordingBase]]) -> None:
+    server, _ = daemon
+    with pytest.raises(OSError) as error:
+        InputDaemon(server.socket_path)
+    assert error.value.errno == errno.EADDRINUSE
+    assert os.path.exists(server.socket_path)
+
+
+def test_linux_base_is_created_off_the_main_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    window = SimpleNamespace(id=42)
+    monkeypatch.setattr(display, "Display", lambda display_name: SimpleNamespace(create_resource_object=lambda kind, window_id: window))
+    monkeypatch.setattr(linux.LinuxBase, "create_connection", lambda self, x_backend, display_name: None)
+    monkeypatch.setattr(linux.LinuxBase, "get_window", lambda self: window.id)
+    created: List[Any] = []
+    errors: List[BaseException] = []
+
+    def attach() -> None:
+        try:
+            created.append(create_linux_base(1234, "xlib"))
+        except BaseException as error:
+            errors.append(error)
+
+    # Daemon Handlers attach from their own Threads, which have no Event Loop
+    handler = threading.Thread(target=attach)
+    handler.start()
+    handler.join()
+    assert not errors and created[0].browser_window is window
+    monkeypatch.setattr(linux.LinuxBase, "get_window", lambda self: window)
+    assert asyncio.run(created[0].async_get_window()) is window
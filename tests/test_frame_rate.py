@@ -0,0 +1,61 @@
+from typing import List
+
+import numpy as np
+import pytest
+
+from cdp_patches.input import SyncInput
+from cdp_patches.input import sync_input as sync_input_module
+from cdp_patches.input.browsers import SyncEvaluator
+from cdp_patches.input.frame_rate import frame_align, frame_probe_script, refresh_rate
+from cdp_patches.input.os_base.recording import RecordingBase
+
+
+def test_refresh_rate() -> None:
+    # First Interval starts mid-Frame, one dropped Frame
+    timestamps = [0.0, 5.0, 21.7, 38.3, 55.0, 88.3, 105.0, 121.7]
+    assert round(refresh_rate(timestamps) or 0) == 60
+    assert refresh_rate([0.0, 16.7]) is None
+
+
+def test_frame_align() -> None:
+    points = list(range(10))
+    # 4ms Points at 100 Hz: the last Point of every 10ms Frame is kept
+    aligned, offsets = frame_align(points, 0.004, 0.01)
+    assert aligned == [2, 4, 7, 9]
+    assert np.allclose(offsets, [0.0, 0.01, 0.02, 0.03])
+    # Slower than the Refresh Rate, nothing to drop
+    assert frame_align(points, 0.02, 0.01)[0] == points
+
+
+def test_chain_sends_one_point_per_frame() -> None:
+    base = RecordingBase(realtime=False)
+    sync_input = SyncInput(base=base, seed=1)
+    sync_input.chain().move(900, 600).perform()
+    unaligned = len(base.recorded("move"))
+
+    base.clear()
+    sync_input.frame_rate = 60
+    sync_input.last_x = sync_input.last_y = 0
+    sync_input.chain().move(900, 600).perform()
+    moves = base.recorded("move")
+    assert len(moves) < unaligned
+    assert (moves["x"][-1], moves["y"][-1]) == (900, 600)
+    frames = np.diff(moves["time"][:-1]) * 60
+    assert np.all(frames > 0.99)
+
+
+def test_frame_rate_is_probed_in_one_evaluation(monkeypatch: pytest.MonkeyPatch) -> None:
+    expressions: List[str] = []
+
+    def evaluate(expression: str) -> List[float]:
+        expressions.append(expression)
+        return [0.0, 5.0, 21.7, 38.3, 55.0, 71.7]
+
+    monkeypatch.setattr(sync_input_module, "get_sync_evaluator", lambda browser: SyncEvaluator(evaluate))
+    sync_input = SyncInput(base=RecordingBase(realtime=False))
+    sync_input.browser = object()  # type: ignore[assignment]
+
+    assert round(sync_input.detect_frame_rate()) == 60
+    # The Promise is awaited in the same Evaluation, no Global is left in the Page
+    assert expressions == [frame_probe_script(sync_input.frame_probe_timeout)]
+    assert expressions[0].startswith("new Promise") and "window." not in expressions[0]
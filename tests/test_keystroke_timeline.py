@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from cdp_patches.input.keystroke_timeline import KeystrokeTimeline, fill_segments
+
+
+def test_timeline_matches_target_wpm() -> None:
+    text = "The quick brown fox jumps over the lazy dog."
+    timeline = KeystrokeTimeline(text, wpm=60, rng=np.random.default_rng(0))
+
+    assert timeline.keys == list(text)
+    assert timeline.intervals[0] == 0
+    # 60 WPM = 5 Characters per Second
+    assert timeline.duration == pytest.approx((len(text) - 1) / 5)
+    assert (np.diff(timeline.timestamps) >= 0).all()
+
+
+def test_timeline_typos_get_corrected() -> None:
+    text = "typos everywhere"
+    timeline = KeystrokeTimeline(text, wpm=80, rng=np.random.default_rng(1), typo_rate=1.0, backspace_key="{BackSpace}")
+
+    typed = ""
+    for key in timeline.keys:
+        typed = typed[:-1] if key == "{BackSpace}" else typed + key
+    assert typed == text
+    assert timeline.keys.count("{BackSpace}") == len(text) - text.count(" ")
+
+
+def test_fill_segments() -> None:
+    assert fill_segments("Hello{ENTER}World {") == [(False, "Hello"), (True, "{ENTER}"), (False, "World {")]
+    assert fill_segments("{TAB}{TAB}") == [(True, "{TAB}"), (True, "{TAB}")]
@@ -0,0 +1,22 @@
+import pytest
+
+from cdp_patches.input.latency import correlate
+
+
+def test_correlate_pairs_events_in_order() -> None:
+    injections = [("mousedown", 10.0), ("mouseup", 20.0), ("mousedown", 30.0)]
+    dom_events = [("mousedown", 12.0), ("mouseup", 25.0), ("mousedown", 31.0)]
+
+    results = correlate(injections, dom_events)
+    assert results["mousedown"] == ([2.0, 1.0], 0)
+    assert results["mouseup"] == ([5.0], 0)
+
+
+def test_correlate_coalesced_moves() -> None:
+    injections = [("mousemove", 0.0), ("mousemove", 4.0), ("mousemove", 8.0), ("mousemove", 20.0)]
+    # Chrome merged the first three Moves into one Event, the one without Injection came from a real User
+    dom_events = [("mousemove", -5.0), ("mousemove", 16.0), ("mousemove", 22.0)]
+
+    latencies, coalesced = correlate(injections, dom_events)["mousemove"]
+    assert latencies == pytest.approx([8.0, 2.0])
+    assert coalesced == 2
@@ -0,0 +1,381 @@
+import asyncio
+import ctypes
+import gc
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, List, Tuple
+
+import numpy as np
+import pytest
+from Xlib import X, Xatom
+
+from cdp_patches.input.os_base import linux
+from cdp_patches.input.os_base.linux import LinuxBase
+from cdp_patches.input.os_base.xcb import ShmCaptureError, XCBShmCapture
+from cdp_patches.input.os_base.xinput import MasterDevices
+from cdp_patches.input.rate_control import RateController
+from cdp_patches.input.timeline import TimelineEvent
+
+
+class FakeWindow:
+    """Browser Window at (x, y) under a reparenting Window Manager, counting its Round-Trips"""
+
+    def __init__(self, root: Any, window_id: int = 1, x: int = 100, y: int = 50) -> None:
+        self.root = root
+        self.parent = SimpleNamespace()
+        self.id = window_id
+        self.x, self.y = x, y
+        self.min_height = 86
+        self.queries = 0
+
+    def translate_coords(self, src_window: Any, x: int, y: int) -> SimpleNamespace:
+        self.queries += 1
+        return SimpleNamespace(x=-self.x, y=-self.y) if src_window is self.root else SimpleNamespace(x=0, y=0)
+
+    def query_tree(self) -> SimpleNamespace:
+        return SimpleNamespace(root=self.root, parent=self.parent)
+
+    def get_geometry(self) -> SimpleNamespace:
+        self.queries += 1
+        return SimpleNamespace(width=1280, height=800)
+
+    def get_wm_normal_hints(self) -> SimpleNamespace:
+        self.queries += 1
+        return SimpleNamespace(min_height=self.min_height)
+
+    def get_property(self, *args: Any) -> None:
+        return None
+
+    def change_attributes(self, **kwargs: Any) -> None:
+        pass
+
+
+class FakeDisplay:
+    def __init__(self) -> None:
+        self.events: List[Any] = []
+        self.root = SimpleNamespace(id=0x100, get_image=self.get_image)
+        self.display = SimpleNamespace(info=SimpleNamespace(pixmap_formats=[SimpleNamespace(depth=24, bits_per_pixel=32, scanline_pad=32)]))
+
+    def screen(self) -> SimpleNamespace:
+        return SimpleNamespace(root=self.root, root_depth=24, width_in_pixels=1920, height_in_pixels=1080)
+
+    def get_image(self, x: int, y: int, width: int, height: int, *args: Any) -> SimpleNamespace:
+        return SimpleNamespace(data=bytes(width * height * 4))
+
+    def get_atom(self, name: str, only_if_exists: bool = False) -> int:
+        return 1
+
+    def pending_events(self) -> int:
+        return len(self.events)
+
+    def next_event(self) -> Any:
+        return self.events.pop(0)
+
+    def flush(self) -> None:
+        pass
+
+
+def fake_base() -> LinuxBase:
+    base = LinuxBase.__new__(LinuxBase)
+    base.pid = 1234
+    base.scale_factor = 1.0
+    base.display = FakeDisplay()  # type: ignore[assignment]
+    base.display_name = ":0"
+    base.lock = threading.RLock()
+    base.windows = []
+    base.content_insets = {}
+    base.browser_window = FakeWindow(base.display.root)  # type: ignore[assignment]
+    base._watch_window(base.browser_window)
+    return base
+
+
+def test_capture_falls_back_to_get_image(monkeypatch: pytest.MonkeyPatch) -> None:
+    closed: List[bool] = []
+
+    class UnattachableCapture:
+        def __init__(self, display_name: str) -> None:
+            pass
+
+        def capture(self, *args: Any) -> np.ndarray:
+            # The X Server couldnt attach the Segment, the GetImage Reply is NULL
+            raise ShmCaptureError("Couldn't capture region.")
+
+        def close(self) -> None:
+            closed.append(True)
+
+    monkeypatch.setattr(linux, "XCBShmCapture", UnattachableCapture)
+    base = fake_base()
+
+    pixels = base.capture(0, 0, 200, 100)
+    assert pixels.shape == (100, 200, 4)
+    assert base._shm_unavailable and base._shm_capture is None and closed == [True]
+
+
+def test_shm_capture_returns_a_copy() -> None:
+    segment = (ctypes.c_uint8 * 16)(*range(16))
+    capture = XCBShmCapture.__new__(XCBShmCapture)
+    capture._conn = object()
+    capture._shm = SimpleNamespace(xcb_shm_get_image=lambda *args: 1, xcb_shm_get_image_reply=lambda *args: 1)  # type: ignore[assignment]
+    capture._libs = SimpleNamespace(libc=SimpleNamespace(free=lambda reply: None))  # type: ignore[assignment]
+    capture._shmaddr, capture._size = ctypes.addressof(segment), 16
+
+    rows = capture.capture(0, 0, 0, 2, 2, 8)
+    # The next Capture overwrites the Segment (or unmaps it when it regrows), earlier Results keep their Pixels
+    segment[0] = 255
+    assert rows.shape == (2, 8) and rows[0, 0] == 0 and rows.tolist()[1] == list(range(8, 16))
+
+
+def watched_base() -> Tuple[LinuxBase, List[int]]:
+    base = fake_base()
+    rescans: List[int] = []
+
+    def get_window() -> Any:
+        rescans.append(1)
+        base._watch_window(base.browser_window)
+        return base.browser_window
+
+    base.get_window = get_window  # type: ignore[method-assign]
+    return base, rescans
+
+
+def window_event(event_type: int, window_id: int = 1, **fields: Any) -> SimpleNamespace:
+    return SimpleNamespace(type=event_type, window=SimpleNamespace(id=window_id), **fields)
+
+
+def test_live_window_needs_no_round_trip() -> None:
+    base, rescans = watched_base()
+    # Events of other Windows are ignored
+    base.display.events.append(window_event(X.DestroyNotify, window_id=2))  # type: ignore[attr-defined]
+    for _ in range(3):
+        base.ensure_window()
+    assert not rescans and base.browser_window.queries == 0  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("event_type", [X.DestroyNotify, X.UnmapNotify])
+def test_closed_window_gets_rescanned(event_type: int) -> None:
+    base, rescans = watched_base()
+    base.display.events.append(window_event(event_type))  # type: ignore[attr-defined]
+    base.ensure_window()
+    assert rescans == [1]
+    # Watched again, no further Scans
+    base.ensure_window()
+    assert rescans == [1]
+
+
+def test_changed_hints_are_checked_once() -> None:
+    base, rescans = watched_base()
+    base.display.events.append(window_event(X.PropertyNotify, atom=Xatom.WM_NORMAL_HINTS))  # type: ignore[attr-defined]
+    base.ensure_window()
+    base.ensure_window()
+    assert not rescans and base.browser_window.queries == 1  # type: ignore[attr-defined]
+
+    # Hints without a Minimum Height: the Window isnt a Browser Window anymore
+    base.browser_window.min_height = 0  # type: ignore[attr-defined]
+    base.display.events.append(window_event(X.PropertyNotify, atom=Xatom.WM_NORMAL_HINTS))  # type: ignore[attr-defined]
+    base.ensure_window()
+    assert rescans == [1]
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.moves: List[Tuple[int, int]] = []
+
+    def fake_input(self, event_type: int, x: int = 0, y: int = 0, **kwargs: Any) -> None:
+        self.moves.append((x, y))
+
+    def sync(self) -> None:
+        pass
+
+
+def calibrated_base() -> Tuple[LinuxBase, FakeConnection]:
+    base = fake_base()
+    base.rate_controller = RateController()
+    connection = base.connection = FakeConnection()  # type: ignore[assignment]
+    base.ensure_window()
+    # Viewport 85px below the Top of the Window at (100, 50)
+    base.calibrate(100, 135)
+    return base, connection
+
+
+def test_calibrated_offset_is_cached() -> None:
+    base, connection = calibrated_base()
+    window: Any = base.browser_window
+    queries = window.queries
+
+    for _ in range(3):
+        base.move(10, 20)
+    assert connection.moves == [(110, 155)] * 3
+    assert window.queries == queries
+
+
+@pytest.mark.parametrize("event_type", [X.ConfigureNotify, X.ReparentNotify])
+def test_calibrated_offset_follows_the_window(event_type: int) -> None:
+    base, connection = calibrated_base()
+    window: Any = base.browser_window
+    window.x, window.y = 300, 200
+    base.display.events.append(window_event(event_type))  # type: ignore[attr-defined]
+
+    # Re-derived from the calibrated Inset, not the Toolbar Heuristic
+    base.move(10, 20)
+    base.move(10, 20)
+    assert connection.moves == [(310, 305)] * 2
+    assert base.content_insets == {window.id: (0, 85)}
+
+
+def display_base(display_name: str) -> Tuple[LinuxBase, FakeConnection]:
+    base = fake_base()
+    base.lock = linux.display_lock(display_name)
+    base.rate_controller = RateController()
+    connection = base.connection = FakeConnection()  # type: ignore[assignment]
+    return base, connection
+
+
+def test_input_is_serialized_per_display() -> None:
+    first, _ = display_base(":90")
+    second, second_connection = display_base(":90")
+    other, other_connection = display_base(":91")
+    assert first.lock is second.lock and first.lock is not other.lock
+
+    with first.lock:
+        # Bases on the same Display wait for the running Gesture, Bases on other Displays dont
+        same_display = threading.Thread(target=second.move, args=(10, 20))
+        other_display = threading.Thread(target=other.move, args=(10, 20))
+        same_display.start()
+        other_display.start()
+        other_display.join(1)
+        same_display.join(0.2)
+        assert not other_display.is_alive() and other_connection.moves
+        assert same_display.is_alive() and not second_connection.moves
+    same_display.join(1)
+    assert second_connection.moves
+
+
+@pytest.mark.asyncio
+async def test_async_get_window_doesnt_block_the_loop() -> None:
+    base, _ = display_base(":92")
+
+    def get_window() -> Any:
+        with base.lock:
+            return base.browser_window
+
+    base.get_window = get_window  # type: ignore[method-assign]
+    released = threading.Event()
+
+    def hold_lock() -> None:
+        with base.lock:
+            time.sleep(0.2)
+            released.set()
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    await asyncio.sleep(0.01)
+    window_future = asyncio.ensure_future(base.async_get_window())
+    # The Loop keeps running while the Window Lookup waits for the Lock
+    await asyncio.sleep(0.05)
+    assert not released.is_set() and not window_future.done()
+    assert await window_future is base.browser_window
+    holder.join()
+
+
+class FakeSelectionOwner:
+    def __init__(self) -> None:
+        self.served = threading.Event()
+        self.texts: List[str] = []
+        self.restored = False
+
+    def own(self, text: str) -> None:
+        self.texts.append(text)
+
+    def restore(self) -> None:
+        self.restored = True
+
+
+def test_paste_waits_for_the_browser_without_the_display_lock() -> None:
+    base, _ = display_base(":93")
+    selection_owner = base._selection_owner = FakeSelectionOwner()  # type: ignore[assignment]
+    chorded = threading.Event()
+    base.send_chord = lambda modifiers, key: chorded.set()  # type: ignore[method-assign]
+
+    paste = threading.Thread(target=base.paste, args=("Hello",))
+    paste.start()
+    assert chorded.wait(1)
+    # Other Bases on the Display keep sending Input while the Browser reads the Text
+    assert base.lock.acquire(timeout=0.5)
+    base.lock.release()
+    assert paste.is_alive() and not selection_owner.restored
+
+    selection_owner.served.set()
+    paste.join(1)
+    assert not paste.is_alive()
+    assert selection_owner.texts == ["Hello"] and selection_owner.restored
+
+
+class KeyConnection:
+    def __init__(self) -> None:
+        self.events: List[Tuple[int, int]] = []
+
+    def fake_input(self, event_type: int, detail: int = 0, x: int = 0, y: int = 0, **kwargs: Any) -> None:
+        self.events.append((event_type, detail))
+
+    def sync(self) -> None:
+        pass
+
+
+def test_shift_run_holds_the_display_lock() -> None:
+    base, _ = display_base(":94")
+    connection = base.connection = KeyConnection()  # type: ignore[assignment]
+    base.held_modifiers = set()
+    base.shifted_chars = ""
+    base._prepare_keystrokes = lambda: 50  # type: ignore[method-assign]
+    base._keycode = lambda key: ord(key)  # type: ignore[method-assign]
+    base.display.keysym_to_keycode = lambda keysym: 50  # type: ignore[attr-defined]
+    other, _ = display_base(":94")
+    other.connection = connection  # type: ignore[assignment]
+
+    # Another Thread moves between the two Keys of the shifted Run
+    mover = threading.Timer(0.05, other.move, args=(10, 20))
+    mover.start()
+    base.dispatch_timeline([TimelineEvent(0.0, "key", key="A"), TimelineEvent(0.15, "key", key="B"), TimelineEvent(0.2, "key", key="c")])
+    mover.join()
+
+    shift = [index for index, event in enumerate(connection.events) if event[1] == 50]
+    motion = [index for index, event in enumerate(connection.events) if event[0] == X.MotionNotify]
+    # The Move waited until Shift was released
+    assert len(shift) == 2 and motion[0] > shift[1]
+    # The Lock taken for the Run got released with Shift
+    acquired: List[bool] = []
+
+    def acquire() -> None:
+        acquired.append(base.lock.acquire(timeout=1))
+        base.lock.release()
+
+    checker = threading.Thread(target=acquire)
+    checker.start()
+    checker.join()
+    assert acquired == [True]
+
+
+def test_dropped_base_removes_its_master(monkeypatch: pytest.MonkeyPatch) -> None:
+    removed: List[MasterDevices] = []
+    monkeypatch.setattr(linux, "create_master", lambda xlib_display: MasterDevices(20, 21, "cdp-patches-test"))
+    monkeypatch.setattr(linux, "remove_master", lambda xlib_display, master: removed.append(master))
+
+    def multi_pointer_base() -> LinuxBase:
+        base, connection = display_base(":95")
+        base.x_backend = "xlib"
+        connection.set_client_pointer = lambda pointer: None  # type: ignore[attr-defined]
+        base.attach_master()
+        return base
+
+    base = multi_pointer_base()
+    base.detach_master()
+    del base
+    gc.collect()
+    # Removed once, not again by the Finalizer
+    assert len(removed) == 1
+
+    base = multi_pointer_base()
+    del base
+    gc.collect()
+    assert removed == [MasterDevices(20, 21, "cdp-patches-test")] * 2
@@ -0,0 +1,15 @@
+import numpy as np
+
+from cdp_patches.input.mouse_trajectory import HumanizeMouseTrajectory
+
+
+def test_seeded_trajectory_is_reproducible() -> None:
+    first = HumanizeMouseTrajectory((10, 20), (640, 480), rng=np.random.default_rng(1337))
+    second = HumanizeMouseTrajectory((10, 20), (640, 480), rng=np.random.default_rng(1337))
+    assert first.points == second.points
+
+
+def test_trajectory_ends_at_target() -> None:
+    trajectory = HumanizeMouseTrajectory((100, 100), (300, 50), rng=np.random.default_rng())
+    assert trajectory.points[0] == (100, 100)
+    assert trajectory.points[-1] == (300, 50)
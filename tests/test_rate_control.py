@@ -0,0 +1,30 @@
+from typing import List
+
+from cdp_patches.input.rate_control import RateController, RateReport
+
+
+def test_density_follows_latency() -> None:
+    reports: List[RateReport] = []
+    controller = RateController(adjust_interval=1, on_adjust=reports.append)
+
+    for _ in range(20):
+        controller.observe(0.02)
+    assert controller.density == controller.min_density
+    assert reports[-1].saturated
+
+    for _ in range(200):
+        controller.observe(0.0001)
+    assert controller.density == 1.0
+    assert not controller.report().saturated
+
+
+def test_thin_keeps_endpoints_and_duration() -> None:
+    controller = RateController()
+    points = list(range(100))
+    assert controller.thin(points) == (points, 1.0)
+
+    controller.density = 0.25
+    thinned, interval_scale = controller.thin(points)
+    assert len(thinned) == 25
+    assert thinned[0] == 0 and thinned[-1] == 99
+    assert len(thinned) * interval_scale == len(points)
@@ -0,0 +1,152 @@
+import asyncio
+import time
+from typing import Tuple
+
+import numpy as np
+
+from cdp_patches.input import AsyncInput, SyncInput
+from cdp_patches.input.os_base.recording import RecordingBase
+
+
+def test_sync_input_recording() -> None:
+    base = RecordingBase(capacity=4, realtime=False)
+    sync_input = SyncInput(base=base, seed=0)
+    sync_input.sleep_timeout = 0
+
+    sync_input.click("left", 100, 200)
+    sync_input.move(400, 300)
+    sync_input.type("Hey{ENTER}", fill=True)
+
+    # Buffer grew past its initial Capacity
+    assert base.count > 4
+    downs, ups = base.recorded("down"), base.recorded("up")
+    assert base.key_names(downs) == ["left"] and base.key_names(ups) == ["left"]
+    assert (downs["x"][0], downs["y"][0]) == (100, 200)
+
+    moves = base.recorded("move")
+    assert len(moves) > 2
+    assert (moves["x"][-1], moves["y"][-1]) == (400, 300)
+    # Filled Text is pasted, Key Names are still pressed
+    assert base.key_names(base.recorded("paste")) == ["Hey"]
+    assert base.key_names(base.recorded("key")) == ["{ENTER}"]
+
+    base.clear()
+    assert len(base.events) == 0
+
+
+def test_chain_virtual_timestamps() -> None:
+    base = RecordingBase(realtime=False)
+    sync_input = SyncInput(base=base, seed=1)
+
+    finished = sync_input.chain().move(50, 50).click("left", 300, 300).type("abc").wait(5).scroll("down", 3).perform()
+    assert finished
+
+    times = base.events["time"]
+    assert np.all(np.diff(times) >= 0)
+    # The Wait is recorded in the Timestamps, not waited for
+    assert times[-1] - times[0] >= 5
+    assert base.recorded("scroll")["amount"].tolist() == [3]
+
+
+def test_async_input_recording() -> None:
+    async def run() -> RecordingBase:
+        base = RecordingBase(realtime=False)
+        async_input = await AsyncInput(base=base, seed=2)
+        async_input.sleep_timeout = 0
+        await async_input.click("right", 10, 20)
+        await async_input.chain().move(100, 100).down("left", 100, 100).up("left", 120, 100).perform()
+        return base
+
+    base = asyncio.run(run())
+    assert base.key_names(base.recorded("down")) == ["right", "left"]
+    assert (base.recorded("up")["x"][-1], base.recorded("up")["y"][-1]) == (120, 100)
+
+
+def test_fill_pastes_once() -> None:
+    base = RecordingBase(realtime=False)
+    sync_input = SyncInput(base=base)
+    text = "Lorem ipsum\n" * 500
+
+    sync_input.type(text, fill=True)
+    assert base.key_names(base.recorded("paste")) == [text]
+    assert not len(base.recorded("key"))
+
+
+def test_async_fill_doesnt_block_the_loop() -> None:
+    class SlowPasteBase(RecordingBase):
+        def paste(self, text: str) -> None:
+            # Waiting for the Browser to read the Clipboard
+            time.sleep(0.2)
+            super().paste(text)
+
+    async def run() -> Tuple[int, RecordingBase]:
+        base = SlowPasteBase(realtime=False)
+        async_input = await AsyncInput(base=base)
+        fill = asyncio.ensure_future(async_input.type("Hey{ENTER}", fill=True))
+        ticks = 0
+        while not fill.done():
+            await asyncio.sleep(0.01)
+            ticks += 1
+        await fill
+        return ticks, base
+
+    ticks, base = asyncio.run(run())
+    assert ticks > 5 and base.key_names(base.recorded("paste")) == ["Hey"]
+
+
+def test_type_pauses_between_words() -> None:
+    base = RecordingBase(realtime=False)
+    sync_input = SyncInput(base=base, seed=3)
+    sync_input.typing_speed = 10_000
+    sync_input.sleep_timeout = 0.5
+
+    sync_input.type("ab cd")
+    times = base.recorded("key")["time"]
+    # Without a timeout, Words are still separated by sleep_timeout
+    assert times[3] - times[2] >= 0.5 > times[1] - times[0]
+
+
+def test_async_chain_cancels_during_wait() -> None:
+    async def run() -> Tuple[bool, float, RecordingBase]:
+        base = RecordingBase()
+        async_input = await AsyncInput(base=base)
+        chain = async_input.chain().wait(10).click("left", 10, 10, emulate_behaviour=False)
+
+        start = time.perf_counter()
+        perform = asyncio.ensure_future(chain.perform())
+        await asyncio.sleep(0.05)
+        chain.cancel()
+        return await perform, time.perf_counter() - start, base
+
+    completed, duration, base = asyncio.run(run())
+    assert not completed and duration < 1
+    assert not len(base.recorded("down"))
+
+
+def test_async_chain_starts_at_the_current_position() -> None:
+    async def run() -> RecordingBase:
+        base = RecordingBase(realtime=False)
+        async_input = await AsyncInput(base=base, seed=5)
+        async with async_input._move_lock:
+            perform = asyncio.ensure_future(async_input.chain().move(900, 600).perform())
+            await asyncio.sleep(0.01)
+            # A concurrent Move finishes while the Chain waits for the Lock
+            async_input.last_x, async_input.last_y = 500, 500
+        await perform
+        return base
+
+    moves = asyncio.run(run()).recorded("move")
+    assert abs(moves["x"][0] - 500) < 50 and abs(moves["y"][0] - 500) < 50
+
+
+def test_drag_dwell_nudges_the_pointer() -> None:
+    base = RecordingBase(realtime=False)
+    sync_input = SyncInput(base=base, seed=4)
+    sync_input.drag((10, 10), (200, 100), dwell=0.5, emulate_behaviour=False)
+
+    moves = base.recorded("move")
+    # X drops Moves without a Delta, the Nudge needs to actually move the Pointer
+    assert list(zip(moves["x"][-3:].tolist(), moves["y"][-3:].tolist())) == [(200, 100), (201, 100), (200, 100)]
+    assert moves["time"][-1] > moves["time"][-2]
+    ups = base.recorded("up")
+    assert (ups["x"][0], ups["y"][0]) == (200, 100)
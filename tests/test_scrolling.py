@@ -0,0 +1,63 @@
+from typing import List
+
+from cdp_patches.input import SyncInput
+from cdp_patches.input.browsers import SyncEvaluator
+from cdp_patches.input.os_base.recording import RecordingBase
+from cdp_patches.input.scrolling import scroll_notches, scroll_position_script, viewport_metrics_script
+
+
+def test_scroll_notches() -> None:
+    # Already visible
+    assert scroll_notches(500, 0, 1000, 50) == 0
+    # Centers the Target in one Batch
+    assert scroll_notches(4000, 0, 1000, 50) == 70
+    assert scroll_notches(5000, 2000, 1000, 50) == 50
+    # Targets at the Viewport Edge need at least one Notch
+    assert scroll_notches(995, 0, 1000, 2000) == 1
+
+
+def test_scroll_notches_at_document_edges() -> None:
+    # The Page cant scroll above its Top or below its Bottom to center the Target
+    assert scroll_notches(10, 0, 800, 53.3) == 0
+    assert scroll_notches(100, 2000, 1000, 50) == -40
+    assert scroll_notches(1990, 1200, 800, 53.3, scroll_size=2000) == 0
+    assert scroll_notches(1990, 1000, 800, 53.3, scroll_size=2000) == 4
+    assert scroll_notches(1990, 1000, 800, 53.3) == 11
+
+
+class FakePage:
+    """Document of 2000px Height in an 800px Viewport, scrolled by the recorded Wheel Notches"""
+
+    def __init__(self, base: RecordingBase) -> None:
+        self.base = base
+
+    @property
+    def scroll_y(self) -> float:
+        scrolled = 0.0
+        for direction, amount in zip(self.base.key_names(self.base.recorded("scroll")), self.base.recorded("scroll")["amount"].tolist()):
+            scrolled += amount * 53.333 * (1 if direction == "down" else -1)
+            scrolled = min(max(scrolled, 0.0), 1200.0)
+        return scrolled
+
+    def evaluate(self, expression: str) -> List[float]:
+        if expression == viewport_metrics_script:
+            return [0.0, self.scroll_y, 1280.0, 800.0, 1280.0, 2000.0]
+        assert expression == scroll_position_script
+        return [0.0, self.scroll_y]
+
+
+def test_scroll_into_view_at_document_bottom() -> None:
+    base = RecordingBase(realtime=False)
+    sync_input = SyncInput(base=base)
+    sync_input.browser = object()  # type: ignore[assignment]
+    sync_input.scroll_settle_timeout = 0.2
+    closed: List[bool] = []
+    sync_input._evaluator = SyncEvaluator(FakePage(base).evaluate, lambda: closed.append(True))
+
+    # Can only be scrolled to the Bottom of the Document, not centered
+    assert sync_input.scroll_into_view(100, 1990) == (100, 790)
+    assert sync_input.scroll_into_view(100, 1990) == (100, 790)
+    # One Evaluator per Handle, released with it
+    sync_input.close()
+    assert closed == [True]
+    assert sync_input._evaluator is None
@@ -0,0 +1,144 @@
+import threading
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple
+
+from Xlib import X, Xatom
+
+from cdp_patches.input.os_base.selection import SelectionOwner, selection_names
+
+
+class FakeRequestor:
+    """Requestor Window (e.g. Chrome) recording the Properties & Events the Owner sends it"""
+
+    def __init__(self, window_id: int = 7) -> None:
+        self.id = window_id
+        self.properties: Dict[int, Tuple[int, int, Any]] = {}
+        self.events: List[Any] = []
+        self.event_mask = X.NoEventMask
+
+    def __window__(self) -> int:
+        return self.id
+
+    def change_property(self, property_atom: int, property_type: int, property_format: int, data: Any) -> None:
+        self.properties[property_atom] = (property_type, property_format, data)
+
+    def change_attributes(self, event_mask: int) -> None:
+        self.event_mask = event_mask
+
+    def send_event(self, event: Any) -> None:
+        self.events.append(event)
+
+
+class FakeOwnerWindow:
+    def __init__(self) -> None:
+        self.id = 1
+        self.properties: Dict[int, Any] = {}
+
+    def get_full_property(self, property_atom: int, property_type: int) -> Any:
+        return self.properties.get(property_atom)
+
+    def delete_property(self, property_atom: int) -> None:
+        self.properties.pop(property_atom, None)
+
+
+def selection_owner(text: str, chunk_size: int = 1024) -> SelectionOwner:
+    owner = SelectionOwner.__new__(SelectionOwner)
+    owner.display = SimpleNamespace(flush=lambda: None)  # type: ignore[assignment]
+    owner.window = FakeOwnerWindow()
+    owner.atoms = {name: atom for atom, name in enumerate(selection_names + ("TARGETS", "UTF8_STRING", "TEXT", "INCR", "CDP_PATCHES_SELECTION"), start=100)}
+    owner.chunk_size = chunk_size
+    owner.texts = {owner.atoms[name]: text for name in selection_names}
+    owner.previous = {}
+    owner.owned = set(owner.texts)
+    owner.served = threading.Event()
+    owner.transfers = {}
+    owner.fetched = {}
+    owner.fetch_done = threading.Event()
+    owner._lock = threading.Lock()
+    return owner
+
+
+def request(owner: SelectionOwner, requestor: FakeRequestor, target: int, selection: str = "CLIPBOARD", property_atom: int = 200) -> SimpleNamespace:
+    return SimpleNamespace(type=X.SelectionRequest, time=0, requestor=requestor, selection=owner.atoms[selection], target=target, property=property_atom)
+
+
+def test_targets_are_announced() -> None:
+    owner = selection_owner("Hello")
+    requestor = FakeRequestor()
+    owner._handle_event(request(owner, requestor, owner.atoms["TARGETS"]))
+
+    assert requestor.properties[200] == (Xatom.ATOM, 32, [owner.atoms["TARGETS"], owner.atoms["UTF8_STRING"], owner.atoms["TEXT"], Xatom.STRING])
+    assert requestor.events[0].property == 200
+    # Only the Text itself completes the Paste
+    assert not owner.served.is_set()
+
+
+def test_text_is_served_directly() -> None:
+    owner = selection_owner("Grüße")
+    requestor = FakeRequestor()
+    owner._handle_event(request(owner, requestor, owner.atoms["UTF8_STRING"]))
+    assert requestor.properties[200] == (owner.atoms["UTF8_STRING"], 8, "Grüße".encode())
+    assert owner.served.is_set()
+
+    # Obsolete Clients get the Property named after the Target
+    owner._handle_event(request(owner, requestor, Xatom.STRING, property_atom=X.NONE))
+    assert requestor.properties[Xatom.STRING] == (Xatom.STRING, 8, "Grüße".encode("latin-1"))
+
+
+def test_unknown_targets_and_lost_selections_are_refused() -> None:
+    owner = selection_owner("Hello")
+    requestor = FakeRequestor()
+    owner._handle_event(request(owner, requestor, Xatom.PIXMAP))
+    owner._handle_event(SimpleNamespace(type=X.SelectionClear, atom=owner.atoms["PRIMARY"]))
+    owner._handle_event(request(owner, requestor, owner.atoms["UTF8_STRING"], selection="PRIMARY"))
+
+    assert not requestor.properties
+    assert [event.property for event in requestor.events] == [X.NONE, X.NONE]
+
+
+def test_large_text_is_transferred_incrementally() -> None:
+    text = "x" * 25
+    owner = selection_owner(text, chunk_size=10)
+    requestor = FakeRequestor()
+    owner._handle_event(request(owner, requestor, owner.atoms["UTF8_STRING"]))
+    # Announced with its Size, the Requestor gets notified about Property Changes
+    assert requestor.properties[200] == (owner.atoms["INCR"], 32, [25])
+    assert requestor.event_mask == X.PropertyChangeMask
+
+    chunks: List[bytes] = []
+    while not owner.served.is_set():
+        # Deleting the Property requests the next Chunk
+        owner._handle_event(SimpleNamespace(type=X.PropertyNotify, state=X.PropertyDelete, window=requestor, atom=200))
+        chunks.append(requestor.properties[200][2])
+    assert chunks == [b"x" * 10, b"x" * 10, b"x" * 5, b""]
+    assert not owner.transfers and requestor.event_mask == X.NoEventMask
+
+
+def test_restore_serves_the_previous_text() -> None:
+    owner = selection_owner("Pasted")
+    clipboard, primary = owner.atoms["CLIPBOARD"], owner.atoms["PRIMARY"]
+    owner.previous = {clipboard: "Copied", primary: None}
+    owner.restore()
+
+    requestor = FakeRequestor()
+    owner._handle_event(request(owner, requestor, owner.atoms["UTF8_STRING"]))
+    owner._handle_event(request(owner, requestor, owner.atoms["UTF8_STRING"], selection="PRIMARY", property_atom=201))
+    assert requestor.properties[200][2] == b"Copied"
+    # PRIMARY held no Text before, Requests are refused again
+    assert 201 not in requestor.properties and requestor.events[1].property == X.NONE
+    # The restored Text is what a later Paste restores again
+    assert owner.current_text(clipboard) == "Copied"
+
+
+def test_previous_text_is_fetched_from_its_owner() -> None:
+    owner = selection_owner("Pasted")
+    clipboard, property_atom = owner.atoms["CLIPBOARD"], owner.atoms["CDP_PATCHES_SELECTION"]
+    owner.window.properties[property_atom] = SimpleNamespace(property_type=owner.atoms["UTF8_STRING"], value=b"Copied")  # type: ignore[attr-defined]
+
+    owner._handle_event(SimpleNamespace(type=X.SelectionNotify, selection=clipboard, property=property_atom))
+    assert owner.fetch_done.is_set() and owner.fetched[clipboard] == "Copied"
+    assert not owner.window.properties  # type: ignore[attr-defined]
+
+    # Refused Conversions leave nothing to restore
+    owner._handle_event(SimpleNamespace(type=X.SelectionNotify, selection=clipboard, property=X.NONE))
+    assert owner.fetched[clipboard] is None
@@ -1,8 +1,10 @@
 import time
+from typing import List
 
 import pytest
 from playwright.sync_api import Locator, Page
 
+from cdp_patches.input.browsers import get_sync_evaluator
 from cdp_patches.input.exceptions import WindowClosedException
 from tests.server import Server
 
@@ -202,6 +204,102 @@ def test_keyboard_type_into_a_textarea(sync_page: Page) -> None:
 #         )
 
 
+def test_action_chain(sync_page: Page, server: Server) -> None:
+    sync_page.goto(server.PREFIX + "/input/textarea.html")
+    x, y = get_locator_pos(sync_page.locator("textarea"))
+
+    steps: List[int] = []
+    completed = sync_page.sync_input.chain().click("left", x, y).type("chained text").wait(0.1).perform(on_step=steps.append)  # type: ignore[attr-defined]
+    assert completed
+    assert steps == [0, 1, 2]
+    assert sync_page.evaluate("() => document.querySelector('textarea').value") == "chained text"
+
+
+def test_drag(sync_page: Page) -> None:
+    sync_page.set_content(
+        """<div id="source" style="position:absolute;left:50px;top:50px;width:50px;height:50px"></div>
+        <div id="target" style="position:absolute;left:300px;top:300px;width:50px;height:50px"></div>"""
+    )
+    sync_page.evaluate(
+        """() => {
+        window.dragEvents = [];
+        document.addEventListener('mousedown', e => dragEvents.push(['down', e.target.id]));
+        document.addEventListener('mousemove', e => e.buttons && dragEvents.push(['move', e.buttons]));
+        document.addEventListener('mouseup', e => dragEvents.push(['up', e.target.id]));
+    }"""
+    )
+    x1, y1 = get_locator_pos(sync_page.locator("#source"))
+    x2, y2 = get_locator_pos(sync_page.locator("#target"))
+
+    sync_page.sync_input.drag((x1, y1), (x2, y2), dwell=0.2)  # type: ignore[attr-defined]
+    events = sync_page.evaluate("() => dragEvents")
+    assert events[0] == ["down", "source"]
+    assert events[-1] == ["up", "target"]
+    assert ["move", 1] in events
+
+
+def test_capture(sync_page: Page) -> None:
+    sync_page.evaluate("() => document.body.style.background = 'rgb(255, 0, 0)'")
+    time.sleep(0.5)
+    red = sync_page.sync_input.capture(10, 10, 20, 20).copy()  # type: ignore[attr-defined]
+    assert red.shape[:2] == (20, 20)
+    assert (red == red[0, 0]).all()
+
+    sync_page.evaluate("() => document.body.style.background = 'rgb(0, 0, 255)'")
+    time.sleep(0.5)
+    blue = sync_page.sync_input.capture(10, 10, 20, 20)  # type: ignore[attr-defined]
+    assert (blue == blue[0, 0]).all()
+    assert (blue[0, 0] != red[0, 0]).any()
+
+
+def test_click_with_modifiers(sync_page: Page, server: Server) -> None:
+    sync_page.goto(server.PREFIX + "/input/button.html")
+    x, y = get_locator_pos(sync_page.locator("button"))
+    sync_page.sync_input.click("left", x, y, modifiers=["shift"])  # type: ignore[attr-defined]
+    assert sync_page.evaluate("shiftKey")
+
+
+def test_press_chord(sync_page: Page, server: Server) -> None:
+    sync_page.goto(server.PREFIX + "/input/textarea.html")
+    x, y = get_locator_pos(sync_page.locator("textarea"))
+    sync_page.sync_input.click("left", x, y)  # type: ignore[attr-defined]
+    sync_page.sync_input.type("Replace ME")  # type: ignore[attr-defined]
+    sync_page.sync_input.press_chord("ctrl+a")  # type: ignore[attr-defined]
+    sync_page.sync_input.type("Done")  # type: ignore[attr-defined]
+    assert sync_page.evaluate("() => document.querySelector('textarea').value") == "Done"
+
+
+def test_click_page_coords(sync_page: Page) -> None:
+    sync_page.set_content(
+        """<div style="height: 5000px; width: 3000px; position: relative">
+        <button style="position: absolute; left: 2500px; top: 4000px; width: 100px; height: 40px" onclick="window.clicked = true">Deep</button>
+    </div>"""
+    )
+    sync_page.sync_input.click("left", 2550, 4020, page_coords=True)  # type: ignore[attr-defined]
+    assert sync_page.evaluate("window.clicked")
+
+
+def test_latency_probe(sync_page: Page, server: Server) -> None:
+    sync_page.goto(server.PREFIX + "/input/button.html")
+    x, y = get_locator_pos(sync_page.locator("button"))
+
+    with sync_page.sync_input.latency_probe() as probe:  # type: ignore[attr-defined]
+        sync_page.sync_input.click("left", x, y)  # type: ignore[attr-defined]
+
+    report = probe.report()
+    assert report["mousedown"].samples == report["mouseup"].samples == 1
+    assert 0 <= report["mousedown"].p50 < 1000
+
+
+def test_evaluator_survives_navigation(sync_page: Page, server: Server) -> None:
+    with get_sync_evaluator(sync_page.context) as evaluate:
+        assert evaluate("1 + 1") == 2
+
+        # The Isolated World is recreated in the new Document
+        sync_page.goto(server.PREFIX + "/input/button.html")
+        assert evaluate("document.querySelector('button') !== null")
+
+
 def test_quit_exception(sync_page: Page) -> None:
     sync_page.close()
     time.sleep(5)
@@ -0,0 +1,48 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from cdp_patches.input import SyncInput
+from cdp_patches.input.os_base.recording import RecordingBase
+
+threads = 8
+
+
+def test_shared_handle_gestures_dont_interleave() -> None:
+    base = RecordingBase(realtime=False)
+    sync_input = SyncInput(base=base, seed=0)
+    sync_input.sleep_timeout = 0
+
+    def worker(index: int) -> None:
+        for _ in range(25):
+            sync_input.click("left", index, index, emulate_behaviour=False)
+            sync_input.type(str(index) * 3, fill=True)
+
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(worker, range(threads)))
+
+    kinds = base.key_names(base.events)
+    events = base.events.tolist()
+    assert len(events) == threads * 25 * 3
+    # Every Click is directly followed by the Paste of the same Thread
+    for start in range(0, len(events), 3):
+        end = start + 3
+        (_, down_x, *_), (_, up_x, *_) = events[start], events[start + 1]
+        assert down_x == up_x
+        assert kinds[start:end] == ["left", "left", str(down_x) * 3]
+
+
+def test_independent_handles_scale() -> None:
+    def run(handles: int) -> float:
+        inputs = [SyncInput(base=RecordingBase(), seed=index) for index in range(handles)]
+
+        def worker(sync_input: SyncInput) -> None:
+            sync_input.chain().click("left", 10, 10, emulate_behaviour=False).wait(0.2).perform()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(handles) as executor:
+            list(executor.map(worker, inputs))
+        return time.perf_counter() - start
+
+    single = run(1)
+    # The Front-End adds no Lock across Handles, so N Handles take about as long as one (LinuxBase serializes per X Display, see test_linux_base)
+    assert run(threads) < single * threads / 2
@@ -0,0 +1,31 @@
+from pathlib import Path
+
+import numpy as np
+
+from cdp_patches.input.trajectory_store import TrajectoryTemplates, write_trajectories
+
+
+def test_write_and_load(tmp_path: Path) -> None:
+    path = tmp_path / "trajectories.npz"
+    assert write_trajectories(path, 25, width=800, height=600, seed=1, chunk_size=10, processes=2) == 25
+
+    templates = TrajectoryTemplates.load(path)
+    assert len(templates) == 25
+    assert templates.endpoints is not None
+    # Every Trajectory ends on its requested End Point
+    for trajectory, (_, _, to_x, to_y) in zip(templates, templates.endpoints.tolist()):
+        assert tuple(trajectory[-1]) == (to_x, to_y)
+
+    # Independent of the Process Count
+    other_path = tmp_path / "other.npz"
+    write_trajectories(other_path, 25, width=800, height=600, seed=1, chunk_size=10, processes=1)
+    assert np.array_equal(TrajectoryTemplates.load(other_path).points, templates.points)
+
+
+def test_sample_template() -> None:
+    points = np.array([[0, 0], [5, 3], [10, 0], [0, 0], [20, 5], [40, 0]], dtype=np.float32)
+    templates = TrajectoryTemplates(points, np.array([0, 3, 6]))
+
+    sampled = templates.sample((100, 100), (100, 200), rng=np.random.default_rng(0))
+    assert np.allclose(sampled[0], (100, 100))
+    assert np.allclose(sampled[-1], (100, 200))
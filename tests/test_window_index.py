@@ -0,0 +1,52 @@
+import pytest
+
+from cdp_patches.input import SyncInput
+from cdp_patches.input.exceptions import WindowClosedException
+from cdp_patches.input.os_base.backend import WindowInfo, match_window_bounds
+from cdp_patches.input.os_base.recording import RecordingBase
+from cdp_patches.input.os_base.registry import BackendRegistry
+
+main_window = WindowInfo(None, 10, "Main", 0, 0, 1280, 720)
+popup_window = WindowInfo(None, 20, "Popup", 300, 200, 500, 400)
+
+
+def test_match_window_bounds() -> None:
+    assert match_window_bounds([main_window, popup_window], {"left": 302, "top": 198, "width": 500, "height": 400, "windowState": "normal"}) == popup_window
+    assert match_window_bounds([main_window, popup_window], {"left": 0, "top": 0, "width": 1280, "height": 730}) == main_window
+    with pytest.raises(ValueError):
+        match_window_bounds([], {})
+
+
+def test_bind_window_and_target() -> None:
+    base = RecordingBase(realtime=False)
+    base.windows = [main_window, popup_window]
+    sync_input = SyncInput(base=base)
+
+    assert [info.title for info in sync_input.windows()] == ["Main", "Popup"]
+    assert sync_input.bind_window(20) == popup_window
+    assert base.bound_window_id == 20
+    with pytest.raises(WindowClosedException):
+        sync_input.bind_window(30)
+
+    # Matched once by its Bounds, then found by the CDP Window Id
+    info = base.bind_cdp_window(7, {"left": 0, "top": 0, "width": 1280, "height": 720})
+    assert info.id == 10 and info.cdp_window_id == 7
+    base.bind_window(None)
+    assert base.bind_cdp_window(7, {}).id == 10
+
+
+def test_views_keep_their_window() -> None:
+    base = RecordingBase(realtime=False)
+    base.windows = [main_window, popup_window]
+    registry = BackendRegistry()
+    page_view = registry.acquire("browser", lambda: base)
+    popup_view = registry.acquire("browser", lambda: base)
+
+    popup_view.bind_window(popup_window)
+    popup_view.move(1, 1)
+    assert base.bound_window_id == 20
+    # Unbound Views follow the first Window again
+    page_view.move(2, 2)
+    assert [base.bound_window_id] == [None]
+    popup_view.down("left", 3, 3)
+    assert base.bound_window_id == 20
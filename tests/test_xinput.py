@@ -0,0 +1,17 @@
+import struct
+
+from cdp_patches.input.os_base.xinput import ADD_MASTER, REMOVE_MASTER, encode_add_master, encode_remove_master
+
+
+def test_encode_add_master() -> None:
+    change = encode_add_master("cdp")
+    assert len(change) % 4 == 0
+    change_type, length, name_length, send_core, enable = struct.unpack_from("=HHHBB", change)
+    assert (change_type, length, name_length, send_core, enable) == (ADD_MASTER, len(change) // 4, 3, 1, 1)
+    assert change[8:] == b"cdp\0"
+
+
+def test_encode_remove_master() -> None:
+    change = encode_remove_master(12)
+    assert len(change) == 12
+    assert struct.unpack("=HHHBxHH", change) == (REMOVE_MASTER, 3, 12, 1, 2, 3)